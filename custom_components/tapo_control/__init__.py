@@ -19,14 +19,15 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util import dt
-from homeassistant.components.media_source.error import Unresolvable
 import homeassistant.helpers.entity_registry
 
 from .const import (
+    BOOTSTRAP_CONCURRENCY,
     CONF_TRANSPORT_METHOD,
     CONF_RTSP_TRANSPORT,
     CONTROL_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN_BOOTSTRAP,
     DOMAIN_CONFIG,
     ENABLE_MEDIA_SYNC,
     ENABLE_SOUND_DETECTION,
@@ -45,10 +46,19 @@ from .const import (
     MEDIA_CLEANUP_PERIOD,
     MEDIA_SYNC_COLD_STORAGE_PATH,
     MEDIA_SYNC_HOURS,
+    MEDIA_SYNC_WORKERS,
+    MEDIA_SYNC_WORKERS_DEFAULT,
     MEDIA_VIEW_DAYS_ORDER,
     MEDIA_VIEW_RECORDINGS_ORDER,
     REPORTED_IP_ADDRESS,
     DOORBELL_UDP_DISCOVERED,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_MAX_AGE_DEFAULT,
+    SNAPSHOT_KEEPALIVE,
+    SNAPSHOT_KEEPALIVE_DEFAULT,
+    THUMBNAIL_WORKERS,
+    CAPABILITY_CHECKS,
+    CAPABILITY_PROBE_CONCURRENCY,
     RTSP_TRANS_PROTOCOLS,
     SOUND_DETECTION_DURATION,
     SOUND_DETECTION_PEAK,
@@ -61,6 +71,8 @@ from .const import (
     TIME_SYNC_NDST_DEFAULT,
     TIME_SYNC_PERIOD,
     UPDATE_CHECK_PERIOD,
+    UPDATE_CONTROLLER_TIMEOUT,
+    UPDATE_CONTROLLERS_CONCURRENCY,
     PYTAPO_REQUIRED_VERSION,
     UPDATE_INTERVAL_BATTERY,
     UPDATE_INTERVAL_BATTERY_DEFAULT,
@@ -69,17 +81,36 @@ from .const import (
 )
 from .utils import (
     _is_used_by_tplink,
+    canRunMaintenance,
+    getCamDataSnapshotStorageFile,
+    restoreCamData,
+    trackDeviceRequest,
+    scheduleRestoredPoll,
+    getChannelsInfo,
+    getTimezoneOffset,
+    saveCamDataSnapshot,
+    setupCamDataSnapshot,
     convert_to_timestamp,
     deleteDir,
     getColdDirPathForEntry,
     getDataForController,
+    registerDevice,
+    removeEventsBoostListener,
+    isRunningOnBattery,
+    scheduleNextPoll,
+    resolveCapabilities,
+    loadCachedCapabilities,
+    setupCapabilityCache,
     getEntryStorageFile,
     getHotDirPathForEntry,
     getIP,
     isUsingHTTPS,
     mediaCleanup,
     registerController,
+    acquireController,
+    releaseController,
     getCamData,
+    camDataKeysChanged,
     isRtspStreamWorking,
     setupOnvif,
     setupEvents,
@@ -88,16 +119,23 @@ from .utils import (
     syncTime,
     getLatestFirmwareVersion,
     findMedia,
-    getRecordings,
+    getIndexedRecordings,
+    getMediaSyncQueueStorageFile,
+    getRecordingsIndexStorageFile,
+    pruneMediaSyncQueue,
+    queueMediaSyncDownload,
+    saveMediaSyncQueue,
     scheduleAll,
+    setupMediaSyncQueue,
+    setupRecordingsIndex,
+    startMediaSyncWorkers,
+    updateRecordingsIndex,
 )
-from pytapo import Tapo
+from .views import TapoMediaView
 from pytapo.version import PYTAPO_VERSION
 
 from datetime import timedelta
 
-from .utils import getRecording
-
 
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Tapo: Cameras Control component from YAML."""
@@ -106,6 +144,9 @@ async def async_setup(hass: HomeAssistant, config: dict):
         transport_method = config[DOMAIN].get(CONF_TRANSPORT_METHOD)
     hass.data.setdefault(DOMAIN_CONFIG, {})
     hass.data[DOMAIN_CONFIG][CONF_TRANSPORT_METHOD] = transport_method
+    hass.http.register_view(TapoMediaView(hass))
+    await setupCapabilityCache(hass)
+    hass.data.setdefault(DOMAIN_BOOTSTRAP, asyncio.Semaphore(BOOTSTRAP_CONCURRENCY))
     if transport_method:
         LOGGER.warning(
             "Using transport method override from configuration.yaml: %s",
@@ -478,6 +519,21 @@ async def async_migrate_entry(hass, config_entry: ConfigEntry):
                 version=25,
             )
 
+    if config_entry.version == 25:
+        new = {**config_entry.data}
+        new.setdefault(MEDIA_SYNC_WORKERS, MEDIA_SYNC_WORKERS_DEFAULT)
+        hass.config_entries.async_update_entry(config_entry, data=new, version=26)
+
+    if config_entry.version == 26:
+        new = {**config_entry.data}
+        new.setdefault(SNAPSHOT_MAX_AGE, SNAPSHOT_MAX_AGE_DEFAULT)
+        hass.config_entries.async_update_entry(config_entry, data=new, version=27)
+
+    if config_entry.version == 27:
+        new = {**config_entry.data}
+        new.setdefault(SNAPSHOT_KEEPALIVE, SNAPSHOT_KEEPALIVE_DEFAULT)
+        hass.config_entries.async_update_entry(config_entry, data=new, version=28)
+
     LOGGER.info("Migration to version %s successful", config_entry.version)
 
     return True
@@ -506,6 +562,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if hass.data[DOMAIN][entry.entry_id]["events"]:
         LOGGER.debug("Stopping events...")
+        removeEventsBoostListener(hass.data[DOMAIN][entry.entry_id])
         try:
             async with asyncio.timeout(3):
                 await hass.data[DOMAIN][entry.entry_id]["events"].async_stop()
@@ -515,6 +572,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         LOGGER.debug("Events stopped.")
 
+    hass.data[DOMAIN][entry.entry_id]["devicesById"].clear()
+    hass.data[DOMAIN][entry.entry_id]["devicesByController"].clear()
+
     # Close controllers to avoid unclosed aiohttp sessions
     await _close_controllers(hass, entry.entry_id)
 
@@ -529,6 +589,16 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
     entry_storage = Store(hass, version=1, key=getEntryStorageFile(entry))
     await entry_storage.async_remove()
+    media_sync_queue_storage = Store(
+        hass, version=1, key=getMediaSyncQueueStorageFile(entry)
+    )
+    await media_sync_queue_storage.async_remove()
+    recordings_index_storage = Store(
+        hass, version=1, key=getRecordingsIndexStorageFile(entry)
+    )
+    await recordings_index_storage.async_remove()
+    snapshot_storage = Store(hass, version=1, key=getCamDataSnapshotStorageFile(entry))
+    await snapshot_storage.async_remove()
 
     # Delete all media stored in cold storage for entity
     if coldDirPath:
@@ -553,7 +623,7 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         )
 
 
-async def _close_controllers(hass: HomeAssistant, entry_id: str):
+async def _close_controllers(hass: HomeAssistant, entry_id: str, closeNow=False):
     data = hass.data.get(DOMAIN, {}).get(entry_id)
     if not data:
         return
@@ -566,11 +636,9 @@ async def _close_controllers(hass: HomeAssistant, entry_id: str):
         if ctrl:
             controllers.append(ctrl)
 
-    for ctrl in controllers:
-        try:
-            await hass.async_add_executor_job(ctrl.close)
-        except Exception as err:
-            LOGGER.debug("Error closing controller during shutdown: %s", err)
+    # Children go first, they may share the transport of the main controller
+    for ctrl in reversed(controllers):
+        await releaseController(hass, ctrl, closeNow)
 
     # Remove the entry data
     hass.data[DOMAIN].pop(entry_id, None)
@@ -609,8 +677,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         motionSensor = False
         enableTimeSync = False
     cloud_password = entry.data.get(CLOUD_PASSWORD)
-    updateIntervalMain = entry.data.get(UPDATE_INTERVAL_MAIN)
-    updateIntervalBattery = entry.data.get(UPDATE_INTERVAL_BATTERY)
     timeSyncDST = entry.data.get(TIME_SYNC_DST)
     timeSyncNDST = entry.data.get(TIME_SYNC_NDST)
 
@@ -627,45 +693,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     else:
         LOGGER.debug("HA is not using HTTPS.")
 
+    tapoController = None
     try:
         LOGGER.debug(isKlapDevice)
         if cloud_password != "":
             LOGGER.debug("Setting up controller using cloud password.")
-            tapoController = await hass.async_add_executor_job(
-                registerController,
+            tapoController = await acquireController(
+                hass,
                 host,
                 controlPort,
                 "admin",
                 cloud_password,
                 cloud_password,
-                "",
-                None,
-                isKlapDevice,
-                hass,
+                isKlap=isKlapDevice,
             )
         else:
             LOGGER.debug("Setting up controller using username and password.")
-            tapoController = await hass.async_add_executor_job(
-                registerController,
+            tapoController = await acquireController(
+                hass,
                 host,
                 controlPort,
                 username,
                 password,
-                "",
-                "",
-                None,
-                isKlapDevice,
-                hass,
+                isKlap=isKlapDevice,
             )
         LOGGER.debug("Controller has been set up.")
 
-        def getAllEntities(entry):
-            # Gather all entities, including of children devices
-            allEntities = entry["entities"].copy()
-            for childDevice in entry["childDevices"]:
-                allEntities.extend(childDevice["entities"])
-            return allEntities
-
         def handleTimeSyncError(error):
             if (
                 error.__class__.__module__ == "zeep.exceptions"
@@ -703,7 +756,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             ts = datetime.datetime.utcnow().timestamp()
 
             # motion detection retries
-            if motionSensor or enableTimeSync:
+            if hass.data[DOMAIN][entry.entry_id]["bootstrapping"]:
+                LOGGER.debug("Motion sensor and time sync are still being set up.")
+            elif motionSensor or enableTimeSync:
                 LOGGER.debug("Motion sensor or time sync is enabled.")
                 if (
                     not hass.data[DOMAIN][entry.entry_id]["isChild"]
@@ -769,37 +824,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 if len(username) == 0 or len(password) == 0:
                     debugMsg += " This is because RTSP username or password is empty."
                 LOGGER.debug(debugMsg)
-            if (
-                ts - hass.data[DOMAIN][entry.entry_id]["lastFirmwareCheck"]
-                > UPDATE_CHECK_PERIOD
-            ):
-                LOGGER.debug("Getting latest firmware...")
-                hass.data[DOMAIN][entry.entry_id]["latestFirmwareVersion"] = (
-                    await getLatestFirmwareVersion(
-                        hass,
-                        entry,
-                        hass.data[DOMAIN][entry.entry_id],
-                        tapoController,
-                    )
-                )
-                LOGGER.debug(hass.data[DOMAIN][entry.entry_id]["latestFirmwareVersion"])
-                for childDevice in hass.data[DOMAIN][entry.entry_id]["childDevices"]:
-                    childDevice["latestFirmwareVersion"] = (
-                        await getLatestFirmwareVersion(
-                            hass,
-                            entry,
-                            hass.data[DOMAIN][entry.entry_id],
-                            childDevice["controller"],
-                        )
-                    )
-
             # cameras state
             LOGGER.debug("async_update_data - before someEntityEnabled check")
             someEntityEnabled = False
-            allEntities = getAllEntities(hass.data[DOMAIN][entry.entry_id])
-            for entity in allEntities:
-                LOGGER.debug(entity["entity"])
-                if entity["entity"]._enabled:
+            devicesByController = hass.data[DOMAIN][entry.entry_id][
+                "devicesByController"
+            ]
+            for device in devicesByController.values():
+                if any(entity["entity"]._enabled for entity in device["entities"]):
                     LOGGER.debug("async_update_data - enabling someEntityEnabled check")
                     someEntityEnabled = True
                     break
@@ -810,92 +842,103 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             ):
                 # Update data for all controllers
                 updateDataForAllControllers = {}
-                for controller in hass.data[DOMAIN][entry.entry_id]["allControllers"]:
+                updateSemaphore = asyncio.Semaphore(UPDATE_CONTROLLERS_CONCURRENCY)
+
+                async def updateController(controller):
                     controllerData = getDataForController(hass, entry, controller)
                     LOGGER.debug(
                         f"{controllerData['name']} running on battery: {controllerData['isRunningOnBattery']}"
                     )
-                    if (
-                        controllerData["isRunningOnBattery"] is False
-                        and ts - controllerData["lastUpdate"] > updateIntervalMain
-                    ) or (
-                        controllerData["isRunningOnBattery"] is True
-                        and ts - controllerData["lastUpdate"] > updateIntervalBattery
-                    ):
-                        timeForAnUpdate = True
+                    if ts >= controllerData["nextUpdate"]:
                         LOGGER.debug(f"Updating {controllerData['name']}...")
                     else:
-                        timeForAnUpdate = False
                         LOGGER.debug(f"Skipping update for {controllerData['name']}...")
-                    if timeForAnUpdate:
-                        try:
-                            updateDataForAllControllers[controller] = await getCamData(
-                                hass, controller, controllerData["chInfo"]
-                            )
-                            controllerData["isRunningOnBattery"] = (
-                                True
-                                if (
-                                    "basic_info"
-                                    in updateDataForAllControllers[controller]
-                                    and (
-                                        (
-                                            "power"
-                                            in updateDataForAllControllers[controller][
-                                                "basic_info"
-                                            ]
-                                            and (
-                                                (
-                                                    updateDataForAllControllers[
-                                                        controller
-                                                    ]["basic_info"]["power"]
-                                                    == "BATTERY"
-                                                )
-                                                or (
-                                                    updateDataForAllControllers[
-                                                        controller
-                                                    ]["basic_info"]["power"]
-                                                    == "SOLAR"
-                                                )
-                                            )
-                                        )
-                                        or (
-                                            "power_mode"
-                                            in updateDataForAllControllers[controller][
-                                                "basic_info"
-                                            ]
-                                            and (
-                                                (
-                                                    updateDataForAllControllers[
-                                                        controller
-                                                    ]["basic_info"]["power_mode"]
-                                                    == "BATTERY"
-                                                )
-                                                or (
-                                                    updateDataForAllControllers[
-                                                        controller
-                                                    ]["basic_info"]["power_mode"]
-                                                    == "SOLAR"
-                                                )
-                                            )
-                                        )
-                                    )
+                        return
+                    try:
+                        async with updateSemaphore:
+                            async with asyncio.timeout(UPDATE_CONTROLLER_TIMEOUT):
+                                controllerCamData = await trackDeviceRequest(
+                                    controllerData,
+                                    getCamData(
+                                        hass,
+                                        controller,
+                                        controllerData["chInfo"],
+                                        controllerData["camData"],
+                                    ),
+                                )
+                        updateDataForAllControllers[controller] = controllerCamData
+                        controllerData["camData"] = controllerCamData
+                        controllerData["isRunningOnBattery"] = isRunningOnBattery(
+                            controllerCamData
+                        )
+                        controllerData["lastUpdate"] = (
+                            datetime.datetime.utcnow().timestamp()
+                        )
+                        controllerData["reauth_retries"] = 0
+                        controllerData["failedUpdates"] = 0
+                        controllerData["restoring"] = False
+                        # Checked right after the status poll, battery devices
+                        # are still awake from it.
+                        firmwareCheckDue = (
+                            controllerData["lastUpdate"]
+                            - controllerData["lastFirmwareCheck"]
+                            > UPDATE_CHECK_PERIOD
+                        )
+                        if firmwareCheckDue and canRunMaintenance(
+                            controllerData, controllerData["lastUpdate"]
+                        ):
+                            LOGGER.debug("Getting latest firmware...")
+                            controllerData["latestFirmwareVersion"] = (
+                                await trackDeviceRequest(
+                                    controllerData,
+                                    getLatestFirmwareVersion(
+                                        hass, entry, controllerData, controller
+                                    ),
                                 )
-                                else False
-                            )
-                            controllerData["lastUpdate"] = (
-                                datetime.datetime.utcnow().timestamp()
                             )
-                            controllerData["reauth_retries"] = 0
-                        except Exception as e:
-                            updateDataForAllControllers[controller] = False
-                            if str(e) == "Invalid authentication data":
-                                if controllerData["reauth_retries"] < 3:
-                                    controllerData["reauth_retries"] += 1
-                                    raise e
-                                else:
-                                    controllerData["refreshEnabled"] = False
-                                    raise ConfigEntryAuthFailed(e)
-                            LOGGER.error(e)
+                            LOGGER.debug(controllerData["latestFirmwareVersion"])
+                    except TimeoutError:
+                        updateDataForAllControllers[controller] = False
+                        controllerData["failedUpdates"] += 1
+                        LOGGER.warning(
+                            f"Timed out after {UPDATE_CONTROLLER_TIMEOUT} seconds while updating {controllerData['name']}."
+                        )
+                    except Exception as e:
+                        updateDataForAllControllers[controller] = False
+                        controllerData["failedUpdates"] += 1
+                        if str(e) == "Invalid authentication data":
+                            if controllerData["reauth_retries"] < 3:
+                                controllerData["reauth_retries"] += 1
+                                raise e
+                            else:
+                                controllerData["refreshEnabled"] = False
+                                raise ConfigEntryAuthFailed(e)
+                        LOGGER.error(e)
+                    finally:
+                        scheduleNextPoll(
+                            controllerData, datetime.datetime.utcnow().timestamp()
+                        )
+
+                # Controllers are fetched concurrently so that a slow or sleeping
+                # child does not hold back the rest of the hub. Errors are collected
+                # and only raised once every controller had its chance to update.
+                updateResults = await asyncio.gather(
+                    *[
+                        updateController(controller)
+                        for controller in list(
+                            hass.data[DOMAIN][entry.entry_id]["allControllers"]
+                        )
+                    ],
+                    return_exceptions=True,
+                )
+                if any(updateDataForAllControllers.values()):
+                    saveCamDataSnapshot(hass, entry)
+                for result in updateResults:
+                    if isinstance(result, ConfigEntryAuthFailed):
+                        raise result
+                for result in updateResults:
+                    if isinstance(result, Exception):
+                        raise result
 
                 if tapoController in updateDataForAllControllers:
                     hass.data[DOMAIN][entry.entry_id]["camData"] = (
@@ -904,26 +947,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
                     LOGGER.debug("Updating entities...")
 
-                    # Gather all entities, including of children devices
-                    allEntities = getAllEntities(hass.data[DOMAIN][entry.entry_id])
-
-                    for entity in allEntities:
-                        if (
-                            entity["entity"]._enabled
-                            and entity["entry"]["controller"]
-                            in updateDataForAllControllers
-                        ):
-                            LOGGER.debug("Updating entity...")
-                            LOGGER.debug(entity["entity"])
-                            entity["camData"] = updateDataForAllControllers[
-                                entity["entry"]["controller"]
-                            ]
-                            entity["entity"].updateTapo(
-                                updateDataForAllControllers[
-                                    entity["entry"]["controller"]
-                                ]
-                            )
-                            entity["entity"].async_schedule_update_ha_state(True)
+                    for controller in updateDataForAllControllers:
+                        device = devicesByController.get(controller)
+                        if device is None:
+                            continue
+                        entityCamData = updateDataForAllControllers[controller]
+                        for entity in device["entities"]:
+                            if not entity["entity"]._enabled:
+                                continue
+                            # Only entities whose inputs changed since their
+                            # last render get a new state written.
+                            if camDataKeysChanged(
+                                entity.get("camData"),
+                                entityCamData,
+                                entity["entity"]._camDataKeys,
+                            ):
+                                LOGGER.debug("Updating entity...")
+                                LOGGER.debug(entity["entity"])
+                                entity["entity"].updateTapo(entityCamData)
+                                entity["entity"].async_write_ha_state()
+                            entity["camData"] = entityCamData
                             # start noise detection
                             if (
                                 not hass.data[DOMAIN][entry.entry_id][
@@ -942,11 +985,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                     )
                     hass.data[DOMAIN][entry.entry_id][
                         "updateEntity"
-                    ].async_schedule_update_ha_state(True)
+                    ].async_write_ha_state()
 
-            if (
-                ts - hass.data[DOMAIN][entry.entry_id]["lastMediaCleanup"]
-                > MEDIA_CLEANUP_PERIOD
+            if ts - hass.data[DOMAIN][entry.entry_id][
+                "lastMediaCleanup"
+            ] > MEDIA_CLEANUP_PERIOD and canRunMaintenance(
+                hass.data[DOMAIN][entry.entry_id], ts
             ):
                 LOGGER.debug(
                     "Initiating media cleanup for "
@@ -956,12 +1000,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 await mediaCleanup(hass, entry, hass.data[DOMAIN][entry.entry_id])
             if hass.data[DOMAIN][entry.entry_id]["isParent"]:
                 for child in hass.data[DOMAIN][entry.entry_id]["childDevices"]:
-                    if ts - child["lastMediaCleanup"] > MEDIA_CLEANUP_PERIOD:
+                    if ts - child[
+                        "lastMediaCleanup"
+                    ] > MEDIA_CLEANUP_PERIOD and canRunMaintenance(child, ts):
                         LOGGER.debug(
                             "Initiating media cleanup for " + child["name"] + "..."
                         )
                         await mediaCleanup(hass, entry, child)
 
+            # Media sync of battery devices waits for their next status poll.
+            mediaSyncQueue = hass.data[DOMAIN][entry.entry_id]["mediaSyncQueue"]
+            for device in hass.data[DOMAIN][entry.entry_id]["devicesById"].values():
+                if not device["isRunningOnBattery"] or not canRunMaintenance(
+                    device, ts
+                ):
+                    continue
+                if device["mediaSyncDeferred"]:
+                    entry.async_create_background_task(
+                        hass, mediaSync(None, entry, device), "mediaSync"
+                    )
+                elif mediaSyncQueue["jobs"]:
+                    mediaSyncQueue["wakeUp"].set()
+
             if hass.is_running:
                 await scheduleAll(
                     hass, hass.data[DOMAIN][entry.entry_id], entry, mediaSync
@@ -977,35 +1037,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             LOGGER,
             name="Tapo resource status",
             update_method=async_update_data,
+            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         )
 
-        LOGGER.debug("Retrieving initial device data.")
-
-        try:
-            chInfo = await hass.async_add_executor_job(tapoController.getAllChnInfo)
-            chInfo = chInfo["system"]["chn_info"]
-        except Exception as err:
-            LOGGER.debug(f"Failed to retrieve channels info: {err}")
-            chInfo = None
-
-        camData = await getCamData(hass, tapoController, chInfo)
-        LOGGER.debug("Retrieved initial device data.")
-        LOGGER.debug("Retrieving camera time.")
-        cameraTime = await hass.async_add_executor_job(tapoController.getTime)
-        if not tapoController.isKLAP:
-            cameraTS = cameraTime["system"]["clock_status"]["seconds_from_1970"]
+        # Entities are set up from the last known data when there is one,
+        # live data is fetched in the background once setup returns.
+        snapshotStorage, snapshot = await setupCamDataSnapshot(hass, entry)
+        restored = restoreCamData(tapoController, snapshot["devices"].get(""))
+        if restored:
+            LOGGER.debug("Restored initial device data from snapshot.")
+            chInfo, camData = restored
+            timezoneOffset = snapshot["timezoneOffset"]
         else:
-            cameraTS = cameraTime["timestamp"]
-        LOGGER.debug("Retrieved camera time.")
-        currentTS = dt.as_timestamp(dt.now())
-        timezoneOffset = cameraTS - currentTS
-
-        LOGGER.debug(f"Timezone offset is {timezoneOffset}.")
+            LOGGER.debug("Retrieving initial device data.")
+            chInfo = await getChannelsInfo(hass, tapoController)
+            camData = await getCamData(hass, tapoController, chInfo)
+            LOGGER.debug("Retrieved initial device data.")
+            timezoneOffset = await getTimezoneOffset(hass, tapoController)
 
         LOGGER.debug("Setting up entry data.")
         hass.data[DOMAIN][entry.entry_id] = {
             "setup_retries": 0,
             "reauth_retries": 0,
+            "nextUpdate": 0,
+            "pollInterval": None,
+            "pollBoostUntil": 0,
+            "failedUpdates": 0,
+            "requestLog": [],
             "runningMediaSync": False,
             TIME_SYNC_DST: timeSyncDST,
             TIME_SYNC_NDST: timeSyncNDST,
@@ -1023,17 +1081,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             "lastFirmwareCheck": 0,
             "latestFirmwareVersion": False,
             "mediaSyncColdDir": False,
-            "mediaSyncHotDir": False,
+            "mediaIndex": False,
+            "thumbnailSemaphore": asyncio.Semaphore(THUMBNAIL_WORKERS),
+            "capabilitySemaphore": asyncio.Semaphore(CAPABILITY_PROBE_CONCURRENCY),
+            "capabilities": {},
             "motionSensorCreated": False,
             "eventsDevice": False,
             "onvifManagement": False,
             "eventsSetup": False,
             "events": False,
             "eventsListener": False,
+            "eventsBoostUnsub": False,
             "entities": [],
             "noiseSensorStarted": False,
             "name": camData["basic_info"]["device_alias"],
             "childDevices": [],
+            "devicesById": {},
+            "devicesByController": {},
             "isRunningOnBattery": (
                 True
                 if (
@@ -1053,16 +1117,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             "isDownloadingStream": False,
             "downloadedStreams": {},  # keeps track of all videos downloaded
             "downloadProgress": False,
+            "thumbnailProgress": False,
+            "mediaListings": {},
+            "writeBatch": None,
             "initialMediaScanDone": False,
             ENABLE_MEDIA_SYNC: None,
             "mediaSyncScheduled": False,
             "mediaSyncRanOnce": False,
+            "mediaSyncDeferred": False,
             "mediaSyncAvailable": True,
             "initialMediaScanRunning": False,
             "mediaScanResult": {},  # keeps track of all videos currently on camera
             "timezoneOffset": timezoneOffset,
+            "timeCorrection": 0,
             "refreshEnabled": True,
+            "restoring": restored is not None,
+            "bootstrapping": True,
+            "snapshotStorage": snapshotStorage,
+            "snapshotRaw": {},
         }
+        if restored:
+            scheduleRestoredPoll(
+                hass.data[DOMAIN][entry.entry_id], snapshot["devices"][""]
+            )
+        registerDevice(hass.data[DOMAIN][entry.entry_id])
+        await setupMediaSyncQueue(hass, entry)
+        await setupRecordingsIndex(hass, entry)
+        await deleteDir(hass, getHotDirPathForEntry(hass, entry.entry_id))
         LOGGER.debug("Entry data has been set up.")
 
         if tapoController.isKLAP is False:
@@ -1076,84 +1157,112 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                     camData["childDevices"]
                     and "child_device_list" in camData["childDevices"]
                 ):
-                    for childDevice in camData["childDevices"]["child_device_list"]:
+                    # Children are set up concurrently, one slow child does not
+                    # hold back the others.
+                    async def setupChildDevice(childInfo):
                         LOGGER.debug("Setting up child controller.")
-                        tapoChildController = await hass.async_add_executor_job(
-                            registerController,
+                        tapoChildController = await acquireController(
+                            hass,
                             host,
                             controlPort,
                             "admin",
                             cloud_password,
                             cloud_password,
-                            "",
-                            childDevice["device_id"],
-                            None,
-                            hass,
+                            deviceId=childInfo["device_id"],
                         )
                         LOGGER.debug("Child controller set up.")
                         hass.data[DOMAIN][entry.entry_id]["allControllers"].append(
                             tapoChildController
                         )
-                        LOGGER.debug("Getting initial child device data.")
-
-                        try:
-                            chInfo = await hass.async_add_executor_job(
-                                tapoChildController.getAllChnInfo
-                            )
-                            chInfo = chInfo["system"]["chn_info"]
-                        except Exception as err:
-                            LOGGER.debug(f"Failed to retrieve channels info: {err}")
-                            chInfo = None
-
-                        childCamData = await getCamData(
-                            hass, tapoChildController, chInfo
+                        childSnapshot = snapshot["devices"].get(childInfo["device_id"])
+                        childRestored = restoreCamData(
+                            tapoChildController, childSnapshot
                         )
-                        LOGGER.debug("Retrieved initial child device data.")
+                        if childRestored:
+                            childChInfo, childCamData = childRestored
+                        else:
+                            LOGGER.debug("Getting initial child device data.")
+                            childChInfo = await getChannelsInfo(
+                                hass, tapoChildController
+                            )
+                            childCamData = await getCamData(
+                                hass, tapoChildController, childChInfo
+                            )
+                            LOGGER.debug("Retrieved initial child device data.")
+                        childDevice = {
+                            "controller": tapoChildController,
+                            "coordinator": tapoCoordinator,
+                            "entry": entry,
+                            "chInfo": childChInfo,
+                            "usingCloudPassword": cloud_password != "",
+                            "timezoneOffset": hass.data[DOMAIN][entry.entry_id][
+                                "timezoneOffset"
+                            ],
+                            "camData": childCamData,
+                            "lastTimeSync": 0,
+                            "lastMediaCleanup": 0,
+                            "lastUpdate": 0,
+                            "nextUpdate": 0,
+                            "pollInterval": None,
+                            "pollBoostUntil": 0,
+                            "failedUpdates": 0,
+                            "requestLog": [],
+                            "reauth_retries": 0,
+                            "lastFirmwareCheck": 0,
+                            "latestFirmwareVersion": False,
+                            "motionSensorCreated": False,
+                            "isDownloadingStream": False,
+                            "downloadedStreams": {},  # keeps track of all videos downloaded
+                            "downloadProgress": False,
+                            "thumbnailProgress": False,
+                            "mediaListings": {},
+                            "capabilities": {},
+                            "initialMediaScanDone": False,
+                            ENABLE_MEDIA_SYNC: None,
+                            "mediaSyncScheduled": False,
+                            "mediaSyncRanOnce": False,
+                            "mediaSyncDeferred": False,
+                            "mediaSyncAvailable": True,
+                            "initialMediaScanRunning": False,
+                            "runningMediaSync": False,
+                            "mediaScanResult": {},  # keeps track of all videos currently on camera
+                            "entities": [],
+                            "name": childCamData["basic_info"]["device_alias"],
+                            "childDevices": [],
+                            "isChild": True,
+                            "isRunningOnBattery": (
+                                True
+                                if (
+                                    "basic_info" in childCamData
+                                    and "power" in childCamData["basic_info"]
+                                    and childCamData["basic_info"]["power"] == "BATTERY"
+                                )
+                                else False
+                            ),
+                            "isParent": False,
+                            "restoring": childRestored is not None,
+                        }
+                        if childRestored:
+                            scheduleRestoredPoll(childDevice, childSnapshot)
+                        return childDevice
+
+                    childDevices = await asyncio.gather(
+                        *[
+                            setupChildDevice(childInfo)
+                            for childInfo in camData["childDevices"][
+                                "child_device_list"
+                            ]
+                        ],
+                        return_exceptions=True,
+                    )
+                    for childDevice in childDevices:
+                        if isinstance(childDevice, Exception):
+                            raise childDevice
+                    for childDevice in childDevices:
                         hass.data[DOMAIN][entry.entry_id]["childDevices"].append(
-                            {
-                                "controller": tapoChildController,
-                                "coordinator": tapoCoordinator,
-                                "entry": entry,
-                                "chInfo": chInfo,
-                                "usingCloudPassword": cloud_password != "",
-                                "timezoneOffset": hass.data[DOMAIN][entry.entry_id][
-                                    "timezoneOffset"
-                                ],
-                                "camData": childCamData,
-                                "lastTimeSync": 0,
-                                "lastMediaCleanup": 0,
-                                "lastUpdate": 0,
-                                "lastFirmwareCheck": 0,
-                                "latestFirmwareVersion": False,
-                                "motionSensorCreated": False,
-                                "isDownloadingStream": False,
-                                "downloadedStreams": {},  # keeps track of all videos downloaded
-                                "downloadProgress": False,
-                                "initialMediaScanDone": False,
-                                ENABLE_MEDIA_SYNC: None,
-                                "mediaSyncScheduled": False,
-                                "mediaSyncRanOnce": False,
-                                "mediaSyncAvailable": True,
-                                "initialMediaScanRunning": False,
-                                "runningMediaSync": False,
-                                "mediaScanResult": {},  # keeps track of all videos currently on camera
-                                "entities": [],
-                                "name": childCamData["basic_info"]["device_alias"],
-                                "childDevices": [],
-                                "isChild": True,
-                                "isRunningOnBattery": (
-                                    True
-                                    if (
-                                        "basic_info" in childCamData
-                                        and "power" in childCamData["basic_info"]
-                                        and childCamData["basic_info"]["power"]
-                                        == "BATTERY"
-                                    )
-                                    else False
-                                ),
-                                "isParent": False,
-                            }
+                            childDevice
                         )
+                        registerDevice(hass.data[DOMAIN][entry.entry_id], childDevice)
                 else:
                     LOGGER.debug("No child devices found.")
             LOGGER.debug("Setting up camera entities.")
@@ -1161,6 +1270,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 hass.config_entries.async_forward_entry_setups(entry, ["camera"])
             )
 
+        LOGGER.debug("Resolving capabilities.")
+        for device in hass.data[DOMAIN][entry.entry_id]["devicesById"].values():
+            loadCachedCapabilities(hass, device)
+        await asyncio.gather(
+            *[
+                resolveCapabilities(hass, device, CAPABILITY_CHECKS)
+                for device in list(
+                    hass.data[DOMAIN][entry.entry_id]["devicesById"].values()
+                )
+            ]
+        )
+
         LOGGER.debug("Setting up entities.")
         await hass.async_create_task(
             hass.config_entries.async_forward_entry_setups(
@@ -1180,35 +1301,76 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
         LOGGER.debug("Entities set up.")
 
-        # Needs to execute AFTER binary_sensor creation!
-        if (
-            tapoController.isKLAP is False
-            and camData["childDevices"] is None
-            and (motionSensor or enableTimeSync)
-        ):
-            onvifDevice = await initOnvifEvents(hass, host, username, password)
-            hass.data[DOMAIN][entry.entry_id]["eventsDevice"] = onvifDevice["device"]
-            hass.data[DOMAIN][entry.entry_id]["onvifManagement"] = onvifDevice[
-                "device_mgmt"
-            ]
-            if motionSensor:
-                LOGGER.debug("Setting up motion sensor for the first time.")
-                await setupOnvif(hass, entry)
-            else:
-                debugMsg = "Motion sensor is disabled."
-                if len(username) == 0 or len(password) == 0:
-                    debugMsg += " This is because RTSP username or password is empty."
-                LOGGER.debug(debugMsg)
-            if enableTimeSync:
+        # Handshakes the entities do not depend on finish in the background,
+        # bounded across entries so a restart does not hit every device at once.
+        async def bootstrapEntry():
+            entryData = hass.data[DOMAIN][entry.entry_id]
+            async with hass.data[DOMAIN_BOOTSTRAP]:
                 try:
-                    await syncTime(hass, entry.entry_id)
-                except Exception as e:
-                    handleTimeSyncError(e)
+                    if entryData["restoring"]:
+                        LOGGER.debug("Refreshing data restored from snapshot.")
+                        # Sleeping battery devices keep the restored channels
+                        # until their first poll is due.
+                        for device in list(entryData["devicesById"].values()):
+                            if device["isRunningOnBattery"]:
+                                continue
+                            device["chInfo"] = await getChannelsInfo(
+                                hass, device["controller"]
+                            )
+                        if not entryData["isRunningOnBattery"]:
+                            entryData["timezoneOffset"] = await getTimezoneOffset(
+                                hass, tapoController
+                            )
+                            for device in entryData["childDevices"]:
+                                device["timezoneOffset"] = entryData["timezoneOffset"]
+                        await tapoCoordinator.async_request_refresh()
 
-        # Media sync
-        timeCorrection = await hass.async_add_executor_job(
-            tapoController.getTimeCorrection
+                    # Needs to execute AFTER binary_sensor creation!
+                    if (
+                        tapoController.isKLAP is False
+                        and camData["childDevices"] is None
+                        and (motionSensor or enableTimeSync)
+                    ):
+                        onvifDevice = await initOnvifEvents(
+                            hass, host, username, password
+                        )
+                        entryData["eventsDevice"] = onvifDevice["device"]
+                        entryData["onvifManagement"] = onvifDevice["device_mgmt"]
+                        if motionSensor:
+                            LOGGER.debug("Setting up motion sensor for the first time.")
+                            await setupOnvif(hass, entry)
+                        else:
+                            debugMsg = "Motion sensor is disabled."
+                            if len(username) == 0 or len(password) == 0:
+                                debugMsg += (
+                                    " This is because RTSP username or password"
+                                    " is empty."
+                                )
+                            LOGGER.debug(debugMsg)
+                        if enableTimeSync:
+                            try:
+                                await syncTime(hass, entry.entry_id)
+                            except Exception as e:
+                                handleTimeSyncError(e)
+
+                    entryData["timeCorrection"] = await hass.async_add_executor_job(
+                        tapoController.getTimeCorrection
+                    )
+                except Exception as err:
+                    LOGGER.error(f"Failed to finish setting up {entry.title}: {err}")
+                finally:
+                    entryData["bootstrapping"] = False
+            LOGGER.debug("Entry bootstrap finished.")
+
+        entry.async_create_background_task(
+            hass, bootstrapEntry(), f"{DOMAIN}_bootstrap_{entry.entry_id}"
         )
+        if not hass.data[DOMAIN][entry.entry_id]["restoring"]:
+            saveCamDataSnapshot(hass, entry)
+
+        # Media sync
+
+        startMediaSyncWorkers(hass, entry)
 
         # todo move to utils
         async def mediaSync(now, entry, device):
@@ -1217,11 +1379,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             enableMediaSync = device[ENABLE_MEDIA_SYNC]
             mediaSyncHours = entry.data.get(MEDIA_SYNC_HOURS)
             LOGGER.debug("mediaSync - 2")
+            if enableMediaSync and not canRunMaintenance(
+                device, datetime.datetime.utcnow().timestamp()
+            ):
+                LOGGER.debug(f"Media sync for {device['name']} deferred.")
+                device["mediaSyncDeferred"] = True
+                return
+            device["mediaSyncDeferred"] = False
 
             if mediaSyncHours == "":
                 mediaSyncTime = False
             else:
-                mediaSyncTime = (int(mediaSyncHours) * 60 * 60) + timeCorrection
+                mediaSyncTime = (int(mediaSyncHours) * 60 * 60) + hass.data[DOMAIN][
+                    entry.entry_id
+                ]["timeCorrection"]
             LOGGER.debug("mediaSync - 3")
             if (
                 enableMediaSync
@@ -1234,96 +1405,56 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 LOGGER.debug("Running media sync for " + device["name"] + "...")
                 device["runningMediaSync"] = True
                 try:
-                    tapoController: Tapo = device["controller"]
-                    LOGGER.debug("getRecordingsList -1")
-                    recordingsList = await hass.async_add_executor_job(
-                        tapoController.getRecordingsList
+                    queue = hass.data[DOMAIN][entry.entry_id]["mediaSyncQueue"]
+                    LOGGER.debug("updateRecordingsIndex -1")
+                    recordingsDates = await trackDeviceRequest(
+                        device, updateRecordingsIndex(hass, device)
                     )
-                    LOGGER.debug("getRecordingsList -2")
+                    LOGGER.debug("updateRecordingsIndex -2")
 
                     ts = datetime.datetime.utcnow().timestamp()
-                    for searchResult in recordingsList:
-                        for key in searchResult:
-                            LOGGER.debug("inside for - 1")
-                            enableMediaSync = device[ENABLE_MEDIA_SYNC]
-                            LOGGER.debug("inside for - 2")
-                            if enableMediaSync and (
-                                (mediaSyncTime is False)
-                                or (
-                                    (
-                                        mediaSyncTime is not False
-                                        and (
-                                            (int(ts) - (int(mediaSyncTime) + 86400))
-                                            < convert_to_timestamp(
-                                                searchResult[key]["date"]
-                                            )
-                                        )
+                    if mediaSyncTime is not False:
+                        pruneMediaSyncQueue(queue, device, int(ts) - int(mediaSyncTime))
+                    queuedRecordings = 0
+                    for date in recordingsDates:
+                        enableMediaSync = device[ENABLE_MEDIA_SYNC]
+                        if enableMediaSync and (
+                            (mediaSyncTime is False)
+                            or (
+                                (
+                                    mediaSyncTime is not False
+                                    and (
+                                        (int(ts) - (int(mediaSyncTime) + 86400))
+                                        < convert_to_timestamp(date)
                                     )
                                 )
-                            ):
-                                LOGGER.debug("getRecordings -1")
-                                recordingsForDay = await getRecordings(
-                                    hass,
-                                    device,
-                                    tapoController,
-                                    searchResult[key]["date"],
-                                )
-                                LOGGER.debug("getRecordings -2")
-                                totalRecordingsToDownload = 0
-                                for recording in recordingsForDay:
-                                    for recordingKey in recording:
-                                        if recording[recordingKey]["endTime"] > int(
-                                            ts
-                                        ) - (int(mediaSyncTime)):
-                                            totalRecordingsToDownload += 1
-                                recordingCount = 0
-                                for recording in recordingsForDay:
-                                    for recordingKey in recording:
-                                        if recording[recordingKey]["endTime"] > (
-                                            int(ts) - (int(mediaSyncTime))
-                                        ):
-                                            recordingCount += 1
-                                            try:
-                                                enableMediaSync = device[
-                                                    ENABLE_MEDIA_SYNC
-                                                ]
-                                                if enableMediaSync:
-                                                    LOGGER.debug("getRecording -1")
-                                                    await getRecording(
-                                                        hass,
-                                                        tapoController,
-                                                        entry.entry_id,
-                                                        device,
-                                                        searchResult[key]["date"],
-                                                        recording[recordingKey][
-                                                            "startTime"
-                                                        ],
-                                                        recording[recordingKey][
-                                                            "endTime"
-                                                        ],
-                                                        recordingCount,
-                                                        totalRecordingsToDownload,
-                                                    )
-                                                    LOGGER.debug("getRecording -2")
-                                                else:
-                                                    LOGGER.debug(
-                                                        f"Media sync disabled (inside getRecording): {enableMediaSync}"
-                                                    )
-                                            except Unresolvable as err:
-                                                if (
-                                                    str(err)
-                                                    == "Recording is currently in progress."
-                                                ):
-                                                    LOGGER.info(err)
-                                                else:
-                                                    LOGGER.warning(err)
-                                            except Exception as err:
-                                                device["runningMediaSync"] = False
-                                                LOGGER.error(err)
-                            else:
-                                LOGGER.debug(
-                                    f"Media sync ignoring {searchResult[key]["date"]}. Media sync: {enableMediaSync}."
-                                )
+                            )
+                        ):
+                            recordingsForDay = await getIndexedRecordings(
+                                hass, device, date
+                            )
+                            for recording in recordingsForDay:
+                                for recordingKey in recording:
+                                    if recording[recordingKey]["endTime"] > (
+                                        int(ts) - (int(mediaSyncTime))
+                                    ) and queueMediaSyncDownload(
+                                        queue,
+                                        device,
+                                        date,
+                                        recording[recordingKey]["startTime"],
+                                        recording[recordingKey]["endTime"],
+                                    ):
+                                        queuedRecordings += 1
+                        else:
+                            LOGGER.debug(
+                                f"Media sync ignoring {date}. Media sync: {enableMediaSync}."
+                            )
+                    LOGGER.debug(
+                        f"Queued {queuedRecordings} recordings for {device["name"]}, {len(queue["jobs"])} in queue."
+                    )
+                    saveMediaSyncQueue(queue)
+                    if queue["jobs"]:
+                        queue["wakeUp"].set()
                 except Exception as err:
                     LOGGER.error(err)
                 LOGGER.debug("runningMediaSync -false")
@@ -1340,10 +1471,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, unsubscribe)
         hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STOP,
-            lambda event: hass.add_job(_close_controllers, hass, entry.entry_id),
+            lambda event: hass.add_job(_close_controllers, hass, entry.entry_id, True),
         )
 
     except Exception as e:
+        # Released controllers stay pooled for a while, a retry can reuse them
+        controllers = hass.data[DOMAIN][entry.entry_id].get("allControllers", [])
+        if tapoController is not None and tapoController not in controllers:
+            controllers = [tapoController, *controllers]
+        for controller in reversed(controllers):
+            await releaseController(hass, controller)
+
         if "Invalid authentication data" in str(e):
             if hass.data[DOMAIN][entry.entry_id]["setup_retries"] < 3:
                 hass.data[DOMAIN][entry.entry_id]["setup_retries"] += 1
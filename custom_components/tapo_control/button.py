@@ -174,6 +174,8 @@ class TapoSyncTimeButton(TapoButtonEntity):
 
 
 class TapoStartManualAlarmButton(TapoButtonEntity):
+    _camDataKeys = ("alarm_config", "privacy_mode")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self.sirenType = None
         TapoButtonEntity.__init__(
@@ -224,6 +226,8 @@ class TapoStartManualAlarmButton(TapoButtonEntity):
 
 
 class TapoStopManualAlarmButton(TapoButtonEntity):
+    _camDataKeys = ("alarm_config", "privacy_mode")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self.sirenType = None
         TapoButtonEntity.__init__(
@@ -279,6 +283,8 @@ class TapoStopManualAlarmButton(TapoButtonEntity):
 
 
 class TapoCalibrateButton(TapoButtonEntity):
+    _camDataKeys = ("privacy_mode",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoButtonEntity.__init__(self, "Calibrate", entry, hass)
 
@@ -293,6 +299,8 @@ class TapoCalibrateButton(TapoButtonEntity):
 
 
 class TapoMoveUpButton(TapoButtonEntity):
+    _camDataKeys = ("privacy_mode",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoButtonEntity.__init__(self, "Move Up", entry, hass, "mdi:arrow-up")
 
@@ -309,6 +317,8 @@ class TapoMoveUpButton(TapoButtonEntity):
 
 
 class TapoMoveDownButton(TapoButtonEntity):
+    _camDataKeys = ("privacy_mode",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoButtonEntity.__init__(self, "Move Down", entry, hass, "mdi:arrow-down")
 
@@ -325,6 +335,8 @@ class TapoMoveDownButton(TapoButtonEntity):
 
 
 class TapoMoveRightButton(TapoButtonEntity):
+    _camDataKeys = ("privacy_mode",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoButtonEntity.__init__(self, "Move Right", entry, hass, "mdi:arrow-right")
 
@@ -341,6 +353,8 @@ class TapoMoveRightButton(TapoButtonEntity):
 
 
 class TapoMoveLeftButton(TapoButtonEntity):
+    _camDataKeys = ("privacy_mode",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoButtonEntity.__init__(self, "Move Left", entry, hass, "mdi:arrow-left")
 
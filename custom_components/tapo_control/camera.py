@@ -1,21 +1,29 @@
 import asyncio
 import os
+import time
 
 from haffmpeg.camera import CameraMjpeg
 from haffmpeg.tools import IMAGE_JPEG, ImageFrame
 from typing import Callable
 from pytapo.media_stream.streamer import Streamer
 
-from homeassistant.const import STATE_UNAVAILABLE, CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from aiohttp import web
+from homeassistant.const import (
+    STATE_UNAVAILABLE,
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONTENT_TYPE_MULTIPART,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.camera import (
     CameraEntityFeature,
     Camera,
+    Image,
 )
+from homeassistant.components.camera.img_util import scale_jpeg_camera_image
 from homeassistant.components.ffmpeg import CONF_EXTRA_ARGUMENTS, DATA_FFMPEG
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import entity_platform
-from homeassistant.helpers.aiohttp_client import async_aiohttp_proxy_stream
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.util import slugify
 from homeassistant.components.stream import (
@@ -37,10 +45,17 @@ from .const import (
     HAS_STREAM_7,
     CONF_CUSTOM_STREAM_6,
     CONF_CUSTOM_STREAM_7,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_KEEPALIVE,
+    MJPEG_FRAME_TIMEOUT,
+    MJPEG_BUFFER_LIMIT,
+    MJPEG_CLIENT_BUFFER_FRAMES,
+    MJPEG_BOUNDARY,
 )
 from .utils import (
-    async_force_entry_refresh,
+    async_refresh_entry_sections,
     build_device_info,
+    getRefreshSections,
     getStreamSource,
 )
 
@@ -83,6 +98,105 @@ def _update_location_attributes(attributes: dict) -> None:
     attributes["latitude"] = latitude
 
 
+def _pop_latest_jpeg(buffer: bytearray) -> bytes | None:
+    # Returns the newest complete JPEG in buffer and drops everything before
+    # its end, older frames in the same chunk are skipped.
+    end = buffer.rfind(b"\xff\xd9")
+    if end == -1:
+        if len(buffer) > MJPEG_BUFFER_LIMIT:
+            buffer.clear()
+        return None
+    start = buffer.rfind(b"\xff\xd8", 0, end)
+    frame = bytes(buffer[start : end + 2]) if start != -1 else None
+    del buffer[: end + 2]
+    return frame
+
+
+class TapoMjpegHub:
+    """Broadcasts frames of a single MJPEG producer to every connected client."""
+
+    def __init__(self, hass: HomeAssistant, name: str, openProducer):
+        self._hass = hass
+        self._name = name
+        self._openProducer = openProducer
+        self._clients: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    async def async_handle(self, request):
+        queue = asyncio.Queue(maxsize=MJPEG_CLIENT_BUFFER_FRAMES)
+        # Every producer broadcasts to its own client set, a producer that is
+        # still shutting down does not close clients of the next one.
+        clients = self._clients
+        clients.add(queue)
+        LOGGER.debug("%s: MJPEG client added (%s)", self._name, len(clients))
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self._async_produce(clients), f"{DOMAIN} mjpeg {self._name}"
+            )
+
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_MULTIPART.format(MJPEG_BOUNDARY)
+        try:
+            await response.prepare(request)
+            while (frame := await queue.get()) is not None:
+                await response.write(
+                    f"--{MJPEG_BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(frame)}\r\n\r\n".encode() + frame + b"\r\n"
+                )
+        except ConnectionResetError:
+            pass
+        finally:
+            clients.discard(queue)
+            LOGGER.debug("%s: MJPEG client removed (%s)", self._name, len(clients))
+            if not clients and clients is self._clients and self._task:
+                self._task.cancel()
+                self._task = None
+                self._clients = set()
+        return response
+
+    async def _async_produce(self, clients: set[asyncio.Queue]):
+        LOGGER.debug("%s: starting MJPEG producer", self._name)
+        buffer = bytearray()
+        close = None
+        try:
+            reader, close = await self._openProducer()
+            while clients:
+                try:
+                    chunk = await asyncio.wait_for(
+                        reader.read(65536), timeout=MJPEG_FRAME_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    LOGGER.debug("%s: MJPEG producer timed out", self._name)
+                    break
+                if not chunk:
+                    break
+                buffer += chunk
+                frame = _pop_latest_jpeg(buffer)
+                if frame is None:
+                    continue
+                # Full client buffers lose their oldest frame instead of
+                # holding back the producer.
+                for queue in clients:
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait(frame)
+        finally:
+            LOGGER.debug("%s: stopping MJPEG producer", self._name)
+            if self._task is asyncio.current_task():
+                self._task = None
+                self._clients = set()
+            for queue in clients:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+            if close is not None:
+                await close()
+
+    async def async_stop(self):
+        if self._task:
+            self._task.cancel()
+
+
 async def async_setup_entry(
     hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: Callable
 ):
@@ -286,18 +400,34 @@ class TapoCamEntity(Camera):
         self._enable_stream = config_entry.data.get(ENABLE_STREAM)
         self._attr_extra_state_attributes = entry["camData"]["basic_info"]
         self._attr_icon = "mdi:cctv"
-        self._attr_should_poll = True
+        self._attr_should_poll = False
+        self._camDataKeys = None
         self._is_cam_entity = True
         self._is_noise_sensor = False
+        self._snapshot_max_age = config_entry.data[SNAPSHOT_MAX_AGE]
+        self._snapshot: bytes | None = None
+        self._snapshot_time = 0
+        self._snapshot_scaled = {}
+        self._snapshot_task: asyncio.Task | None = None
+        self._mjpeg_hub: TapoMjpegHub | None = None
 
         self.updateTapo(entry["camData"])
 
     async def async_added_to_hass(self) -> None:
         self._enabled = True
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        pass
 
     async def async_will_remove_from_hass(self) -> None:
         self._enabled = False
+        if self._mjpeg_hub:
+            await self._mjpeg_hub.async_stop()
         await super().async_will_remove_from_hass()
 
     @property
@@ -343,6 +473,46 @@ class TapoCamEntity(Camera):
     async def async_create_stream(self) -> Stream | None:
         return await super().async_create_stream()
 
+    async def _async_grab_snapshot(self, grabImage):
+        image = await grabImage()
+        if image:
+            self._snapshot = image
+            self._snapshot_time = time.monotonic()
+            self._snapshot_scaled = {}
+        return image
+
+    async def _async_cached_camera_image(self, grabImage, width=None, height=None):
+        # Snapshots are reused for SNAPSHOT_MAX_AGE seconds and callers arriving
+        # while a grab is running wait for it instead of starting their own.
+        if (
+            self._snapshot is None
+            or time.monotonic() - self._snapshot_time > self._snapshot_max_age
+        ):
+            if self._snapshot_task is None or self._snapshot_task.done():
+                self._snapshot_task = self.hass.async_create_task(
+                    self._async_grab_snapshot(grabImage)
+                )
+            image = await asyncio.shield(self._snapshot_task)
+        else:
+            image = self._snapshot
+
+        if not image or width is None or height is None:
+            return image
+        if (width, height) in self._snapshot_scaled and image is self._snapshot:
+            return self._snapshot_scaled[(width, height)]
+        scaled = await self.hass.async_add_executor_job(
+            scale_jpeg_camera_image, Image("image/jpeg", image), width, height
+        )
+        # A newer snapshot may have been grabbed while resizing.
+        if image is self._snapshot:
+            self._snapshot_scaled[(width, height)] = scaled
+        return scaled
+
+    async def _async_handle_mjpeg_hub(self, request, openProducer):
+        if self._mjpeg_hub is None:
+            self._mjpeg_hub = TapoMjpegHub(self.hass, self.entity_id, openProducer)
+        return await self._mjpeg_hub.async_handle(request)
+
     def updateTapo(self, camData):
         LOGGER.debug("updateTapo - camera")
         if not camData:
@@ -430,7 +600,9 @@ class TapoCamEntity(Camera):
             self._controller.setPrivacyMode,
             False,
         )
-        await async_force_entry_refresh(self._hass, self._entry)
+        await async_refresh_entry_sections(
+            self._hass, self._entry, getRefreshSections(("getPrivacyMode",))
+        )
 
     async def async_turn_off(self):
         LOGGER.debug("async_turn_off - camera")
@@ -438,7 +610,9 @@ class TapoCamEntity(Camera):
             self._controller.setPrivacyMode,
             True,
         )
-        await async_force_entry_refresh(self._hass, self._entry)
+        await async_refresh_entry_sections(
+            self._hass, self._entry, getRefreshSections(("getPrivacyMode",))
+        )
 
     async def save_preset(self, name):
         LOGGER.debug("save_preset - camera")
@@ -495,6 +669,11 @@ class TapoRTSPCamEntity(TapoCamEntity):
 
     async def async_camera_image(self, width=None, height=None):
         LOGGER.debug("async_camera_image - camera")
+        return await self._async_cached_camera_image(
+            self._async_grab_camera_image, width, height
+        )
+
+    async def _async_grab_camera_image(self):
         ffmpeg = ImageFrame(self._ffmpeg.binary)
         streaming_url = getStreamSource(
             self._config_entry,
@@ -511,6 +690,11 @@ class TapoRTSPCamEntity(TapoCamEntity):
 
     async def handle_async_mjpeg_stream(self, request):
         LOGGER.debug("handle_async_mjpeg_stream - camera")
+        return await self._async_handle_mjpeg_hub(
+            request, self._async_open_mjpeg_producer
+        )
+
+    async def _async_open_mjpeg_producer(self):
         streaming_url = getStreamSource(
             self._config_entry,
             self._stream_id,
@@ -520,16 +704,7 @@ class TapoRTSPCamEntity(TapoCamEntity):
             streaming_url,
             extra_cmd=self._extra_arguments,
         )
-        try:
-            stream_reader = await stream.get_reader()
-            return await async_aiohttp_proxy_stream(
-                self.hass,
-                request,
-                stream_reader,
-                self._ffmpeg.ffmpeg_stream_content_type,
-            )
-        finally:
-            await stream.close()
+        return await stream.get_reader(), stream.close
 
     async def stream_source(self):
         return getStreamSource(
@@ -565,6 +740,11 @@ class TapoDirectCamEntity(TapoCamEntity):
         self._stream_task: asyncio.Task | None = None
         self._enabled_by_default = enabledByDefault
         self.videoStream = videoStream
+        self._snapshot_keepalive = config_entry.data[SNAPSHOT_KEEPALIVE]
+        self._grabber_task: asyncio.Task | None = None
+        self._grabber_frame: bytes | None = None
+        self._grabber_frame_event = asyncio.Event()
+        self._grabber_last_used = 0
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -575,12 +755,106 @@ class TapoDirectCamEntity(TapoCamEntity):
             await self._streamer.stop()
         if self._stream_task:
             self._stream_task.cancel()
+        if self._grabber_task:
+            self._grabber_task.cancel()
         await super().async_will_remove_from_hass()
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ):
         LOGGER.debug("async_camera_image")
+        return await self._async_cached_camera_image(
+            self._async_grab_camera_image, width, height
+        )
+
+    async def _async_grab_camera_image(self):
+        # Prefer the last keyframe of an already running HA stream, then the
+        # keep-alive grabber and only open a new session as a last resort.
+        if (
+            self._streamer
+            and self._streamer.running
+            and self._HAstream is not None
+            and self._HAstream.available
+        ):
+            image = await self._HAstream.async_get_image()
+            if image:
+                LOGGER.debug("async_camera_image - Returning live stream keyframe")
+                return image
+
+        if self._snapshot_keepalive:
+            image = await self._async_keepalive_frame()
+            if image:
+                LOGGER.debug("async_camera_image - Returning keep-alive frame")
+                return image
+
+        return await self._async_grab_single_frame()
+
+    async def _async_keepalive_frame(self):
+        self._grabber_last_used = time.monotonic()
+        if self._grabber_task is None or self._grabber_task.done():
+            self._grabber_frame = None
+            self._grabber_frame_event.clear()
+            self._grabber_task = self._config_entry.async_create_background_task(
+                self.hass,
+                self._async_run_grabber(),
+                f"{DOMAIN} snapshot grabber {self.entity_id}",
+            )
+
+        if self._grabber_frame is None:
+            frameTask = asyncio.create_task(self._grabber_frame_event.wait())
+            await asyncio.wait(
+                (frameTask, self._grabber_task),
+                timeout=MJPEG_FRAME_TIMEOUT,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            frameTask.cancel()
+        return self._grabber_frame
+
+    async def _async_run_grabber(self):
+        LOGGER.debug("%s: starting snapshot grabber", self.entity_id)
+        streamer = Streamer(
+            self._controller,
+            includeAudio=False,
+            quality=self._directQuality,
+            logFunction=self.logFunction,
+            ff_args={
+                "-f": "image2pipe",
+                "-c:v": "mjpeg",
+                "-vsync": "0",
+                "-map-video": f"0:v:{self.videoStream}",
+            },
+        )
+        info = await streamer.start()
+        proc = info["ffmpegProcess"]
+        buffer = bytearray()
+
+        try:
+            while time.monotonic() - self._grabber_last_used < self._snapshot_keepalive:
+                try:
+                    chunk = await asyncio.wait_for(
+                        proc.stdout.read(65536), timeout=MJPEG_FRAME_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    LOGGER.debug("%s: snapshot grabber timed out", self.entity_id)
+                    break
+                if not chunk:
+                    break
+                buffer += chunk
+                frame = _pop_latest_jpeg(buffer)
+                if frame is not None:
+                    self._grabber_frame = frame
+                    self._grabber_frame_event.set()
+        finally:
+            LOGGER.debug("%s: stopping snapshot grabber", self.entity_id)
+            self._grabber_frame = None
+            self._grabber_frame_event.clear()
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            await streamer.stop()
+            info["streamProcess"].cancel()
+
+    async def _async_grab_single_frame(self):
         streamer = Streamer(
             self._controller,
             includeAudio=False,
@@ -616,6 +890,11 @@ class TapoDirectCamEntity(TapoCamEntity):
 
     async def handle_async_mjpeg_stream(self, request):
         LOGGER.debug("Direct MJPEG: request")
+        return await self._async_handle_mjpeg_hub(
+            request, self._async_open_mjpeg_producer
+        )
+
+    async def _async_open_mjpeg_producer(self):
         streamer = Streamer(
             self._controller,
             includeAudio=False,
@@ -623,7 +902,7 @@ class TapoDirectCamEntity(TapoCamEntity):
             logFunction=self.logFunction,
             ff_args={
                 "-c:v": "mjpeg",
-                "-f": "mpjpeg",
+                "-f": "image2pipe",
                 "-vsync": "0",
                 "-map-video": f"0:v:{self.videoStream}",
             },
@@ -633,14 +912,7 @@ class TapoDirectCamEntity(TapoCamEntity):
 
         LOGGER.debug("Direct MJPEG: ffmpeg PID %s", proc.pid)
 
-        try:
-            return await async_aiohttp_proxy_stream(
-                self.hass,
-                request,
-                proc.stdout,
-                self._ffmpeg.ffmpeg_stream_content_type,
-            )
-        finally:
+        async def close():
             LOGGER.debug("Direct MJPEG: shutting ffmpeg / streamer")
             if proc.returncode is None:
                 proc.kill()
@@ -648,6 +920,8 @@ class TapoDirectCamEntity(TapoCamEntity):
             await streamer.stop()
             info["streamProcess"].cancel()
 
+        return proc.stdout, close
+
     async def _log_stream(self, stream: asyncio.StreamReader, *, prefix=""):
         async for line in stream:
             LOGGER.debug("%s: %s", prefix, line.decode().rstrip())
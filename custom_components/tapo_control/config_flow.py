@@ -1,3 +1,4 @@
+import ipaddress
 import voluptuous as vol
 import os
 import re
@@ -5,7 +6,15 @@ import re
 from homeassistant.core import callback
 
 from homeassistant.components.ffmpeg import CONF_EXTRA_ARGUMENTS
-from homeassistant.config_entries import HANDLERS, ConfigFlow, OptionsFlow
+from homeassistant.components.network import (
+    async_get_adapters as network_async_get_adapters,
+)
+from homeassistant.config_entries import (
+    HANDLERS,
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigFlow,
+    OptionsFlow,
+)
 from homeassistant.const import (
     CONF_IP_ADDRESS,
     CONF_USERNAME,
@@ -23,12 +32,16 @@ from .utils import (
     areCameraPortsOpened,
     isOpen,
     isKLAP,
+    scanNetwork,
 )
 from .const import (
     CLOUD_USERNAME,
     CONF_SKIP_RTSP,
     DOMAIN,
     CONTROL_PORT,
+    KLAP_HTTP_PORT,
+    DISCOVERY_MAX_HOSTS,
+    SCAN_NETWORK,
     ENABLE_MOTION_SENSOR,
     ENABLE_STREAM,
     ENABLE_SOUND_DETECTION,
@@ -39,6 +52,8 @@ from .const import (
     ENABLE_TIME_SYNC,
     MEDIA_SYNC_COLD_STORAGE_PATH,
     MEDIA_SYNC_HOURS,
+    MEDIA_SYNC_WORKERS,
+    MEDIA_SYNC_WORKERS_DEFAULT,
     MEDIA_VIEW_DAYS_ORDER,
     MEDIA_VIEW_DAYS_ORDER_OPTIONS,
     MEDIA_VIEW_RECORDINGS_ORDER,
@@ -62,6 +77,10 @@ from .const import (
     TIME_SYNC_NDST,
     TIME_SYNC_NDST_DEFAULT,
     UPDATE_INTERVAL_BATTERY_DEFAULT,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_MAX_AGE_DEFAULT,
+    SNAPSHOT_KEEPALIVE,
+    SNAPSHOT_KEEPALIVE_DEFAULT,
     UPDATE_INTERVAL_MAIN,
     UPDATE_INTERVAL_BATTERY,
     UPDATE_INTERVAL_MAIN_DEFAULT,
@@ -72,7 +91,7 @@ from .const import (
 class FlowHandler(ConfigFlow):
     """Handle a config flow."""
 
-    VERSION = 25
+    VERSION = 28
 
     def __init__(self):
         self.tapoHasStream6 = False
@@ -90,7 +109,7 @@ class FlowHandler(ConfigFlow):
         )
         host = self.reauth_entry.data[CONF_IP_ADDRESS]
         controlPort = self.reauth_entry.data[CONTROL_PORT]
-        if not areCameraPortsOpened(host, controlPort=controlPort):
+        if not await areCameraPortsOpened(self.hass, host, controlPort=controlPort):
             LOGGER.debug(
                 "[REAUTH][%s] Some of the required ports are closed.",
                 host,
@@ -333,7 +352,92 @@ class FlowHandler(ConfigFlow):
     async def async_step_user(self, user_input=None):
         """Handle a flow initialized by the user."""
         LOGGER.debug("[ADD DEVICE] Setup process for tapo initiated by user.")
-        return await self.async_step_ip()
+        return self.async_show_menu(step_id="user", menu_options=["ip", "scan"])
+
+    async def async_step_scan(self, user_input=None):
+        """Scan a network range and start a discovery flow per found device."""
+        errors = {}
+        scanNetworkRange = ""
+        if user_input is not None:
+            scanNetworkRange = user_input[SCAN_NETWORK]
+            try:
+                network = ipaddress.ip_network(scanNetworkRange, strict=False)
+            except ValueError:
+                errors["base"] = "invalid_network"
+            else:
+                if network.version != 4 or network.num_addresses > DISCOVERY_MAX_HOSTS:
+                    errors["base"] = "invalid_network"
+                else:
+                    devices = await scanNetwork(self.hass, network)
+                    discovered = 0
+                    for device in devices:
+                        if self._async_host_already_configured(
+                            device["host"], device["controlPort"]
+                        ):
+                            continue
+                        discovered += 1
+                        self.hass.async_create_task(
+                            self.hass.config_entries.flow.async_init(
+                                DOMAIN,
+                                context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                                data={
+                                    CONF_IP_ADDRESS: device["host"],
+                                    CONTROL_PORT: device["controlPort"],
+                                    IS_KLAP_DEVICE: device["isKLAP"],
+                                },
+                            )
+                        )
+                    return self.async_abort(
+                        reason="scan_finished",
+                        description_placeholders={"count": str(discovered)},
+                    )
+        else:
+            for adapter in await network_async_get_adapters(self.hass):
+                if adapter["enabled"] and adapter["ipv4"]:
+                    ipv4 = adapter["ipv4"][0]
+                    scanNetworkRange = str(
+                        ipaddress.ip_network(
+                            f"{ipv4['address']}/{ipv4['network_prefix']}",
+                            strict=False,
+                        )
+                    )
+                    break
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        SCAN_NETWORK,
+                        description={"suggested_value": scanNetworkRange},
+                    ): str,
+                }
+            ),
+            errors=errors,
+            last_step=False,
+        )
+
+    async def async_step_integration_discovery(self, discovery_info):
+        """Handle a device found by the network scan."""
+        host = discovery_info[CONF_IP_ADDRESS]
+        controlPort = discovery_info[CONTROL_PORT]
+        if self._async_host_already_configured(host, controlPort):
+            LOGGER.debug("[ADD DEVICE][%s] Already configured.", host)
+            return self.async_abort(reason="already_configured")
+        if any(
+            flow["context"].get("tapo_host") == host
+            for flow in self._async_in_progress()
+        ):
+            LOGGER.debug("[ADD DEVICE][%s] Already discovered.", host)
+            return self.async_abort(reason="already_in_progress")
+
+        self.context.update({"title_placeholders": {"name": host}, "tapo_host": host})
+        self.tapoHost = host
+        self.tapoControlPort = controlPort
+        LOGGER.debug("[ADD DEVICE][%s] Initiating config flow by network scan.", host)
+        if discovery_info[IS_KLAP_DEVICE]:
+            return await self.async_step_auth_klap()
+        return await self.async_step_auth()
 
     async def async_step_dhcp(self, dhcp_discovery):
         """Handle dhcp discovery."""
@@ -355,8 +459,10 @@ class FlowHandler(ConfigFlow):
         await self.async_set_unique_id(mac_address)
         self.context.update({"title_placeholders": {"name": dhcp_discovery.ip}})
         self.tapoHost = dhcp_discovery.ip
-        isKLAPResult = await self.hass.async_add_executor_job(
-            isKLAP, self.tapoHost, 80, 5
+        isKLAPResult = await isOpen(
+            self.hass, self.tapoHost, KLAP_HTTP_PORT
+        ) and await self.hass.async_add_executor_job(
+            isKLAP, self.tapoHost, KLAP_HTTP_PORT, 5
         )
         if isKLAPResult:
             self.tapoControlPort = 80
@@ -519,6 +625,7 @@ class FlowHandler(ConfigFlow):
                         MEDIA_VIEW_RECORDINGS_ORDER: "Ascending",
                         MEDIA_SYNC_HOURS: "",
                         MEDIA_SYNC_COLD_STORAGE_PATH: "",
+                        MEDIA_SYNC_WORKERS: MEDIA_SYNC_WORKERS_DEFAULT,
                         ENABLE_MOTION_SENSOR: False,
                         ENABLE_WEBHOOKS: False,
                         ENABLE_STREAM: False,
@@ -541,6 +648,8 @@ class FlowHandler(ConfigFlow):
                         CONF_RTSP_TRANSPORT: "tcp",
                         UPDATE_INTERVAL_MAIN: UPDATE_INTERVAL_MAIN_DEFAULT,
                         UPDATE_INTERVAL_BATTERY: UPDATE_INTERVAL_BATTERY_DEFAULT,
+                        SNAPSHOT_MAX_AGE: SNAPSHOT_MAX_AGE_DEFAULT,
+                        SNAPSHOT_KEEPALIVE: SNAPSHOT_KEEPALIVE_DEFAULT,
                         IS_KLAP_DEVICE: True,
                     },
                 )
@@ -555,6 +664,7 @@ class FlowHandler(ConfigFlow):
                         MEDIA_VIEW_RECORDINGS_ORDER: "Ascending",
                         MEDIA_SYNC_HOURS: "",
                         MEDIA_SYNC_COLD_STORAGE_PATH: "",
+                        MEDIA_SYNC_WORKERS: MEDIA_SYNC_WORKERS_DEFAULT,
                         ENABLE_MOTION_SENSOR: enable_motion_sensor,
                         ENABLE_WEBHOOKS: enable_webhooks,
                         ENABLE_STREAM: enable_stream,
@@ -579,6 +689,8 @@ class FlowHandler(ConfigFlow):
                         CONF_RTSP_TRANSPORT: rtsp_transport,
                         UPDATE_INTERVAL_MAIN: UPDATE_INTERVAL_MAIN_DEFAULT,
                         UPDATE_INTERVAL_BATTERY: UPDATE_INTERVAL_BATTERY_DEFAULT,
+                        SNAPSHOT_MAX_AGE: SNAPSHOT_MAX_AGE_DEFAULT,
+                        SNAPSHOT_KEEPALIVE: SNAPSHOT_KEEPALIVE_DEFAULT,
                         IS_KLAP_DEVICE: False,
                         TIME_SYNC_DST: TIME_SYNC_DST_DEFAULT,
                         TIME_SYNC_NDST: TIME_SYNC_NDST_DEFAULT,
@@ -793,6 +905,7 @@ class FlowHandler(ConfigFlow):
                         MEDIA_VIEW_RECORDINGS_ORDER: "Ascending",
                         MEDIA_SYNC_HOURS: "",
                         MEDIA_SYNC_COLD_STORAGE_PATH: "",
+                        MEDIA_SYNC_WORKERS: MEDIA_SYNC_WORKERS_DEFAULT,
                         ENABLE_MOTION_SENSOR: False,
                         ENABLE_WEBHOOKS: False,
                         ENABLE_STREAM: False,
@@ -815,6 +928,8 @@ class FlowHandler(ConfigFlow):
                         CONF_RTSP_TRANSPORT: "tcp",
                         UPDATE_INTERVAL_MAIN: UPDATE_INTERVAL_MAIN_DEFAULT,
                         UPDATE_INTERVAL_BATTERY: UPDATE_INTERVAL_BATTERY_DEFAULT,
+                        SNAPSHOT_MAX_AGE: SNAPSHOT_MAX_AGE_DEFAULT,
+                        SNAPSHOT_KEEPALIVE: SNAPSHOT_KEEPALIVE_DEFAULT,
                         IS_KLAP_DEVICE: True,
                     },
                 )
@@ -869,7 +984,7 @@ class FlowHandler(ConfigFlow):
                     raise Exception("already_configured")
 
                 LOGGER.debug("[ADD DEVICE][%s] Verifying port %s.", host, controlPort)
-                if isOpen(host, controlPort):
+                if await isOpen(self.hass, host, controlPort):
                     LOGGER.debug(
                         "[ADD DEVICE][%s] Port %s is opened, verifying access to control of camera.",
                         host,
@@ -894,7 +1009,9 @@ class FlowHandler(ConfigFlow):
                                 "[ADD DEVICE][%s] Verifying ports all required camera ports.",
                                 host,
                             )
-                            if not areCameraPortsOpened(host, controlPort=controlPort):
+                            if not await areCameraPortsOpened(
+                                self.hass, host, controlPort=controlPort
+                            ):
                                 LOGGER.debug(
                                     "[ADD DEVICE][%s] Some of the required ports are closed.",
                                     host,
@@ -1093,7 +1210,9 @@ class FlowHandler(ConfigFlow):
                             "[ADD DEVICE][%s] Verifying ports all required camera ports.",
                             host,
                         )
-                        if not areCameraPortsOpened(host, controlPort=controlPort):
+                        if not await areCameraPortsOpened(
+                            self.hass, host, controlPort=controlPort
+                        ):
                             LOGGER.debug(
                                 "[ADD DEVICE][%s] Some of the required ports are closed.",
                                 host,
@@ -1374,6 +1493,8 @@ class TapoOptionsFlowHandler(OptionsFlow):
         errors = {}
         updateIntervalMain = self.config_entry.data[UPDATE_INTERVAL_MAIN]
         updateIntervalBattery = self.config_entry.data[UPDATE_INTERVAL_BATTERY]
+        snapshotMaxAge = self.config_entry.data[SNAPSHOT_MAX_AGE]
+        snapshotKeepalive = self.config_entry.data[SNAPSHOT_KEEPALIVE]
 
         allConfigData = {**self.config_entry.data}
         if user_input is not None:
@@ -1389,7 +1510,19 @@ class TapoOptionsFlowHandler(OptionsFlow):
                     updateIntervalBattery = UPDATE_INTERVAL_BATTERY_DEFAULT
 
                 allConfigData[UPDATE_INTERVAL_MAIN] = updateIntervalMain
+                if SNAPSHOT_MAX_AGE in user_input:
+                    snapshotMaxAge = user_input[SNAPSHOT_MAX_AGE]
+                else:
+                    snapshotMaxAge = SNAPSHOT_MAX_AGE_DEFAULT
+
+                if SNAPSHOT_KEEPALIVE in user_input:
+                    snapshotKeepalive = user_input[SNAPSHOT_KEEPALIVE]
+                else:
+                    snapshotKeepalive = SNAPSHOT_KEEPALIVE_DEFAULT
+
                 allConfigData[UPDATE_INTERVAL_BATTERY] = updateIntervalBattery
+                allConfigData[SNAPSHOT_MAX_AGE] = snapshotMaxAge
+                allConfigData[SNAPSHOT_KEEPALIVE] = snapshotKeepalive
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
                     data=allConfigData,
@@ -1412,6 +1545,14 @@ class TapoOptionsFlowHandler(OptionsFlow):
                         UPDATE_INTERVAL_BATTERY,
                         description={"suggested_value": updateIntervalBattery},
                     ): int,
+                    vol.Required(
+                        SNAPSHOT_MAX_AGE,
+                        description={"suggested_value": snapshotMaxAge},
+                    ): vol.All(int, vol.Range(min=0)),
+                    vol.Required(
+                        SNAPSHOT_KEEPALIVE,
+                        description={"suggested_value": snapshotKeepalive},
+                    ): vol.All(int, vol.Range(min=0)),
                 }
             ),
             errors=errors,
@@ -1499,6 +1640,7 @@ class TapoOptionsFlowHandler(OptionsFlow):
         media_sync_cold_storage_path = self.config_entry.data[
             MEDIA_SYNC_COLD_STORAGE_PATH
         ]
+        media_sync_workers = self.config_entry.data[MEDIA_SYNC_WORKERS]
 
         allConfigData = {**self.config_entry.data}
         if user_input is not None:
@@ -1528,6 +1670,11 @@ class TapoOptionsFlowHandler(OptionsFlow):
                 else:
                     media_sync_cold_storage_path = ""
 
+                if MEDIA_SYNC_WORKERS in user_input:
+                    media_sync_workers = user_input[MEDIA_SYNC_WORKERS]
+                else:
+                    media_sync_workers = MEDIA_SYNC_WORKERS_DEFAULT
+
                 if media_sync_cold_storage_path != "" and not os.path.exists(
                     media_sync_cold_storage_path
                 ):
@@ -1539,6 +1686,7 @@ class TapoOptionsFlowHandler(OptionsFlow):
                 allConfigData[MEDIA_SYNC_COLD_STORAGE_PATH] = (
                     media_sync_cold_storage_path
                 )
+                allConfigData[MEDIA_SYNC_WORKERS] = media_sync_workers
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
                     data=allConfigData,
@@ -1571,6 +1719,10 @@ class TapoOptionsFlowHandler(OptionsFlow):
                         MEDIA_SYNC_COLD_STORAGE_PATH,
                         description={"suggested_value": media_sync_cold_storage_path},
                     ): str,
+                    vol.Required(
+                        MEDIA_SYNC_WORKERS,
+                        description={"suggested_value": media_sync_workers},
+                    ): vol.All(int, vol.Range(min=1)),
                 }
             ),
             errors=errors,
@@ -1795,8 +1947,10 @@ class TapoOptionsFlowHandler(OptionsFlow):
 
                 if ipChanged:
                     if tapoController is None:
-                        isKLAPResult = await self.hass.async_add_executor_job(
-                            isKLAP, ip_address, 80, 5
+                        isKLAPResult = await isOpen(
+                            self.hass, ip_address, KLAP_HTTP_PORT
+                        ) and await self.hass.async_add_executor_job(
+                            isKLAP, ip_address, KLAP_HTTP_PORT, 5
                         )
                         if cloud_password != "":
                             LOGGER.debug("Setting up controller using cloud password.")
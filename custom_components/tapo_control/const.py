@@ -12,6 +12,10 @@ CONTROL_PORT = "control_port"
 PYTAPO_REQUIRED_VERSION = "3.4.18"
 DOMAIN = "tapo_control"
 DOMAIN_CONFIG = DOMAIN + "_config"
+DOMAIN_PORT_PROBE = DOMAIN + "_port_probe"
+DOMAIN_CONTROLLERS = DOMAIN + "_controllers"
+DOMAIN_CAPABILITIES = DOMAIN + "_capabilities"
+DOMAIN_BOOTSTRAP = DOMAIN + "_bootstrap"
 BRAND = "TP-Link"
 DOORBELL_UDP_PORT = 20005
 DOORBELL_UDP_DISCOVERED = "doorbell_udp_discovered"
@@ -38,6 +42,7 @@ CONF_CUSTOM_STREAM_6 = "custom_stream6"
 CONF_CUSTOM_STREAM_7 = "custom_stream7"
 CONF_SKIP_RTSP = "skip_rtsp"
 CONF_TRANSPORT_METHOD = "transport_method"
+SCAN_NETWORK = "scan_network"
 
 ENABLE_MOTION_SENSOR = "enable_motion_sensor"
 ENABLE_MEDIA_SYNC = "enable_media_sync"
@@ -48,6 +53,19 @@ UPDATE_INTERVAL_MAIN = "update_interval_main"
 UPDATE_INTERVAL_BATTERY = "update_interval_battery"
 UPDATE_INTERVAL_MAIN_DEFAULT = 30
 UPDATE_INTERVAL_BATTERY_DEFAULT = 60 * 10
+UPDATE_CONTROLLERS_CONCURRENCY = 4
+UPDATE_CONTROLLER_TIMEOUT = 60
+POLL_BOOST_INTERVAL = 10
+POLL_BOOST_DURATION = 60
+POLL_BACKOFF_MAX = 30 * 60
+POLL_JITTER = 0.2
+BATTERY_REQUEST_BUDGET = 30
+BATTERY_REQUEST_WINDOW = 60 * 60
+BATTERY_RADIO_TAIL = 10
+SNAPSHOT_MAX_AGE = "snapshot_max_age"
+SNAPSHOT_MAX_AGE_DEFAULT = 5
+SNAPSHOT_KEEPALIVE = "snapshot_keepalive"
+SNAPSHOT_KEEPALIVE_DEFAULT = 0
 
 TIME_SYNC_DST = "time_sync_dst"
 TIME_SYNC_NDST = "time_sync_ndst"
@@ -58,9 +76,46 @@ MEDIA_VIEW_DAYS_ORDER = "media_view_days_order"
 MEDIA_VIEW_RECORDINGS_ORDER = "media_view_recordings_order"
 MEDIA_SYNC_HOURS = "media_sync_hours"
 MEDIA_SYNC_COLD_STORAGE_PATH = "media_sync_cold_storage_path"
+MEDIA_SYNC_WORKERS = "media_sync_workers"
+MEDIA_SYNC_WORKERS_DEFAULT = 2
 
 TOGGLE_STATES = ["on", "off"]
 
+# pytapo getters checked by the platforms, resolved together before setup.
+CAPABILITY_CHECKS = (
+    "getAlarm",
+    "getAlarmConfig",
+    "getAlertTypeList",
+    "getAudioConfig",
+    "getAutoTrackTarget",
+    "getBabyCryDetection",
+    "getBarkDetection",
+    "getCruise",
+    "getDualCamLinkage",
+    "getFirmwareAutoUpgradeConfig",
+    "getForceWhitelampState",
+    "getGlassBreakDetection",
+    "getImageFlipVertical",
+    "getLensDistortionCorrection",
+    "getLightFrequencyMode",
+    "getMeowDetection",
+    "getMotionDetection",
+    "getNotificationsEnabled",
+    "getPersonDetection",
+    "getPetDetection",
+    "getPresets",
+    "getPrivacyMode",
+    "getReboot",
+    "getRecordPlan",
+    "getSirenTypeList",
+    "getTamperDetection",
+    "getTimezone",
+    "getVehicleDetection",
+    "getVideoQualities",
+    "getWhitelampConfig",
+    "getWhitelampStatus",
+)
+
 CONF_RTSP_TRANSPORT = "rtsp_transport"
 RTSP_TRANS_PROTOCOLS = ["tcp", "udp", "udp_multicast", "http"]
 MEDIA_VIEW_DAYS_ORDER_OPTIONS = ["Ascending", "Descending"]
@@ -85,9 +140,45 @@ RECORDINGS_UNAVAILABLE_MESSAGE = (
 )
 MEDIA_CLEANUP_PERIOD = 10 * 60
 UPDATE_CHECK_PERIOD = 86400
+PORT_PROBE_TIMEOUT = 3
+PORT_PROBE_CACHE_TIME = 30
+KLAP_HTTP_PORT = 80
+CONTROLLER_POOL_IDLE_TIME = 60
+CAPABILITY_PROBE_CONCURRENCY = 4
+CAPABILITY_CACHE_SAVE_DELAY = 10
+# pytapo error messages meaning a getter is not supported by the firmware.
+CAPABILITY_UNSUPPORTED_ERRORS = (
+    "-40105",
+    "-40106",
+    "-40210",
+    "Method does not exist",
+    "METHOD_DO_NOT_EXIST",
+    "UNSUPPORTED_METHOD",
+    "is not supported by this camera",
+)
+BOOTSTRAP_CONCURRENCY = 4
+CAM_DATA_SNAPSHOT_SAVE_DELAY = 60
+WRITE_BATCH_WINDOW = 0.25
+DISCOVERY_CONCURRENCY = 256
+DISCOVERY_PROBE_TIMEOUT = 1
+DISCOVERY_MAX_HOSTS = 4096
 
 COLD_DIR_DELETE_TIME = 24 * 60 * 60
-HOT_DIR_DELETE_TIME = 60 * 60
+MEDIA_URL_EXPIRY = 60 * 60
+MEDIA_THUMB_CACHE_TIME = 24 * 60 * 60
+MEDIA_VIEW_PAGE_SIZE = 50
+THUMBNAIL_WORKERS = 4
+THUMBNAIL_FFMPEG_ARGS = "-vf scale=320:-2"
+MEDIA_SYNC_QUEUE_SAVE_DELAY = 10
+MEDIA_SYNC_THROUGHPUT_WINDOW = 10 * 60
+MEDIA_SYNC_MAX_RETRIES = 5
+MEDIA_SYNC_RETRY_DELAY = 5 * 60
+RECORDINGS_INDEX_SAVE_DELAY = 10
+RECORDINGS_INDEX_MAX_AGE = 5 * 60
+MJPEG_FRAME_TIMEOUT = 15
+MJPEG_BUFFER_LIMIT = 4 * 1024 * 1024
+MJPEG_CLIENT_BUFFER_FRAMES = 2
+MJPEG_BOUNDARY = "tapoframe"
 
 SERVICE_SAVE_PRESET = "save_preset"
 SCHEMA_SERVICE_SAVE_PRESET = {
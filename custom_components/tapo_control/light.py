@@ -92,6 +92,8 @@ async def async_setup_entry(
 
 
 class TapoWhitelight(TapoLightEntity):
+    _camDataKeys = ("whitelampStatus",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         LOGGER.debug("TapoWhitelight - init - start")
         self._attr_is_on = False
@@ -109,9 +111,6 @@ class TapoWhitelight(TapoLightEntity):
         )
         LOGGER.debug("TapoWhitelight - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
         LOGGER.debug("Turning on light")
         camData = self._entry["camData"]
@@ -164,6 +163,8 @@ class TapoWhitelight(TapoLightEntity):
 
 
 class TapoFloodlightModern(TapoLightEntity):
+    _camDataKeys = ("flood_light_config", "flood_light_status")
+
     def __init__(
         self,
         entry: dict,
@@ -201,9 +202,6 @@ class TapoFloodlightModern(TapoLightEntity):
             255 - 1
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self, **kwargs) -> None:
         LOGGER.debug("Turning on light")
         if ATTR_BRIGHTNESS in kwargs:
@@ -267,6 +265,8 @@ class TapoFloodlightModern(TapoLightEntity):
 
 
 class TapoFloodlight(TapoLightEntity):
+    _camDataKeys = ("force_white_lamp_state",)
+
     def __init__(
         self,
         entry: dict,
@@ -293,9 +293,6 @@ class TapoFloodlight(TapoLightEntity):
         )
         LOGGER.debug("TapoFloodlight - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
         LOGGER.debug("Turning on light")
         result = await self._hass.async_add_executor_job(
@@ -24,15 +24,19 @@ from .const import (
     DOMAIN,
     LOGGER,
     MEDIA_VIEW_DAYS_ORDER,
+    MEDIA_VIEW_PAGE_SIZE,
     MEDIA_VIEW_RECORDINGS_ORDER,
+    RECORDINGS_INDEX_MAX_AGE,
     RECORDINGS_UNAVAILABLE_MESSAGE,
 )
 
 from .utils import (
     getRecording,
     getFileName,
-    getRecordings,
+    getIndexedRecordings,
+    getIndexedRecordingsDates,
     getWebFile,
+    getWebFilePath,
 )
 
 from pytapo import Tapo
@@ -108,10 +112,9 @@ class TapoMediaSource(MediaSource):
 
                 if isParent is True:
                     childID = query["childID"]
-                    for child in self.hass.data[DOMAIN][entry]["childDevices"]:
-                        if child["camData"]["basic_info"]["dev_id"] == childID:
-                            device = child
-                            break
+                    device = self.hass.data[DOMAIN][entry]["devicesById"].get(
+                        childID, device
+                    )
 
                 tapoController: Tapo = device["controller"]
 
@@ -130,8 +133,15 @@ class TapoMediaSource(MediaSource):
                 await getRecording(
                     self.hass, tapoController, entry, device, date, startDate, endDate
                 )
+                # Relative URLs are signed by media_source when resolved.
                 url = await getWebFile(
-                    self.hass, entry, startDate, endDate, "videos", childID=childID
+                    self.hass,
+                    entry,
+                    startDate,
+                    endDate,
+                    "videos",
+                    childID=childID,
+                    sign=False,
                 )
                 LOGGER.debug(url)
             except Exception as e:
@@ -142,8 +152,49 @@ class TapoMediaSource(MediaSource):
         else:
             raise Unresolvable("Unexpected path.")
 
+    def getVideosForDate(self, device, date, recordingsForDay, order):
+        # The sorted listing is kept until the indexed recordings for the day
+        # are replaced, so paging through hours does not rebuild it.
+        listing = device["mediaListings"].get(date)
+        if (
+            listing is not None
+            and listing["recordings"] is recordingsForDay
+            and listing["order"] == order
+        ):
+            return listing["videos"]
+
+        videos = []
+        for searchResult in recordingsForDay:
+            for key in searchResult:
+                startTS = searchResult[key]["startTime"] - device["timezoneOffset"]
+                endTS = searchResult[key]["endTime"] - device["timezoneOffset"]
+                startDate = dt.as_local(dt.utc_from_timestamp(startTS))
+                endDate = dt.as_local(dt.utc_from_timestamp(endTS))
+                videoName = (
+                    f"{startDate.strftime('%H:%M:%S')} - {endDate.strftime('%H:%M:%S')}"
+                )
+                videos.append(
+                    {
+                        "name": videoName,
+                        "hour": startDate.strftime("%H"),
+                        "startDate": searchResult[key]["startTime"],
+                        "endDate": searchResult[key]["endTime"],
+                    }
+                )
+
+        videos = sorted(
+            videos,
+            key=lambda x: x["startDate"],
+            reverse=(True if order == "Descending" else False),
+        )
+        device["mediaListings"][date] = {
+            "recordings": recordingsForDay,
+            "order": order,
+            "videos": videos,
+        }
+        return videos
+
     async def generateVideosForDate(self, query, title, entry, date, device):
-        tapoController = device["controller"]
         childID = ""
         if "childID" in query:
             childID = query["childID"]
@@ -155,8 +206,8 @@ class TapoMediaSource(MediaSource):
                 "Initial local media scan still running, please try again later."
             )
         try:
-            recordingsForDay = await getRecordings(
-                self.hass, device, tapoController, date
+            recordingsForDay = await getIndexedRecordings(
+                self.hass, device, date, RECORDINGS_INDEX_MAX_AGE
             )
         except Exception as err:
             LOGGER.error(
@@ -166,45 +217,44 @@ class TapoMediaSource(MediaSource):
                 err,
             )
             raise Unresolvable(self._map_recordings_exception(err)) from err
-        videoNames = []
-        for searchResult in recordingsForDay:
-            for key in searchResult:
-                startTS = searchResult[key]["startTime"] - device["timezoneOffset"]
-                endTS = searchResult[key]["endTime"] - device["timezoneOffset"]
-                startDate = dt.as_local(dt.utc_from_timestamp(startTS))
-                endDate = dt.as_local(dt.utc_from_timestamp(endTS))
-                videoName = (
-                    f"{startDate.strftime('%H:%M:%S')} - {endDate.strftime('%H:%M:%S')}"
-                )
-                videoNames.append(
-                    {
-                        "name": videoName,
-                        "startDate": searchResult[key]["startTime"],
-                        "endDate": searchResult[key]["endTime"],
-                    }
-                )
-
-        videoNames = sorted(
-            videoNames,
-            key=lambda x: x["startDate"],
-            reverse=(True if media_view_recordings_order == "Descending" else False),
+        videos = self.getVideosForDate(
+            device, date, recordingsForDay, media_view_recordings_order
         )
 
+        if "hour" in query:
+            videos = [data for data in videos if data["hour"] == query["hour"]]
+        elif len(videos) > MEDIA_VIEW_PAGE_SIZE:
+            hours = {}
+            for data in videos:
+                hours[data["hour"]] = hours.get(data["hour"], 0) + 1
+            return self.generateView(
+                build_identifier(query),
+                title,
+                False,
+                True,
+                children=[
+                    self.generateView(
+                        build_identifier(
+                            {**query, "title": f"{date} {hour}:00", "hour": hour}
+                        ),
+                        f"{hour}:00 - {hour}:59 ({count})",
+                        False,
+                        True,
+                    )
+                    for hour, count in hours.items()
+                ],
+            )
+
         dateChildren = []
-        for data in videoNames:
+        for data in videos:
             fileName = getFileName(
                 data["startDate"], data["endDate"], False, childID=childID
             )
+            # Relative thumbnails are fetched with auth by the frontend
+            # when they scroll into view.
             thumbLink = None
             if fileName in device["downloadedStreams"]:
-                thumbLink = await getWebFile(
-                    self.hass,
-                    entry,
-                    data["startDate"],
-                    data["endDate"],
-                    "thumbs",
-                    childID=childID,
-                )
+                thumbLink = getWebFilePath(entry, fileName + ".jpg", "thumbs")
 
             dateChildren.append(
                 self.generateView(
@@ -228,7 +278,6 @@ class TapoMediaSource(MediaSource):
         )
 
     async def generateDates(self, query, title, entry, device):
-        tapoController = device["controller"]
         media_view_days_order = self.hass.data[DOMAIN][entry]["entry"].data.get(
             MEDIA_VIEW_DAYS_ORDER
         )
@@ -242,18 +291,12 @@ class TapoMediaSource(MediaSource):
                 "Cloud password is required in order to play recordings.\nSet cloud password inside Settings > Devices & Services > Tapo: Cameras Control > Configure."
             )
         try:
-            recordingsList = await self.hass.async_add_executor_job(
-                tapoController.getRecordingsList
-            )
+            recordingsDates = await getIndexedRecordingsDates(self.hass, device)
         except Exception as err:
             LOGGER.error(
                 "Unable to fetch recordings list for %s: %s", device["name"], err
             )
             raise Unresolvable(self._map_recordings_exception(err)) from err
-        recordingsDates = []
-        for searchResult in recordingsList:
-            for key in searchResult:
-                recordingsDates.append(searchResult[key]["date"])
 
         recordingsDates.sort(
             reverse=True if media_view_days_order == "Descending" else False
@@ -333,11 +376,7 @@ class TapoMediaSource(MediaSource):
             device = entry_data
             if isParent is True:
                 if "childID" in query:
-                    childID = query["childID"]
-                    for child in entry_data["childDevices"]:
-                        if child["camData"]["basic_info"]["dev_id"] == childID:
-                            device = child
-                            break
+                    device = entry_data["devicesById"].get(query["childID"], device)
 
             if "date" in query:
                 return await self.generateVideosForDate(
@@ -195,9 +195,6 @@ class TapoChimeVolumePlay(RestoreNumber, TapoEntity):
         RestoreNumber.__init__(self)
         LOGGER.debug("TapoChimeVolumePlay - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
@@ -235,9 +232,6 @@ class TapoChimeDurationPlay(RestoreNumber, TapoEntity):
         RestoreNumber.__init__(self)
         LOGGER.debug("TapoChimeDurationPlay - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
@@ -268,9 +262,6 @@ class TapoMovementAngle(RestoreNumber, TapoEntity):
         RestoreNumber.__init__(self)
         LOGGER.debug("TapoMovementAngle - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
@@ -288,6 +279,9 @@ class TapoMovementAngle(RestoreNumber, TapoEntity):
 
 
 class TapoMotionDetectionDigitalSensitivity(TapoNumberEntity):
+    _camDataKeys = ("motion_detection_digital_sensitivity",)
+    _refreshFunctions = ("getMotionDetection",)
+
     def __init__(
         self,
         entry: dict,
@@ -315,24 +309,18 @@ class TapoMotionDetectionDigitalSensitivity(TapoNumberEntity):
             "mdi:motion-sensor",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
 
     async def async_set_native_value(self, value: float) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": value},
             self._controller.setMotionDetection,
             None,
             int(value),
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = value
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -345,6 +333,8 @@ class TapoMotionDetectionDigitalSensitivity(TapoNumberEntity):
 
 
 class TapoChimeDuration(TapoNumberEntity):
+    _camDataKeys = ("chimeAlarmConfigurations",)
+
     def __init__(
         self,
         entry: dict,
@@ -370,9 +360,6 @@ class TapoChimeDuration(TapoNumberEntity):
             "mdi:dots-horizontal-circle",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
@@ -380,7 +367,8 @@ class TapoChimeDuration(TapoNumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         if value < 5:
             value = 0
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": value},
             self._controller.setChimeAlarmConfigure,
             self.macAddress,
             None,
@@ -388,10 +376,6 @@ class TapoChimeDuration(TapoNumberEntity):
             None,
             int(value),
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = value
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if (
@@ -407,6 +391,8 @@ class TapoChimeDuration(TapoNumberEntity):
 
 
 class TapoChimeVolume(TapoNumberEntity):
+    _camDataKeys = ("chimeAlarmConfigurations",)
+
     def __init__(
         self,
         entry: dict,
@@ -432,25 +418,19 @@ class TapoChimeVolume(TapoNumberEntity):
             "mdi:volume-high",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
 
     async def async_set_native_value(self, value: float) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": value},
             self._controller.setChimeAlarmConfigure,
             self.macAddress,
             None,
             None,
             int(value),
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = value
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if (
@@ -466,6 +446,8 @@ class TapoChimeVolume(TapoNumberEntity):
 
 
 class TapoMicrophoneVolume(TapoNumberEntity):
+    _camDataKeys = ("microphoneVolume",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         LOGGER.debug("TapoMicrophoneVolume - init - start")
         self._attr_min_value = 0
@@ -484,21 +466,14 @@ class TapoMicrophoneVolume(TapoNumberEntity):
             "mdi:microphone",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
 
     async def async_set_native_value(self, value: float) -> None:
-        result = await self._hass.async_add_executor_job(
-            self._controller.setMicrophone, int(value)
+        await self._async_write_batched(
+            {"_attr_state": value}, self._controller.setMicrophone, int(value)
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = value
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -508,6 +483,8 @@ class TapoMicrophoneVolume(TapoNumberEntity):
 
 
 class TapoSpeakerVolume(TapoNumberEntity):
+    _camDataKeys = ("speakerVolume",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         LOGGER.debug("TapoSpeakerVolume - init - start")
         self._attr_min_value = 0
@@ -526,21 +503,14 @@ class TapoSpeakerVolume(TapoNumberEntity):
             "mdi:speaker",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
 
     async def async_set_native_value(self, value: float) -> None:
-        result = await self._hass.async_add_executor_job(
-            self._controller.setSpeakerVolume, int(value)
+        await self._async_write_batched(
+            {"_attr_state": value}, self._controller.setSpeakerVolume, int(value)
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = value
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -550,6 +520,8 @@ class TapoSpeakerVolume(TapoNumberEntity):
 
 
 class TapoSirenVolume(TapoNumberEntity):
+    _camDataKeys = ("alarm_config",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         LOGGER.debug("TapoSirenVolume - init - start")
         self._attr_min_value = 1
@@ -577,18 +549,13 @@ class TapoSirenVolume(TapoNumberEntity):
         )
         LOGGER.debug("TapoSirenVolume - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
 
     async def async_set_native_value(self, value: float) -> None:
         if self.is_hub:
-            result = await self._hass.async_add_executor_job(
-                self._controller.setHubSirenConfig, None, None, str(int(value))
-            )
+            write = (self._controller.setHubSirenConfig, None, None, str(int(value)))
         else:
             strval = "low"
             if value > 3:
@@ -596,7 +563,7 @@ class TapoSirenVolume(TapoNumberEntity):
             if value > 7:
                 strval = "high"
             if self.typeOfAlarm == "getAlarm":
-                result = await self._hass.async_add_executor_job(
+                write = (
                     self._controller.setAlarm,
                     self.alarm_enabled,
                     "sound" in self.alarm_mode,
@@ -604,7 +571,7 @@ class TapoSirenVolume(TapoNumberEntity):
                     strval,
                 )
             elif self.typeOfAlarm == "getAlarmConfig":
-                result = await self._hass.async_add_executor_job(
+                write = (
                     self._controller.executeFunction,
                     "setAlarmConfig",
                     {"msg_alarm": {self.value_key: strval}},
@@ -613,7 +580,7 @@ class TapoSirenVolume(TapoNumberEntity):
                 # TODO: Move this to pytapo so that executeFunction does not need to be used directly
                 alarmConfig = dict(self.alarm_config["alert_config"])
                 alarmConfig[self.value_key] = strval
-                result = await self._hass.async_add_executor_job(
+                write = (
                     self._controller.executeFunction,
                     "setAlertConfig",
                     {
@@ -625,10 +592,7 @@ class TapoSirenVolume(TapoNumberEntity):
             else:
                 LOGGER.error("Unexpected type of alarm: " + self.typeOfAlarm)
                 return
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = value
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
+        await self._async_write_batched({"_attr_state": value}, *write)
 
     def updateTapo(self, camData):
         if not camData:
@@ -650,6 +614,8 @@ class TapoSirenVolume(TapoNumberEntity):
 
 
 class TapoFloodlightBrightness(TapoNumberEntity):
+    _camDataKeys = ("flood_light_config",)
+
     def __init__(
         self, entry: dict, hass: HomeAssistant, config_entry, minValue, maxValue
     ):
@@ -675,21 +641,20 @@ class TapoFloodlightBrightness(TapoNumberEntity):
         )
         LOGGER.debug("TapoFloodlightBrightness - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
 
     async def async_set_native_value(self, value: float) -> None:
-        result = await self._hass.async_add_executor_job(
-            self._controller.setFloodlightConfig, None, None, None, None, int(value)
+        await self._async_write_batched(
+            {"_attr_state": int(value)},
+            self._controller.setFloodlightConfig,
+            None,
+            None,
+            None,
+            None,
+            int(value),
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = int(value)
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -702,6 +667,9 @@ class TapoFloodlightBrightness(TapoNumberEntity):
 
 
 class TapoSpotlightIntensity(TapoNumberEntity):
+    _camDataKeys = ("whitelampConfigIntensity",)
+    _refreshFunctions = ("getWhitelampConfig",)
+
     def __init__(
         self,
         entry: dict,
@@ -772,24 +740,18 @@ class TapoSpotlightIntensity(TapoNumberEntity):
         )
         LOGGER.debug("TapoSpotlightIntensity - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
 
     async def async_set_native_value(self, value: float) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": value},
             self._controller.setWhitelampConfig,
             False,
             int(value),
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = value
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -804,6 +766,8 @@ class TapoSpotlightIntensity(TapoNumberEntity):
 
 
 class TapoSirenDuration(TapoNumberEntity):
+    _camDataKeys = ("alarm_config",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         LOGGER.debug("TapoSirenDuration - init - start")
         self._attr_min_value = 1
@@ -834,21 +798,16 @@ class TapoSirenDuration(TapoNumberEntity):
         )
         LOGGER.debug("TapoSirenDuration - init - end")
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
 
     async def async_set_native_value(self, value: float) -> None:
         if self.is_hub:
-            result = await self._hass.async_add_executor_job(
-                self._controller.setHubSirenConfig, int(value)
-            )
+            write = (self._controller.setHubSirenConfig, int(value))
         else:
             if self.typeOfAlarm == "getAlarm":
-                result = await self._hass.async_add_executor_job(
+                write = (
                     self._controller.setAlarm,
                     self.alarm_enabled,
                     "sound" in self.alarm_mode,
@@ -857,7 +816,7 @@ class TapoSirenDuration(TapoNumberEntity):
                     int(value),
                 )
             elif self.typeOfAlarm == "getAlarmConfig":
-                result = await self._hass.async_add_executor_job(
+                write = (
                     self._controller.executeFunction,
                     "setAlarmConfig",
                     {"msg_alarm": {self.value_key: int(value)}},
@@ -866,7 +825,7 @@ class TapoSirenDuration(TapoNumberEntity):
                 # TODO: Move this to pytapo so that executeFunction does not need to be used directly
                 alarmConfig = dict(self.alarm_config["alert_config"])
                 alarmConfig[self.value_key] = str(int(value))
-                result = await self._hass.async_add_executor_job(
+                write = (
                     self._controller.executeFunction,
                     "setAlertConfig",
                     {
@@ -878,10 +837,7 @@ class TapoSirenDuration(TapoNumberEntity):
             else:
                 LOGGER.error("Unexpected type of alarm: " + self.typeOfAlarm)
                 return
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = value
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
+        await self._async_write_batched({"_attr_state": value}, *write)
 
     def updateTapo(self, camData):
         if not camData:
@@ -411,6 +411,8 @@ async def async_setup_entry(
 
 
 class TapoChimeSoundPlay(RestoreEntity, TapoSelectEntity):
+    _camDataKeys = ("supportAlarmTypeList",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = entry["camData"]["supportAlarmTypeList"]["alarm_type_list"]
         self._attr_current_option = entry["chime_play_type"] = 1
@@ -424,9 +426,6 @@ class TapoChimeSoundPlay(RestoreEntity, TapoSelectEntity):
         )
         RestoreEntity.__init__(self)
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if (
             "supportAlarmTypeList" not in camData
@@ -457,6 +456,8 @@ class TapoChimeSoundPlay(RestoreEntity, TapoSelectEntity):
 
 
 class TapoChimeSound(TapoSelectEntity):
+    _camDataKeys = ("chimeAlarmConfigurations", "supportAlarmTypeList")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry, macAddress: str):
         self.macAddress = macAddress
         self._attr_options = entry["camData"]["supportAlarmTypeList"]["alarm_type_list"]
@@ -471,9 +472,6 @@ class TapoChimeSound(TapoSelectEntity):
             "mdi:music",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if (
             not camData
@@ -490,19 +488,19 @@ class TapoChimeSound(TapoSelectEntity):
             self._attr_state = self._attr_current_option
 
     async def async_select_option(self, option: str) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setChimeAlarmConfigure,
             self.macAddress,
             None,
             option,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoWhitelampForceTimeSelect(TapoSelectEntity):
+    _camDataKeys = ("whitelampConfigForceTime",)
+    _refreshFunctions = ("getWhitelampConfig",)
+
     def __init__(
         self,
         entry: dict,
@@ -524,9 +522,6 @@ class TapoWhitelampForceTimeSelect(TapoSelectEntity):
             "mdi:clock-outline",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData:
             self._attr_state = "unavailable"
@@ -545,41 +540,20 @@ class TapoWhitelampForceTimeSelect(TapoSelectEntity):
             self._attr_state = self._attr_current_option
 
     async def async_select_option(self, option: str) -> None:
-        if option == "5 min":
-            result = await self._hass.async_add_executor_job(
-                self._controller.setWhitelampConfig,
-                300,
-                False,
-                [self.chn_id] if self.chn_id else None,
-            )
-        elif option == "10 min":
-            result = await self._hass.async_add_executor_job(
-                self._controller.setWhitelampConfig,
-                600,
-                False,
-                [self.chn_id] if self.chn_id else None,
-            )
-        elif option == "15 min":
-            result = await self._hass.async_add_executor_job(
-                self._controller.setWhitelampConfig,
-                900,
-                False,
-                [self.chn_id] if self.chn_id else None,
-            )
-        elif option == "30 min":
-            result = await self._hass.async_add_executor_job(
-                self._controller.setWhitelampConfig,
-                1800,
-                False,
-                [self.chn_id] if self.chn_id else None,
-            )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
+        forceTime = {"5 min": 300, "10 min": 600, "15 min": 900, "30 min": 1800}
+        await self._async_write_batched(
+            {"_attr_state": option},
+            self._controller.setWhitelampConfig,
+            forceTime[option],
+            False,
+            [self.chn_id] if self.chn_id else None,
+        )
 
 
 class TapoWhitelampIntensityLevelSelect(TapoSelectEntity):
+    _camDataKeys = ("whitelampConfigIntensity",)
+    _refreshFunctions = ("getWhitelampConfig",)
+
     def __init__(
         self,
         entry: dict,
@@ -601,9 +575,6 @@ class TapoWhitelampIntensityLevelSelect(TapoSelectEntity):
             "mdi:lightbulb-on-50",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData:
             self._attr_state = "unavailable"
@@ -615,16 +586,13 @@ class TapoWhitelampIntensityLevelSelect(TapoSelectEntity):
             self._attr_state = self._attr_current_option
 
     async def async_select_option(self, option: str) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setWhitelampConfig,
             False,
             option,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoQuickResponseSelect(TapoSelectEntity):
@@ -649,9 +617,6 @@ class TapoQuickResponseSelect(TapoSelectEntity):
                 self._attr_options.append(quick_resp_audio[key]["name"])
                 self._attr_options_id.append(quick_resp_audio[key]["id"])
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData:
             self._attr_state = "unavailable"
@@ -661,16 +626,16 @@ class TapoQuickResponseSelect(TapoSelectEntity):
             self._attr_state = self._attr_current_option
 
     async def async_select_option(self, option: str) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": None},
             self._controller.playQuickResponse,
             self._attr_options_id[self._attr_options.index(option)],
         )
-        self._attr_state = None
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoPatrolModeSelect(TapoSelectEntity):
+    _camDataKeys = ("privacy_mode",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = ["Horizontal", "Vertical", "off"]
         self._attr_current_option = None
@@ -684,9 +649,6 @@ class TapoPatrolModeSelect(TapoSelectEntity):
             "patrol_mode",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData or camData["privacy_mode"] == "on":
             self._attr_state = STATE_UNAVAILABLE
@@ -696,17 +658,14 @@ class TapoPatrolModeSelect(TapoSelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         if option == "off":
-            result = await self._hass.async_add_executor_job(
-                self._controller.setCruise, False
-            )
+            write = (self._controller.setCruise, False)
         else:
-            result = await self._hass.async_add_executor_job(
-                self._controller.setCruise, True, "x" if option == "Horizontal" else "y"
+            write = (
+                self._controller.setCruise,
+                True,
+                "x" if option == "Horizontal" else "y",
             )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
+        await self._async_write_batched({"_attr_state": option}, *write)
 
     @property
     def entity_category(self):
@@ -714,6 +673,8 @@ class TapoPatrolModeSelect(TapoSelectEntity):
 
 
 class TapoTimezoneSelect(TapoSelectEntity):
+    _camDataKeys = ("timezone_timezone", "timezone_zone_id")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = [
             "UTC+12:00 (Pacific/Wake)",
@@ -818,9 +779,6 @@ class TapoTimezoneSelect(TapoSelectEntity):
             "mdi:map-clock",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
 
         if (
@@ -838,16 +796,17 @@ class TapoTimezoneSelect(TapoSelectEntity):
     async def async_select_option(self, option: str) -> None:
         timezone_timezone = option.split(" ")[0]
         timezone_zone_id = option.split("(")[-1].strip(")")
-        result = await self._hass.async_add_executor_job(
-            self._controller.setTimezone, timezone_timezone, timezone_zone_id
+        await self._async_write_batched(
+            {"_attr_state": option},
+            self._controller.setTimezone,
+            timezone_timezone,
+            timezone_zone_id,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoAutomaticRebootTimeSelect(TapoSelectEntity):
+    _camDataKeys = ("rebootTime",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = []
         self._option_to_time = {}
@@ -880,9 +839,6 @@ class TapoAutomaticRebootTimeSelect(TapoSelectEntity):
                 self._option_to_time[label] = reboot_time
                 self._time_to_option[start_time] = label
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData or "rebootTime" not in camData or camData["rebootTime"] is None:
             self._attr_state = STATE_UNAVAILABLE
@@ -902,18 +858,14 @@ class TapoAutomaticRebootTimeSelect(TapoSelectEntity):
             self.async_write_ha_state()
             return
 
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_current_option": option, "_attr_state": option},
             self._controller.setReboot,
             None,
             reboot_time,
             None,
             30,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_current_option = option
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoNightVisionSelect(TapoSelectEntity):
@@ -932,6 +884,7 @@ class TapoNightVisionSelect(TapoSelectEntity):
         self._attr_options = []
         self.method = method
         self.currentValueKey = currentValueKey
+        self._camDataKeys = (currentValueKey,)
         self.chn_id = chn_id
         self.read_chn_id = str(chn_id) if chn_id else "1"
         for nightVisionCapability in nightVisionOptions:
@@ -948,9 +901,6 @@ class TapoNightVisionSelect(TapoSelectEntity):
             "night_vision",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData:
             self._attr_state = "unavailable"
@@ -968,18 +918,18 @@ class TapoNightVisionSelect(TapoSelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         LOGGER.debug("Calling " + self.method.__name__ + " with " + option + "...")
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self.method,
             getNightModeValue(option),
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoLightFrequencySelect(TapoSelectEntity):
+    _camDataKeys = ("light_frequency_mode",)
+    _refreshFunctions = ("getLightFrequencyMode", "getLensDistortionCorrection")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = ["auto", "50", "60"]
         self._attr_current_option = None
@@ -987,9 +937,6 @@ class TapoLightFrequencySelect(TapoSelectEntity):
             self, "Light Frequency", entry, hass, config_entry, "mdi:sine-wave"
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData:
             self._attr_state = STATE_UNAVAILABLE
@@ -1006,16 +953,14 @@ class TapoLightFrequencySelect(TapoSelectEntity):
             self._attr_state = self._attr_current_option
 
     async def async_select_option(self, option: str) -> None:
-        result = await self._hass.async_add_executor_job(
-            self._controller.setLightFrequencyMode, option
+        await self._async_write_batched(
+            {"_attr_state": option}, self._controller.setLightFrequencyMode, option
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoAutomaticAlarmModeSelect(TapoSelectEntity):
+    _camDataKeys = ("alarm_config",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = ["both", "light", "sound", "off"]
         self._attr_current_option = None
@@ -1031,9 +976,6 @@ class TapoAutomaticAlarmModeSelect(TapoSelectEntity):
             "alarm",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData:
             self._attr_state = STATE_UNAVAILABLE
@@ -1080,7 +1022,7 @@ class TapoAutomaticAlarmModeSelect(TapoSelectEntity):
             alarmConfig["light_alarm_enabled"] = (
                 "on" if "light" in alarm_mode else "off"
             )
-            result = await self.hass.async_add_executor_job(
+            write = (
                 self._controller.executeFunction,
                 "setAlertConfig",
                 {
@@ -1090,7 +1032,7 @@ class TapoAutomaticAlarmModeSelect(TapoSelectEntity):
                 },
             )
         elif self.typeOfAlarm == "getAlarmConfig":
-            result = await self.hass.async_add_executor_job(
+            write = (
                 self._controller.executeFunction,
                 "setAlarmConfig",
                 {
@@ -1101,19 +1043,19 @@ class TapoAutomaticAlarmModeSelect(TapoSelectEntity):
                 },
             )
         else:
-            result = await self.hass.async_add_executor_job(
+            write = (
                 self._controller.setAlarm,
                 alarm_enabled,
                 "sound" in alarm_mode,
                 "light" in alarm_mode,
             )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
+        await self._async_write_batched({"_attr_state": option}, *write)
 
 
 class TapoDualCamLinkage(TapoSelectEntity):
+    _camDataKeys = ("dualCamLinkageEnabled", "dualCamLinkageType")
+    _refreshFunctions = ("getDualCamLinkage",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._options_map = {"Continuous tracking": 0, "Fixed view tracking": 1}
         self._attr_options = ["Continuous tracking", "Fixed view tracking", "off"]
@@ -1122,9 +1064,6 @@ class TapoDualCamLinkage(TapoSelectEntity):
             self, "Smart Dual Track Method", entry, hass, config_entry
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         LOGGER.debug(f"TapoDualCamLinkage updateTapo 1")
         LOGGER.debug(f"Enabled: {camData["dualCamLinkageEnabled"]}")
@@ -1153,18 +1092,18 @@ class TapoDualCamLinkage(TapoSelectEntity):
         LOGGER.debug("Updating TapoDualCamLinkage to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setDualCamLinkage,
             option != "off",
             self._options_map[option] if option != "off" else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoMotionDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("motion_detection_enabled", "motion_detection_sensitivity")
+    _refreshFunctions = ("getMotionDetection",)
+
     def __init__(
         self,
         entry: dict,
@@ -1187,9 +1126,6 @@ class TapoMotionDetectionSelect(TapoSelectEntity):
             "motion_detection",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         LOGGER.debug(f"TapoMotionDetectionSelect updateTapo 1 ({self.chn_id})")
         if not camData:
@@ -1216,19 +1152,19 @@ class TapoMotionDetectionSelect(TapoSelectEntity):
         LOGGER.debug("Updating TapoMotionDetectionSelect to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setMotionDetection,
             option != "off",
             option if option != "off" else False,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoPersonDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("person_detection_enabled", "person_detection_sensitivity")
+    _refreshFunctions = ("getPersonDetection",)
+
     def __init__(
         self,
         entry: dict,
@@ -1275,19 +1211,19 @@ class TapoPersonDetectionSelect(TapoSelectEntity):
         LOGGER.debug("Updating TapoPersonDetectionSelect to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setPersonDetection,
             option != "off",
             option if option != "off" else False,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoVehicleDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("vehicle_detection_enabled", "vehicle_detection_sensitivity")
+    _refreshFunctions = ("getVehicleDetection",)
+
     def __init__(
         self,
         entry: dict,
@@ -1334,19 +1270,19 @@ class TapoVehicleDetectionSelect(TapoSelectEntity):
         LOGGER.debug("Updating TapoVehicleDetectionSelect to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setVehicleDetection,
             option != "off",
             option if option != "off" else False,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoBabyCryDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("babyCry_detection_enabled", "babyCry_detection_sensitivity")
+    _refreshFunctions = ("getBabyCryDetection",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = ["high", "normal", "low", "off"]
         self._attr_current_option = None
@@ -1378,18 +1314,18 @@ class TapoBabyCryDetectionSelect(TapoSelectEntity):
         LOGGER.debug("Updating TapoBabyCryDetectionSelect to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setBabyCryDetection,
             option != "off",
             option if option != "off" else False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoPetDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("pet_detection_enabled", "pet_detection_sensitivity")
+    _refreshFunctions = ("getPetDetection",)
+
     def __init__(
         self,
         entry: dict,
@@ -1436,19 +1372,19 @@ class TapoPetDetectionSelect(TapoSelectEntity):
         LOGGER.debug("Updating TapoPetDetectionSelect to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setPetDetection,
             option != "off",
             option if option != "off" else False,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoBarkDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("bark_detection_enabled", "bark_detection_sensitivity")
+    _refreshFunctions = ("getBarkDetection",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = ["high", "normal", "low", "off"]
         self._attr_current_option = None
@@ -1480,18 +1416,18 @@ class TapoBarkDetectionSelect(TapoSelectEntity):
         LOGGER.debug("Updating TapoBarkDetectionSelect to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setBarkDetection,
             option != "off",
             option if option != "off" else False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoMeowDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("meow_detection_enabled", "meow_detection_sensitivity")
+    _refreshFunctions = ("getMeowDetection",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = ["high", "normal", "low", "off"]
         self._attr_current_option = None
@@ -1523,18 +1459,18 @@ class TapoMeowDetectionSelect(TapoSelectEntity):
         LOGGER.debug("Updating TapoMeowDetectionSelect to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setMeowDetection,
             option != "off",
             option if option != "off" else False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoGlassBreakDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("glass_detection_enabled", "glass_detection_sensitivity")
+    _refreshFunctions = ("getGlassBreakDetection",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = ["high", "normal", "low", "off"]
         self._attr_current_option = None
@@ -1568,18 +1504,18 @@ class TapoGlassBreakDetectionSelect(TapoSelectEntity):
         )
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setGlassBreakDetection,
             option != "off",
             option if option != "off" else False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoTamperDetectionSelect(TapoSelectEntity):
+    _camDataKeys = ("tamper_detection_enabled", "tamper_detection_sensitivity")
+    _refreshFunctions = ("getTamperDetection",)
+
     def __init__(
         self,
         entry: dict,
@@ -1626,19 +1562,18 @@ class TapoTamperDetectionSelect(TapoSelectEntity):
         LOGGER.debug("Updating TapoTamperDetectionSelect to: " + str(self._attr_state))
 
     async def async_select_option(self, option: str) -> None:
-        result = await self.hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": option},
             self._controller.setTamperDetection,
             option != "off",
             option if option != "off" else False,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
 
 class TapoMoveToPresetSelect(TapoSelectEntity):
+    _camDataKeys = ("presets", "privacy_mode")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._presets = {}
         self._attr_options = []
@@ -1647,9 +1582,6 @@ class TapoMoveToPresetSelect(TapoSelectEntity):
             self, "Move to Preset", entry, hass, config_entry, "mdi:arrow-decision"
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData):
         if not camData:
             self._attr_state = STATE_UNAVAILABLE
@@ -1684,6 +1616,8 @@ class TapoMoveToPresetSelect(TapoSelectEntity):
 
 
 class TapoSirenTypeSelect(TapoSelectEntity):
+    _camDataKeys = ("alarm_config",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._attr_options = entry["camData"]["alarm_siren_type_list"]
         self._attr_current_option = entry["camData"]["alarm_config"]["siren_type"]
@@ -1711,11 +1645,9 @@ class TapoSirenTypeSelect(TapoSelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         if self.hub:
-            result = await self.hass.async_add_executor_job(
-                self._controller.setHubSirenConfig, None, option
-            )
+            write = (self._controller.setHubSirenConfig, None, option)
         else:
-            result = await self.hass.async_add_executor_job(
+            write = (
                 self._controller.executeFunction,
                 "setAlarmConfig",
                 {
@@ -1724,13 +1656,12 @@ class TapoSirenTypeSelect(TapoSelectEntity):
                     }
                 },
             )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
+        await self._async_write_batched({"_attr_state": option}, *write)
 
 
 class TapoAlertTypeSelect(TapoSelectEntity):
+    _camDataKeys = ("alarm_config", "alarm_siren_type_list", "alarm_user_sounds")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry, startID=10):
         self.hub = entry["camData"]["alarm_is_hubSiren"]
         self.startID = startID
@@ -1794,7 +1725,7 @@ class TapoAlertTypeSelect(TapoSelectEntity):
                 optionIndex += 2
 
         if self.typeOfAlarm == "getAlarm":
-            result = await self._hass.async_add_executor_job(
+            write = (
                 self._controller.setAlarm,
                 self.alarm_enabled,
                 "sound" in self.alarm_mode,
@@ -1807,7 +1738,7 @@ class TapoAlertTypeSelect(TapoSelectEntity):
             # TODO: Move this to pytapo so that executeFunction does not need to be used directly
             alarmConfig = dict(self.alarm_config["alert_config"])
             alarmConfig["alarm_type"] = str(optionIndex)
-            result = await self._hass.async_add_executor_job(
+            write = (
                 self._controller.executeFunction,
                 "setAlertConfig",
                 {
@@ -1818,7 +1749,7 @@ class TapoAlertTypeSelect(TapoSelectEntity):
             )
         else:
             # No idea if this works, cannot test on camera
-            result = await self.hass.async_add_executor_job(
+            write = (
                 self._controller.executeFunction,
                 "setAlarmConfig",
                 {
@@ -1827,7 +1758,4 @@ class TapoAlertTypeSelect(TapoSelectEntity):
                     }
                 },
             )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = option
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
+        await self._async_write_batched({"_attr_state": option}, *write)
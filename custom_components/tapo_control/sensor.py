@@ -8,15 +8,23 @@ from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     STATE_UNAVAILABLE,
+    UnitOfDataRate,
     UnitOfInformation,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, ENABLE_MEDIA_SYNC, LOGGER
+from .const import BATTERY_REQUEST_BUDGET, DOMAIN, ENABLE_MEDIA_SYNC, LOGGER
 from .tapo.entities import TapoSensorEntity
+from .utils import (
+    getControllerPool,
+    getMediaSyncThroughput,
+    getRadioOnTime,
+    getRequestsPerHour,
+)
 
 
 async def async_setup_entry(
@@ -80,18 +88,31 @@ async def async_setup_entry(
         if entry["controller"].isKLAP is False:
             sensors.append(TapoSyncSensor(entry, hass, config_entry))
 
+        sensors.append(TapoNextPollSensor(entry, hass, config_entry))
+        if entry["isRunningOnBattery"]:
+            sensors.append(TapoRequestsPerHourSensor(entry, hass, config_entry))
+            sensors.append(TapoRadioOnTimeSensor(entry, hass, config_entry))
+
         return sensors
 
     sensors = await setupEntities(entry)
     for childDevice in entry["childDevices"]:
         sensors.extend(await setupEntities(childDevice))
 
+    sensors.append(TapoControllerSessionsSensor(entry, hass, config_entry))
+
+    if entry["controller"].isKLAP is False:
+        # Media sync queue is shared by the whole hub
+        sensors.append(TapoMediaSyncQueueSensor(entry, hass, config_entry))
+        sensors.append(TapoMediaSyncThroughputSensor(entry, hass, config_entry))
+
     async_add_entities(sensors)
 
 
 class TapoRSSISensor(TapoSensorEntity):
     """Tapo RSSI sensor entity."""
 
+    _camDataKeys = ("connectionInformation",)
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -111,9 +132,6 @@ class TapoRSSISensor(TapoSensorEntity):
             None,
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData: dict | None) -> None:
         """Update the entity."""
         if (
@@ -129,6 +147,7 @@ class TapoRSSISensor(TapoSensorEntity):
 class TapoLinkTypeSensor(TapoSensorEntity):
     """Tapo link type sensor entity."""
 
+    _camDataKeys = ("connectionInformation",)
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(
@@ -145,10 +164,6 @@ class TapoLinkTypeSensor(TapoSensorEntity):
             None,
         )
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData: dict | None) -> None:
         """Update the entity."""
         if (
@@ -164,6 +179,7 @@ class TapoLinkTypeSensor(TapoSensorEntity):
 class TapoChimeSignalLevel(TapoSensorEntity):
     """Tapo Chime Signal Level sensor entity."""
 
+    _camDataKeys = ("basic_info",)
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(
@@ -180,10 +196,6 @@ class TapoChimeSignalLevel(TapoSensorEntity):
             None,
         )
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData: dict | None) -> None:
         """Update the entity."""
         if (
@@ -200,6 +212,7 @@ class TapoChimeSignalLevel(TapoSensorEntity):
 class TapoSSIDSensor(TapoSensorEntity):
     """Tapo SSID sensor entity."""
 
+    _camDataKeys = ("connectionInformation",)
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(
@@ -216,10 +229,6 @@ class TapoSSIDSensor(TapoSensorEntity):
             None,
         )
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData: dict | None) -> None:
         """Update the entity."""
         if (
@@ -235,6 +244,7 @@ class TapoSSIDSensor(TapoSensorEntity):
 class TapoBatterySensor(TapoSensorEntity):
     """Tapo battery sensor entity."""
 
+    _camDataKeys = ("basic_info",)
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -254,10 +264,6 @@ class TapoBatterySensor(TapoSensorEntity):
             SensorDeviceClass.BATTERY,
         )
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData: dict | None) -> None:
         """Update the entity."""
         if not camData:
@@ -269,6 +275,7 @@ class TapoBatterySensor(TapoSensorEntity):
 class TapoHDDSensor(TapoSensorEntity):
     """Tapo HDD sensor entities."""
 
+    _camDataKeys = ("sdCardData",)
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
@@ -297,10 +304,6 @@ class TapoHDDSensor(TapoSensorEntity):
             None,
         )
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData: dict | None) -> None:
         """Update the entity."""
         state = STATE_UNAVAILABLE
@@ -339,10 +342,6 @@ class TapoSyncSensor(TapoSensorEntity):
             None,
         )
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData: dict | None) -> None:
         """Update the entity."""
         enable_media_sync = self._hass.data[DOMAIN][self._config_entry.entry_id][
@@ -364,7 +363,10 @@ class TapoSyncSensor(TapoSensorEntity):
             if not data["initialMediaScanDone"] or (
                 data["initialMediaScanDone"] and not data["mediaSyncRanOnce"]
             ):
-                self._attr_native_value = "Starting"
+                if data["thumbnailProgress"]:
+                    self._attr_native_value = data["thumbnailProgress"]
+                else:
+                    self._attr_native_value = "Starting"
             elif not data["mediaSyncAvailable"]:
                 self._attr_native_value = "No Recordings Found"
             elif data["downloadProgress"]:
@@ -378,9 +380,190 @@ class TapoSyncSensor(TapoSensorEntity):
             self._attr_native_value = "Idle"
 
 
+class TapoMediaSyncQueueSensor(TapoSensorEntity):
+    """Tapo media sync queue depth sensor."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "recordings"
+
+    def __init__(
+        self, entry: dict, hass: HomeAssistant, config_entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        TapoSensorEntity.__init__(
+            self,
+            "Recordings Synchronization Queue",
+            entry,
+            hass,
+            config_entry,
+            "mdi:tray-full",
+            None,
+        )
+
+    def updateTapo(self, camData: dict | None) -> None:
+        """Update the entity."""
+        queue = self._hass.data[DOMAIN][self._config_entry.entry_id]["mediaSyncQueue"]
+        self._attr_native_value = len(queue["jobs"])
+
+
+class TapoMediaSyncThroughputSensor(TapoSensorEntity):
+    """Tapo media sync throughput sensor."""
+
+    _attr_device_class = SensorDeviceClass.DATA_RATE
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfDataRate.BYTES_PER_SECOND
+    _attr_suggested_unit_of_measurement = UnitOfDataRate.KILOBYTES_PER_SECOND
+
+    def __init__(
+        self, entry: dict, hass: HomeAssistant, config_entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        TapoSensorEntity.__init__(
+            self,
+            "Recordings Synchronization Throughput",
+            entry,
+            hass,
+            config_entry,
+            "mdi:download-network",
+            None,
+        )
+
+    def updateTapo(self, camData: dict | None) -> None:
+        """Update the entity."""
+        queue = self._hass.data[DOMAIN][self._config_entry.entry_id]["mediaSyncQueue"]
+        self._attr_native_value = getMediaSyncThroughput(queue)
+
+
+class TapoControllerSessionsSensor(TapoSensorEntity):
+    """Tapo controller sessions sensor, counts controllers created for the host."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "sessions"
+
+    def __init__(
+        self, entry: dict, hass: HomeAssistant, config_entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        TapoSensorEntity.__init__(
+            self,
+            "Controller Sessions Created",
+            entry,
+            hass,
+            config_entry,
+            "mdi:lan-connect",
+            None,
+        )
+
+    def updateTapo(self, camData: dict | None) -> None:
+        """Update the entity."""
+        pool = getControllerPool(self._hass)
+        host = self._controller.host
+        self._attr_native_value = pool["created"].get(host, 0)
+        self._attr_extra_state_attributes = {
+            "reused_sessions": pool["reused"].get(host, 0)
+        }
+
+
+class TapoNextPollSensor(TapoSensorEntity):
+    """Tapo next poll sensor."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self, entry: dict, hass: HomeAssistant, config_entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        TapoSensorEntity.__init__(
+            self,
+            "Next Poll",
+            entry,
+            hass,
+            config_entry,
+            "mdi:timer-sync-outline",
+            SensorDeviceClass.TIMESTAMP,
+        )
+
+    def updateTapo(self, camData: dict | None) -> None:
+        """Update the entity."""
+        if not self._entry["nextUpdate"]:
+            self._attr_native_value = None
+        else:
+            self._attr_native_value = dt_util.utc_from_timestamp(
+                self._entry["nextUpdate"]
+            )
+        self._attr_extra_state_attributes = {
+            "effective_interval": self._entry["pollInterval"],
+            "failed_updates": self._entry["failedUpdates"],
+            "boosted": self._entry["pollBoostUntil"] > dt_util.utcnow().timestamp(),
+            "restoring": self._entry["restoring"],
+        }
+
+
+class TapoRequestsPerHourSensor(TapoSensorEntity):
+    """Tapo requests per hour sensor, for battery powered devices."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "requests/h"
+
+    def __init__(
+        self, entry: dict, hass: HomeAssistant, config_entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        TapoSensorEntity.__init__(
+            self,
+            "Requests Per Hour",
+            entry,
+            hass,
+            config_entry,
+            "mdi:swap-vertical",
+        )
+
+    def updateTapo(self, camData: dict | None) -> None:
+        """Update the entity."""
+        self._attr_native_value = getRequestsPerHour(
+            self._entry, dt_util.utcnow().timestamp()
+        )
+        self._attr_extra_state_attributes = {"budget": BATTERY_REQUEST_BUDGET}
+
+
+class TapoRadioOnTimeSensor(TapoSensorEntity):
+    """Tapo estimated radio on time sensor, for battery powered devices."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    def __init__(
+        self, entry: dict, hass: HomeAssistant, config_entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        TapoSensorEntity.__init__(
+            self,
+            "Estimated Radio On Time",
+            entry,
+            hass,
+            config_entry,
+            "mdi:access-point",
+            SensorDeviceClass.DURATION,
+        )
+
+    def updateTapo(self, camData: dict | None) -> None:
+        """Update the entity."""
+        self._attr_native_value = round(
+            getRadioOnTime(self._entry, dt_util.utcnow().timestamp())
+        )
+
+
 class TapoLastRebootTimeSensor(TapoSensorEntity):
     """Tapo last reboot time sensor."""
 
+    _camDataKeys = ("rebootLastTime",)
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -398,10 +581,6 @@ class TapoLastRebootTimeSensor(TapoSensorEntity):
             SensorDeviceClass.TIMESTAMP,
         )
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
-
     def updateTapo(self, camData: dict | None) -> None:
         """Update the entity."""
         if (
@@ -67,15 +67,14 @@ class TapoSirenEntity(SirenEntity, TapoEntity):
 
 
 class TapoSiren(TapoSirenEntity):
+    _camDataKeys = ("alarm_config", "alarm_status")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSirenEntity.__init__(self, "Siren", entry, hass, config_entry)
         self._turn_off_task = None
         self.is_hub = entry["camData"]["alarm_is_hubSiren"]
         self.sirenType = None
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self, duration: int | None = None, **kwargs) -> None:
         for kw in kwargs:
             LOGGER.debug(f"async_turn_on: Parameter '{kw}' not supported")
@@ -8,7 +8,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN, LOGGER, ENABLE_MEDIA_SYNC, MEDIA_SYNC_HOURS
 from .tapo.entities import TapoSwitchEntity
 from .utils import (
-    async_force_entry_refresh,
     check_and_create,
     check_functionality,
     getColdDirPathForEntry,
@@ -382,6 +381,8 @@ class TapoEnableMediaSyncSwitch(TapoSwitchEntity):
 
 
 class TapoChimeRingtoneSwitch(TapoSwitchEntity):
+    _camDataKeys = ("chimeAlarmConfigurations",)
+
     def __init__(
         self,
         entry: dict,
@@ -399,26 +400,21 @@ class TapoChimeRingtoneSwitch(TapoSwitchEntity):
             "mdi:bell-ring",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
-            self._controller.setChimeAlarmConfigure, self.macAddress, True
+        await self._async_write_batched(
+            {"_attr_state": "on"},
+            self._controller.setChimeAlarmConfigure,
+            self.macAddress,
+            True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
-            self._controller.setChimeAlarmConfigure, self.macAddress, False
+        await self._async_write_batched(
+            {"_attr_state": "off"},
+            self._controller.setChimeAlarmConfigure,
+            self.macAddress,
+            False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if (
@@ -438,6 +434,8 @@ class TapoChimeRingtoneSwitch(TapoSwitchEntity):
 
 
 class TapoDualLinkageTargetSwitch(TapoSwitchEntity):
+    _camDataKeys = ("dualLinkageTargetSetting",)
+
     def __init__(
         self, entry: dict, hass: HomeAssistant, config_entry, target_type: str
     ):
@@ -451,30 +449,21 @@ class TapoDualLinkageTargetSwitch(TapoSwitchEntity):
             config_entry,
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setLinkageTargetSetting,
             f"{self.target_type}_enabled",
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setLinkageTargetSetting,
             f"{self.target_type}_enabled",
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if (
@@ -492,6 +481,8 @@ class TapoDualLinkageTargetSwitch(TapoSwitchEntity):
 
 
 class TapoHDRSwitch(TapoSwitchEntity):
+    _camDataKeys = ("videoQualities",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -502,28 +493,19 @@ class TapoHDRSwitch(TapoSwitchEntity):
             "mdi:hdr",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setHDR,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setHDR,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if (
@@ -540,6 +522,8 @@ class TapoHDRSwitch(TapoSwitchEntity):
 
 
 class TapoRecordingPlanSwitch(TapoSwitchEntity):
+    _camDataKeys = ("recordPlan",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -550,28 +534,19 @@ class TapoRecordingPlanSwitch(TapoSwitchEntity):
             "mdi:record-rec",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setRecordPlan,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setRecordPlan,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData or "enabled" not in camData["recordPlan"]:
@@ -582,6 +557,8 @@ class TapoRecordingPlanSwitch(TapoSwitchEntity):
 
 
 class TapoMicrophoneMuteSwitch(TapoSwitchEntity):
+    _camDataKeys = ("microphoneMute",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -592,30 +569,21 @@ class TapoMicrophoneMuteSwitch(TapoSwitchEntity):
             "mdi:microphone-off",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setMicrophone,
             None,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setMicrophone,
             None,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData or "microphoneMute" not in camData:
@@ -626,6 +594,8 @@ class TapoMicrophoneMuteSwitch(TapoSwitchEntity):
 
 
 class TapoMicrophoneNoiseCancellationSwitch(TapoSwitchEntity):
+    _camDataKeys = ("microphoneNoiseCancelling",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -636,29 +606,19 @@ class TapoMicrophoneNoiseCancellationSwitch(TapoSwitchEntity):
             "mdi:microphone-settings",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
-            self._controller.setMicrophone, None, None, True
+        await self._async_write_batched(
+            {"_attr_state": "on"}, self._controller.setMicrophone, None, None, True
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setMicrophone,
             None,
             None,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData or "microphoneNoiseCancelling" not in camData:
@@ -669,6 +629,8 @@ class TapoMicrophoneNoiseCancellationSwitch(TapoSwitchEntity):
 
 
 class TapoNotificationsSwitch(TapoSwitchEntity):
+    _camDataKeys = ("notifications",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -679,28 +641,19 @@ class TapoNotificationsSwitch(TapoSwitchEntity):
             "mdi:bell",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setNotificationsEnabled,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setNotificationsEnabled,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -711,6 +664,8 @@ class TapoNotificationsSwitch(TapoSwitchEntity):
 
 
 class TapoAutoUpgradeSwitch(TapoSwitchEntity):
+    _camDataKeys = ("autoUpgradeEnabled",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -721,28 +676,19 @@ class TapoAutoUpgradeSwitch(TapoSwitchEntity):
             "mdi:cloud-download",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setFirmwareAutoUpgradeConfig,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setFirmwareAutoUpgradeConfig,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -753,6 +699,8 @@ class TapoAutoUpgradeSwitch(TapoSwitchEntity):
 
 
 class TapoAutomaticRebootSwitch(TapoSwitchEntity):
+    _camDataKeys = ("rebootEnabled",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -763,34 +711,25 @@ class TapoAutomaticRebootSwitch(TapoSwitchEntity):
             "mdi:restart-alert",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setReboot,
             True,
             None,
             None,
             30,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setReboot,
             False,
             None,
             None,
             30,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if (
@@ -805,6 +744,8 @@ class TapoAutomaticRebootSwitch(TapoSwitchEntity):
 
 
 class TapoRichNotificationsSwitch(TapoSwitchEntity):
+    _camDataKeys = ("rich_notifications",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -815,30 +756,21 @@ class TapoRichNotificationsSwitch(TapoSwitchEntity):
             "mdi:bell",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setNotificationsEnabled,
             None,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setNotificationsEnabled,
             None,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -849,6 +781,8 @@ class TapoRichNotificationsSwitch(TapoSwitchEntity):
 
 
 class TapoAlarmEventTypeSwitch(TapoSwitchEntity):
+    _camDataKeys = ("alert_event_types",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry, eventType: str):
         self.eventType = eventType
         TapoSwitchEntity.__init__(
@@ -860,30 +794,21 @@ class TapoAlarmEventTypeSwitch(TapoSwitchEntity):
             "mdi:exclamation",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setAlertEventType,
             self.eventType,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setAlertEventType,
             self.eventType,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -897,6 +822,9 @@ class TapoAlarmEventTypeSwitch(TapoSwitchEntity):
 
 
 class TapoLensDistortionCorrectionSwitch(TapoSwitchEntity):
+    _camDataKeys = ("lens_distrotion_correction",)
+    _refreshFunctions = ("getLensDistortionCorrection",)
+
     def __init__(
         self,
         entry: dict,
@@ -916,30 +844,21 @@ class TapoLensDistortionCorrectionSwitch(TapoSwitchEntity):
             "mdi:google-lens",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setLensDistortionCorrection,
             True,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setLensDistortionCorrection,
             False,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -953,31 +872,24 @@ class TapoLensDistortionCorrectionSwitch(TapoSwitchEntity):
 
 
 class TapoPrivacySwitch(TapoSwitchEntity):
+    _camDataKeys = ("privacy_mode",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(self, "Privacy", entry, hass, config_entry)
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setPrivacyMode,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await async_force_entry_refresh(self._hass, self._entry)
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setPrivacyMode,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await async_force_entry_refresh(self._hass, self._entry)
 
     def updateTapo(self, camData):
         if not camData:
@@ -1000,6 +912,8 @@ class TapoPrivacySwitch(TapoSwitchEntity):
 
 
 class TapoSmartTrackSwitch(TapoSwitchEntity):
+    _camDataKeys = ("smart_track_config",)
+
     def __init__(
         self, entry: dict, hass: HomeAssistant, config_entry, typeOfSmartTrack: str
     ):
@@ -1018,30 +932,21 @@ class TapoSmartTrackSwitch(TapoSwitchEntity):
             "mdi:eye-lock",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setSmartTrackConfig,
             self.typeOfSmartTrack,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setSmartTrackConfig,
             self.typeOfSmartTrack,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -1054,33 +959,26 @@ class TapoSmartTrackSwitch(TapoSwitchEntity):
 
 
 class TapoCoverSwitch(TapoSwitchEntity):
+    _camDataKeys = ("cover_config",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self, "Privacy Zones", entry, hass, config_entry, "mdi:eye-lock"
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setCoverConfig,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setCoverConfig,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -1091,33 +989,26 @@ class TapoCoverSwitch(TapoSwitchEntity):
 
 
 class TapoDiagnoseModeSwitch(TapoSwitchEntity):
+    _camDataKeys = ("diagnose_mode",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self, "Diagnose Mode", entry, hass, config_entry, "mdi:tools"
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setDiagnoseMode,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setDiagnoseMode,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -1128,33 +1019,26 @@ class TapoDiagnoseModeSwitch(TapoSwitchEntity):
 
 
 class TapoRecordAudioSwitch(TapoSwitchEntity):
+    _camDataKeys = ("record_audio",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self, "Record Audio", entry, hass, config_entry, "mdi:microphone"
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setRecordAudio,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setRecordAudio,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -1165,33 +1049,26 @@ class TapoRecordAudioSwitch(TapoSwitchEntity):
 
 
 class TapoIndicatorLedSwitch(TapoSwitchEntity):
+    _camDataKeys = ("led",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self, "Indicator LED", entry, hass, config_entry, "mdi:car-light-high"
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setLEDEnabled,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setLEDEnabled,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -1202,6 +1079,9 @@ class TapoIndicatorLedSwitch(TapoSwitchEntity):
 
 
 class TapoFlipSwitch(TapoSwitchEntity):
+    _camDataKeys = ("flip",)
+    _refreshFunctions = ("getImageFlipVertical",)
+
     def __init__(
         self,
         entry: dict,
@@ -1221,30 +1101,21 @@ class TapoFlipSwitch(TapoSwitchEntity):
             "mdi:flip-vertical",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setImageFlipVertical,
             True,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setImageFlipVertical,
             False,
             [self.chn_id] if self.chn_id else None,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -1258,33 +1129,26 @@ class TapoFlipSwitch(TapoSwitchEntity):
 
 
 class TapoAutoTrackSwitch(TapoSwitchEntity):
+    _camDataKeys = ("auto_track",)
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self, "Auto Track", entry, hass, config_entry, "mdi:radar"
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "on"},
             self._controller.setAutoTrackTarget,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_state": "off"},
             self._controller.setAutoTrackTarget,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if not camData:
@@ -1295,6 +1159,8 @@ class TapoAutoTrackSwitch(TapoSwitchEntity):
 
 
 class TapoPatrolModeSwitch(TapoSwitchEntity):
+    _camDataKeys = ("patrol_status", "privacy_mode")
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         TapoSwitchEntity.__init__(
             self,
@@ -1305,30 +1171,19 @@ class TapoPatrolModeSwitch(TapoSwitchEntity):
             "mdi:map-marker-path",
         )
 
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
-
     async def async_turn_on(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_is_on": True, "_attr_state": "on"},
             self._controller.setPatrolStatus,
             True,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_is_on = True
-            self._attr_state = "on"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
-        result = await self._hass.async_add_executor_job(
+        await self._async_write_batched(
+            {"_attr_is_on": False, "_attr_state": "off"},
             self._controller.setPatrolStatus,
             False,
         )
-        if "error_code" not in result or result["error_code"] == 0:
-            self._attr_is_on = False
-            self._attr_state = "off"
-        self.async_write_ha_state()
-        await self._coordinator.async_request_refresh()
 
     def updateTapo(self, camData):
         if (
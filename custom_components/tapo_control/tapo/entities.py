@@ -1,4 +1,4 @@
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.components.select import SelectEntity
@@ -15,10 +15,20 @@ from homeassistant.const import (
 )
 
 from ..const import BRAND, LOGGER
-from ..utils import build_device_info
+from ..utils import build_device_info, getRefreshSections, queueControllerWrite
 
 
 class TapoEntity(Entity):
+    # State is pushed from async_update_data through updateTapo,
+    # HA does not need to poll every entity separately.
+    _attr_should_poll = False
+    # camData keys read by updateTapo, state is only rewritten when one of
+    # them changes. None means the entity is refreshed on every update.
+    _camDataKeys = None
+    # pytapo getters re-queried after a write from this entity, when None the
+    # sections are looked up from _camDataKeys.
+    _refreshFunctions = None
+
     def __init__(self, entry: dict, name_suffix: str):
         self._entry = entry
         self._enabled = False
@@ -56,13 +66,56 @@ class TapoEntity(Entity):
 
     async def async_added_to_hass(self) -> None:
         self._enabled = True
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         self._enabled = False
 
+    async def async_update(self) -> None:
+        await self._coordinator.async_request_refresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Listening keeps the coordinator ticking, entities are updated
+        # from async_update_data directly.
+        pass
+
     def updateTapo(self, camData):
         pass
 
+    async def _async_write_batched(self, optimisticState: dict, function, *args):
+        # State is shown straight away and rolled back if the device rejects it.
+        previousState = {key: getattr(self, key) for key in optimisticState}
+        for key, value in optimisticState.items():
+            setattr(self, key, value)
+        self.async_write_ha_state()
+
+        def rollback():
+            for key, value in previousState.items():
+                if getattr(self, key) == optimisticState[key]:
+                    setattr(self, key, value)
+            self.async_write_ha_state()
+
+        try:
+            result = await queueControllerWrite(
+                self.hass,
+                self._entry,
+                function,
+                *args,
+                sections=getRefreshSections(self._refreshFunctions, self._camDataKeys),
+            )
+        except Exception:
+            rollback()
+            raise
+        if "error_code" in result and result["error_code"] != 0:
+            LOGGER.debug(
+                f"[{self.name}] Write rejected with error code {result['error_code']}."
+            )
+            rollback()
+        return result
+
 
 class TapoUpdateEntity(UpdateEntity, TapoEntity):
     def __init__(
@@ -80,7 +133,9 @@ class TapoUpdateEntity(UpdateEntity, TapoEntity):
         self._attr_icon = icon
         self._config_entry = config_entry
         self._attr_device_class = device_class
-        entry["entities"].append({"entity": self, "entry": entry})
+        entry["entities"].append(
+            {"entity": self, "entry": entry, "camData": entry["camData"]}
+        )
 
         TapoEntity.__init__(self, entry, name_suffix)
         UpdateEntity.__init__(self)
@@ -114,7 +169,9 @@ class TapoSwitchEntity(SwitchEntity, TapoEntity):
         self._attr_icon = icon
         self._config_entry = config_entry
         self._attr_device_class = device_class
-        entry["entities"].append({"entity": self, "entry": entry})
+        entry["entities"].append(
+            {"entity": self, "entry": entry, "camData": entry["camData"]}
+        )
         self.updateTapo(entry["camData"])
 
         TapoEntity.__init__(self, entry, name_suffix)
@@ -146,7 +203,9 @@ class TapoSensorEntity(SensorEntity, TapoEntity):
         self._attr_icon = icon
         self._attr_device_class = device_class
         self._config_entry = config_entry
-        entry["entities"].append({"entity": self, "entry": entry})
+        entry["entities"].append(
+            {"entity": self, "entry": entry, "camData": entry["camData"]}
+        )
 
         TapoEntity.__init__(self, entry, name_suffix)
         SensorEntity.__init__(self)
@@ -172,7 +231,9 @@ class TapoButtonEntity(ButtonEntity, TapoEntity):
         self._hass = hass
         self._attr_icon = icon
         self._attr_device_class = device_class
-        entry["entities"].append({"entity": self, "entry": entry})
+        entry["entities"].append(
+            {"entity": self, "entry": entry, "camData": entry["camData"]}
+        )
         self.updateTapo(entry["camData"])
 
         TapoEntity.__init__(self, entry, name_suffix)
@@ -199,7 +260,9 @@ class TapoBinarySensorEntity(BinarySensorEntity, TapoEntity):
         self._hass = hass
         self._attr_icon = icon
         self._attr_device_class = device_class
-        entry["entities"].append({"entity": self, "entry": entry})
+        entry["entities"].append(
+            {"entity": self, "entry": entry, "camData": entry["camData"]}
+        )
         self.updateTapo(entry["camData"])
 
         TapoEntity.__init__(self, entry, name_suffix)
@@ -226,7 +289,9 @@ class TapoLightEntity(LightEntity, TapoEntity):
         self._attr_icon = icon
         self._attr_device_class = device_class
         LOGGER.debug(f"Tapo {name_suffix} - init - append")
-        entry["entities"].append({"entity": self, "entry": entry})
+        entry["entities"].append(
+            {"entity": self, "entry": entry, "camData": entry["camData"]}
+        )
         LOGGER.debug(f"Tapo {name_suffix} - init - update")
         self.updateTapo(entry["camData"])
 
@@ -252,7 +317,9 @@ class TapoSelectEntity(SelectEntity, TapoEntity):
         self._attr_icon = icon
         self._attr_device_class = device_class
         LOGGER.debug(f"Tapo {name_suffix} - init - append")
-        entry["entities"].append({"entity": self, "entry": entry})
+        entry["entities"].append(
+            {"entity": self, "entry": entry, "camData": entry["camData"]}
+        )
         LOGGER.debug(f"Tapo {name_suffix} - init - update")
         self.updateTapo(entry["camData"])
 
@@ -286,7 +353,9 @@ class TapoNumberEntity(NumberEntity, TapoEntity):
         self._attr_icon = icon
         self._attr_device_class = device_class
         LOGGER.debug(f"Tapo {name_suffix} - init - append")
-        entry["entities"].append({"entity": self, "entry": entry})
+        entry["entities"].append(
+            {"entity": self, "entry": entry, "camData": entry["camData"]}
+        )
         LOGGER.debug(f"Tapo {name_suffix} - init - update")
         self.updateTapo(entry["camData"])
 
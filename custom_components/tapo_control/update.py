@@ -1,6 +1,6 @@
 from typing import Callable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
@@ -9,7 +9,7 @@ from homeassistant.helpers import device_registry as dr
 import datetime
 
 from .const import DOMAIN, LOGGER
-from .utils import build_device_info
+from .utils import build_device_info, invalidateCapabilities
 from .tapo.entities import TapoUpdateEntity
 
 
@@ -34,6 +34,8 @@ async def async_setup_entry(
 
 
 class TapoCamUpdate(UpdateEntity):
+    _attr_should_poll = False
+
     def __init__(self, entry: dict, hass: HomeAssistant, config_entry):
         self._in_progress = False
         self._hass = hass
@@ -88,6 +90,7 @@ class TapoCamUpdate(UpdateEntity):
                     deviceRegistry.async_update_device(
                         device.id, sw_version=newDeviceInfo["sw_version"]
                     )
+                    invalidateCapabilities(self._hass, self._entry)
                     # Reset check for firmware check
                     self._entry["lastFirmwareCheck"] = 0
                     self._in_progress = False
@@ -95,6 +98,13 @@ class TapoCamUpdate(UpdateEntity):
 
     async def async_added_to_hass(self) -> None:
         self._enabled = True
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        pass
 
     async def async_will_remove_from_hass(self) -> None:
         self._enabled = False
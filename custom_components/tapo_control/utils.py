@@ -1,13 +1,15 @@
 import asyncio
 import datetime
 import hashlib
+import ipaddress
+import json
 import pathlib
 import onvif
 import os
+import random
 import shutil
-import socket
+import time
 import urllib.parse
-import uuid
 import requests
 import base64
 
@@ -15,8 +17,10 @@ from functools import partial
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.storage import Store
 from pytapo.media_stream.downloader import Downloader
 from homeassistant.components.media_source.error import Unresolvable
+from homeassistant.components.http.auth import async_sign_path
 
 from haffmpeg.tools import IMAGE_JPEG, ImageFrame
 from onvif import ONVIFCamera
@@ -41,15 +45,36 @@ from homeassistant.const import (
 from homeassistant.util import slugify, dt as dt_util
 
 from .const import (
+    BATTERY_RADIO_TAIL,
+    BATTERY_REQUEST_BUDGET,
+    BATTERY_REQUEST_WINDOW,
     BRAND,
     CONF_TRANSPORT_METHOD,
     CONTROL_PORT,
     DOMAIN_CONFIG,
+    DOMAIN_PORT_PROBE,
+    DOMAIN_CONTROLLERS,
+    DOMAIN_CAPABILITIES,
+    CAPABILITY_CACHE_SAVE_DELAY,
+    CAPABILITY_UNSUPPORTED_ERRORS,
+    CAM_DATA_SNAPSHOT_SAVE_DELAY,
+    IS_KLAP_DEVICE,
+    CONTROLLER_POOL_IDLE_TIME,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_PROBE_TIMEOUT,
+    KLAP_HTTP_PORT,
+    POLL_BACKOFF_MAX,
+    POLL_BOOST_DURATION,
+    POLL_BOOST_INTERVAL,
+    POLL_JITTER,
+    PORT_PROBE_CACHE_TIME,
+    PORT_PROBE_TIMEOUT,
     ENABLE_MEDIA_SYNC,
     ENABLE_MOTION_SENSOR,
     DOMAIN,
     ENABLE_WEBHOOKS,
-    HOT_DIR_DELETE_TIME,
+    MEDIA_URL_EXPIRY,
+    THUMBNAIL_FFMPEG_ARGS,
     LOGGER,
     CLOUD_PASSWORD,
     ENABLE_TIME_SYNC,
@@ -59,12 +84,21 @@ from .const import (
     CONF_CUSTOM_STREAM_7,
     MEDIA_SYNC_COLD_STORAGE_PATH,
     MEDIA_SYNC_HOURS,
+    MEDIA_SYNC_QUEUE_SAVE_DELAY,
+    MEDIA_SYNC_MAX_RETRIES,
+    MEDIA_SYNC_RETRY_DELAY,
+    MEDIA_SYNC_THROUGHPUT_WINDOW,
+    MEDIA_SYNC_WORKERS,
+    RECORDINGS_INDEX_MAX_AGE,
+    RECORDINGS_INDEX_SAVE_DELAY,
     TIME_SYNC_DST,
     TIME_SYNC_NDST,
     TPLINK_DOMAIN,
+    UPDATE_INTERVAL_BATTERY,
+    UPDATE_INTERVAL_MAIN,
+    WRITE_BATCH_WINDOW,
 )
 
-UUID = uuid.uuid4().hex
 ALARM_CONFIG_TYPES = ("getAlarm", "getAlarmConfig", "getAlertConfig")
 
 
@@ -90,17 +124,24 @@ def isUsingHTTPS(hass):
     return URL(base_url).scheme == "https"
 
 
-def mark_entry_data_for_refresh(hass: HomeAssistant, entry: dict) -> None:
+def get_root_entry_data(hass: HomeAssistant, entry: dict) -> dict:
     config_entry = entry.get("entry")
     root_entry = (
         hass.data.get(DOMAIN, {}).get(config_entry.entry_id) if config_entry else None
     )
     if root_entry is None:
         root_entry = entry
+    return root_entry
+
+
+def mark_entry_data_for_refresh(hass: HomeAssistant, entry: dict) -> None:
+    root_entry = get_root_entry_data(hass, entry)
 
     root_entry["lastUpdate"] = 0
+    root_entry["nextUpdate"] = 0
     for child in root_entry.get("childDevices", []):
         child["lastUpdate"] = 0
+        child["nextUpdate"] = 0
 
 
 async def async_force_entry_refresh(hass: HomeAssistant, entry: dict) -> None:
@@ -108,6 +149,245 @@ async def async_force_entry_refresh(hass: HomeAssistant, entry: dict) -> None:
     await entry["coordinator"].async_request_refresh()
 
 
+def isRunningOnBattery(camData) -> bool:
+    basicInfo = camData.get("basic_info", {}) if camData else {}
+    powerSources = (basicInfo.get("power"), basicInfo.get("power_mode"))
+    return "BATTERY" in powerSources or "SOLAR" in powerSources
+
+
+def getPollInterval(device: dict, ts: float) -> float:
+    # Battery devices keep their configured interval, mains powered ones poll
+    # faster for a while after activity. Unreachable devices back off.
+    if device["isRunningOnBattery"]:
+        interval = device["entry"].data.get(UPDATE_INTERVAL_BATTERY)
+    else:
+        interval = device["entry"].data.get(UPDATE_INTERVAL_MAIN)
+        if ts < device["pollBoostUntil"]:
+            interval = min(interval, POLL_BOOST_INTERVAL)
+    if device["failedUpdates"]:
+        interval = min(
+            interval * 2 ** min(device["failedUpdates"], 10),
+            max(interval, POLL_BACKOFF_MAX),
+        )
+    return interval
+
+
+def scheduleNextPoll(device: dict, ts: float) -> None:
+    # Jitter keeps devices configured with the same interval from polling
+    # in the same coordinator tick.
+    device["pollInterval"] = getPollInterval(device, ts)
+    device["nextUpdate"] = ts + device["pollInterval"] * random.uniform(
+        1 - POLL_JITTER, 1 + POLL_JITTER
+    )
+
+
+def boostPolling(device: dict) -> None:
+    if device["isRunningOnBattery"]:
+        return
+    ts = datetime.datetime.utcnow().timestamp()
+    device["pollBoostUntil"] = ts + POLL_BOOST_DURATION
+    device["nextUpdate"] = min(device["nextUpdate"], ts + POLL_BOOST_INTERVAL)
+
+
+def addEventsBoostListener(entryData: dict) -> None:
+    # The events manager notifies its listeners after every pull, polling is
+    # only boosted when one of the ONVIF event states actually changed.
+    events = entryData["events"]
+    eventStates = {}
+
+    def checkEventStates():
+        changed = False
+        for uid in events.get_uids_by_platform("binary_sensor"):
+            event = events.get_uid(uid)
+            value = event.value if event is not None else None
+            if eventStates.get(uid, False) != value:
+                changed = True
+            eventStates[uid] = value
+        if changed:
+            boostPolling(entryData)
+
+    removeEventsBoostListener(entryData)
+    entryData["eventsBoostUnsub"] = events.async_add_listener(checkEventStates)
+
+
+def removeEventsBoostListener(entryData: dict) -> None:
+    if entryData.get("eventsBoostUnsub"):
+        entryData["eventsBoostUnsub"]()
+        entryData["eventsBoostUnsub"] = False
+
+
+def recordDeviceRequest(device: dict, start: float, end: float) -> None:
+    # Requests of the last BATTERY_REQUEST_WINDOW, used to tell how often and
+    # for how long the radio of battery devices was woken up.
+    requestLog = device["requestLog"]
+    requestLog.append((start, end))
+    while requestLog and requestLog[0][1] < end - BATTERY_REQUEST_WINDOW:
+        requestLog.pop(0)
+
+
+async def trackDeviceRequest(device: dict, awaitable):
+    start = datetime.datetime.utcnow().timestamp()
+    try:
+        return await awaitable
+    finally:
+        recordDeviceRequest(device, start, datetime.datetime.utcnow().timestamp())
+
+
+def getRequestsPerHour(device: dict, ts: float) -> int:
+    return sum(
+        1 for _, end in device["requestLog"] if end >= ts - BATTERY_REQUEST_WINDOW
+    )
+
+
+def getRadioOnTime(device: dict, ts: float) -> float:
+    # The radio stays on for BATTERY_RADIO_TAIL after a request, overlapping
+    # requests are counted as a single wake-up.
+    radioOnTime = 0
+    awakeUntil = ts - BATTERY_REQUEST_WINDOW
+    for start, end in device["requestLog"]:
+        start = max(start, awakeUntil)
+        end = min(end + BATTERY_RADIO_TAIL, ts)
+        if end > start:
+            radioOnTime += end - start
+            awakeUntil = end
+    return radioOnTime
+
+
+def canRunMaintenance(device: dict, ts: float) -> bool:
+    # Non-urgent calls to battery devices only ride along with a wake-up that
+    # already happened, and wait while the device is over its hourly budget.
+    if not device["isRunningOnBattery"]:
+        return True
+    if getRequestsPerHour(device, ts) >= BATTERY_REQUEST_BUDGET:
+        LOGGER.debug(f"{device['name']} is over its request budget.")
+        return False
+    return bool(device["requestLog"]) and (
+        device["requestLog"][-1][1] + BATTERY_RADIO_TAIL >= ts
+    )
+
+
+async def async_refresh_entry_sections(
+    hass: HomeAssistant, entry: dict, sections=None
+) -> None:
+    # Re-queries only the given getMost sections of a single device and pushes
+    # the merged camData to its entities, falls back to a full entry refresh.
+    previousCamData = entry.get("camData")
+    if not sections or not previousCamData or not previousCamData.get("raw"):
+        await async_force_entry_refresh(hass, entry)
+        return
+    previousRaw = previousCamData["raw"]
+    omitSections = [section for section in previousRaw if section not in sections]
+    try:
+        data, dataHashes = await trackDeviceRequest(
+            entry,
+            hass.async_add_executor_job(
+                getMostWithHashes,
+                entry["controller"],
+                getChannelIds(entry.get("chInfo")),
+                omitSections,
+            ),
+        )
+        # getMost returns [False] for every omitted method, only the requested
+        # sections replace the cached ones.
+        refreshedSections = [section for section in sections if section in data]
+        sectionHashes = previousCamData.get("sectionHashes")
+        if sectionHashes:
+            sectionHashes = {
+                **sectionHashes,
+                **{section: dataHashes.get(section) for section in refreshedSections},
+            }
+        camData = parseCamData(
+            entry["controller"],
+            {
+                **previousRaw,
+                **{section: data[section] for section in refreshedSections},
+            },
+            entry.get("chInfo"),
+            previousCamData,
+            sectionHashes,
+        )
+    except Exception as err:
+        LOGGER.warning(
+            f"[async_refresh_entry_sections] Falling back to full refresh: {err}"
+        )
+        await async_force_entry_refresh(hass, entry)
+        return
+    LOGGER.debug(f"[async_refresh_entry_sections] Refreshed {sorted(sections)}.")
+    entry["camData"] = camData
+    for entity in entry.get("entities", []):
+        if not entity["entity"]._enabled:
+            continue
+        if camDataKeysChanged(
+            entity.get("camData"), camData, entity["entity"]._camDataKeys
+        ):
+            entity["entity"].updateTapo(camData)
+            entity["entity"].async_write_ha_state()
+        entity["camData"] = camData
+
+
+async def queueControllerWrite(
+    hass: HomeAssistant, entry: dict, function, *args, sections=None
+):
+    # Writes issued within WRITE_BATCH_WINDOW of each other, for the device and
+    # all of its children, share one executor job and one refresh of the
+    # sections they touched.
+    rootEntry = get_root_entry_data(hass, entry)
+    batch = rootEntry.get("writeBatch")
+    if batch is None:
+        batch = rootEntry["writeBatch"] = []
+        hass.loop.call_later(
+            WRITE_BATCH_WINDOW,
+            lambda: hass.async_create_task(flushControllerWrites(hass, rootEntry)),
+        )
+    future = hass.loop.create_future()
+    batch.append((function, args, future, entry, sections))
+    return await future
+
+
+async def flushControllerWrites(hass: HomeAssistant, rootEntry: dict):
+    batch = rootEntry.get("writeBatch") or []
+    rootEntry["writeBatch"] = None
+    if not batch:
+        return
+
+    def runWrites():
+        results = []
+        for function, args, *_ in batch:
+            try:
+                results.append((function(*args), None))
+            except Exception as err:
+                results.append((None, err))
+        return results
+
+    LOGGER.debug(f"[flushControllerWrites] Sending {len(batch)} batched writes.")
+    start = datetime.datetime.utcnow().timestamp()
+    try:
+        results = await hass.async_add_executor_job(runWrites)
+    except Exception as err:
+        results = [(None, err)] * len(batch)
+    end = datetime.datetime.utcnow().timestamp()
+    for entry in {id(entry): entry for _, _, _, entry, _ in batch}.values():
+        recordDeviceRequest(entry, start, end)
+    refreshSections = {}
+    fullRefresh = False
+    for (_, _, future, entry, sections), (result, err) in zip(batch, results):
+        boostPolling(entry)
+        if sections is None:
+            fullRefresh = True
+        else:
+            refreshSections.setdefault(id(entry), (entry, set()))[1].update(sections)
+        if future.done():
+            continue
+        if err is not None:
+            future.set_exception(err)
+        else:
+            future.set_result(result)
+    if fullRefresh:
+        await rootEntry["coordinator"].async_request_refresh()
+    for entry, sections in refreshSections.values():
+        await async_refresh_entry_sections(hass, entry, sections)
+
+
 def getStreamSource(entry, stream):
     custom_stream_hd = entry.data.get(CONF_CUSTOM_STREAM_HD, "")
     custom_stream_sd = entry.data.get(CONF_CUSTOM_STREAM_SD, "")
@@ -174,7 +454,7 @@ def registerController(
         password_cloud,
         super_secret_key,
         device_id,
-        reuseSession=False,
+        reuseSession=True,
         printDebugInformation=pytapoLog,
         printWarnInformation=pytapoWarnLog,
         retryStok=False,
@@ -185,15 +465,202 @@ def registerController(
     )
 
 
-def isOpen(ip, port):
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.settimeout(3)
+def getControllerPool(hass):
+    return hass.data.setdefault(
+        DOMAIN_CONTROLLERS,
+        {"controllers": {}, "created": {}, "reused": {}},
+    )
+
+
+async def acquireController(
+    hass,
+    host,
+    controlPort,
+    username,
+    password,
+    cloudPassword="",
+    superSecretKey="",
+    isKlap=None,
+    deviceId=None,
+):
+    # Controllers are shared per host, credentials and child device, a released
+    # controller is kept for CONTROLLER_POOL_IDLE_TIME so that reloads reuse its
+    # session. Children get their own controller, pytapo keeps the login state
+    # on the instance.
+    pool = getControllerPool(hass)
+    key = (
+        host,
+        int(controlPort),
+        username,
+        password,
+        cloudPassword,
+        superSecretKey,
+        deviceId,
+    )
+    pooled = pool["controllers"].get(key)
+    if pooled is None:
+        LOGGER.debug(f"[acquireController][{host}] Creating new controller.")
+        pooled = {
+            "controller": None,
+            "refs": 0,
+            "closeHandle": None,
+            "future": hass.async_add_executor_job(
+                registerController,
+                host,
+                controlPort,
+                username,
+                password,
+                cloudPassword,
+                superSecretKey,
+                deviceId,
+                isKlap,
+                hass,
+            ),
+        }
+        pool["controllers"][key] = pooled
+        pool["created"][host] = pool["created"].get(host, 0) + 1
+    else:
+        LOGGER.debug(f"[acquireController][{host}] Reusing pooled controller.")
+        pool["reused"][host] = pool["reused"].get(host, 0) + 1
+
+    pooled["refs"] += 1
+    if pooled["closeHandle"] is not None:
+        pooled["closeHandle"].cancel()
+        pooled["closeHandle"] = None
     try:
-        s.connect((ip, int(port)))
-        s.shutdown(2)
-        return True
+        pooled["controller"] = await asyncio.shield(pooled["future"])
     except Exception:
+        pooled["refs"] -= 1
+        if pool["controllers"].get(key) is pooled:
+            pool["controllers"].pop(key)
+        raise
+    return pooled["controller"]
+
+
+async def closePooledController(hass, key):
+    pool = getControllerPool(hass)
+    pooled = pool["controllers"].get(key)
+    if pooled is None or pooled["refs"] > 0:
+        return
+    pool["controllers"].pop(key)
+    LOGGER.debug(f"[closePooledController][{key[0]}] Closing controller.")
+    try:
+        await hass.async_add_executor_job(pooled["controller"].close)
+    except Exception as err:
+        LOGGER.debug("Error closing controller: %s", err)
+
+
+async def releaseController(hass, controller, closeNow=False):
+    pool = getControllerPool(hass)
+    for key, pooled in pool["controllers"].items():
+        if pooled["controller"] is controller:
+            pooled["refs"] -= 1
+            if pooled["refs"] <= 0:
+                if closeNow:
+                    await closePooledController(hass, key)
+                else:
+                    pooled["closeHandle"] = hass.loop.call_later(
+                        CONTROLLER_POOL_IDLE_TIME,
+                        lambda: hass.async_create_task(
+                            closePooledController(hass, key)
+                        ),
+                    )
+            return
+    try:
+        await hass.async_add_executor_job(controller.close)
+    except Exception as err:
+        LOGGER.debug("Error closing controller: %s", err)
+
+
+async def probePort(host, port):
+    try:
+        _, writer = await asyncio.open_connection(host, port)
+    except OSError:
         return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+async def probePorts(hass, host, ports, timeout=PORT_PROBE_TIMEOUT, cacheClosed=True):
+    # All ports share one timeout deadline, results are cached per
+    # host and port so that repeated checks within a flow are free.
+    # Probes with a shorter timeout should not cache closed ports.
+    cache = hass.data.setdefault(DOMAIN_PORT_PROBE, {})
+    now = time.monotonic()
+    for key, cached in list(cache.items()):
+        if now - cached[0] >= PORT_PROBE_CACHE_TIME:
+            cache.pop(key)
+    results = {}
+    pendingPorts = []
+    for port in {int(port) for port in ports}:
+        cached = cache.get((host, port))
+        if cached is not None and now - cached[0] < PORT_PROBE_CACHE_TIME:
+            results[port] = cached[1]
+        else:
+            pendingPorts.append(port)
+
+    if pendingPorts:
+        LOGGER.debug(f"[probePorts][{host}] Probing ports {pendingPorts}.")
+        tasks = [asyncio.create_task(probePort(host, port)) for port in pendingPorts]
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        now = time.monotonic()
+        for port, task in zip(pendingPorts, tasks):
+            results[port] = task in done and task.result()
+            if results[port] or cacheClosed:
+                cache[(host, port)] = (now, results[port])
+    return results
+
+
+async def isOpen(hass, host, port):
+    return (await probePorts(hass, host, (port,)))[int(port)]
+
+
+async def scanNetwork(hass, network):
+    # Probes every host of network with DISCOVERY_CONCURRENCY hosts at a time,
+    # cameras answering on all of their ports are ranked first.
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def scanHost(host):
+        async with semaphore:
+            ports = await probePorts(
+                hass,
+                host,
+                (443, 554, 2020, KLAP_HTTP_PORT),
+                timeout=DISCOVERY_PROBE_TIMEOUT,
+                cacheClosed=False,
+            )
+            if ports[443] and (ports[554] or ports[2020]):
+                return {
+                    "host": host,
+                    "controlPort": 443,
+                    "isKLAP": False,
+                    "score": ports[443] + ports[554] + ports[2020],
+                }
+            if ports[KLAP_HTTP_PORT] and await hass.async_add_executor_job(
+                isKLAP, host, KLAP_HTTP_PORT, DISCOVERY_PROBE_TIMEOUT
+            ):
+                return {
+                    "host": host,
+                    "controlPort": KLAP_HTTP_PORT,
+                    "isKLAP": True,
+                    "score": 1,
+                }
+        return None
+
+    LOGGER.debug(f"[scanNetwork] Scanning {network}...")
+    results = await asyncio.gather(*(scanHost(str(host)) for host in network.hosts()))
+    devices = sorted(
+        (result for result in results if result is not None),
+        key=lambda device: (-device["score"], ipaddress.ip_address(device["host"])),
+    )
+    LOGGER.debug(f"[scanNetwork] Found {len(devices)} devices in {network}.")
+    return devices
 
 
 def getDataPath():
@@ -230,19 +697,9 @@ def getColdDirPathForEntry(hass: HomeAssistant, entry_id: str):
 
 
 def getHotDirPathForEntry(hass: HomeAssistant, entry_id: str):
-    if hass.data[DOMAIN][entry_id]["mediaSyncHotDir"] is not False:
-        return hass.data[DOMAIN][entry_id]["mediaSyncHotDir"].rstrip("/")
-
-    hotDirPath = os.path.join(getDataPath(), f"www/{DOMAIN}/{entry_id}/")
-
-    if entry_id in hass.data[DOMAIN]:
-        if hass.data[DOMAIN][entry_id]["mediaSyncHotDir"] is False:
-            pathlib.Path(hotDirPath + "/videos").mkdir(parents=True, exist_ok=True)
-            pathlib.Path(hotDirPath + "/thumbs").mkdir(parents=True, exist_ok=True)
-            hass.data[DOMAIN][entry_id]["mediaSyncHotDir"] = hotDirPath
-
-        hotDirPath = hass.data[DOMAIN][entry_id]["mediaSyncHotDir"]
-    return hotDirPath.rstrip("/")
+    # Media used to be copied here to be served from /local/, the folder is
+    # only kept to remove what older versions left behind.
+    return os.path.join(getDataPath(), f"www/{DOMAIN}/{entry_id}")
 
 
 async def getRecordings(hass, entryData, tapoController, date):
@@ -274,6 +731,200 @@ async def getRecordings(hass, entryData, tapoController, date):
     return recordingsForDay
 
 
+def getCamDataSnapshotStorageFile(config_entry):
+    return f"tapo_control_{config_entry.entry_id}_snapshot"
+
+
+async def setupCamDataSnapshot(hass, entry):
+    storage = Store(hass, version=1, key=getCamDataSnapshotStorageFile(entry))
+    storedData = await storage.async_load()
+    return storage, storedData if storedData else {"devices": {}}
+
+
+def saveCamDataSnapshot(hass, entry):
+    # Only the raw getMost responses are kept, camData is parsed from them
+    # again on restore. Mains powered devices are only written out when their
+    # data changed, battery ones also to keep their poll timing.
+    entryData = hass.data[DOMAIN][entry.entry_id]
+    savedRaw = entryData["snapshotRaw"]
+    changed = False
+    for devId, device in entryData["devicesById"].items():
+        if not device["camData"] or "raw" not in device["camData"]:
+            continue
+        if device["isRunningOnBattery"] or (
+            savedRaw.get(devId) != device["camData"]["raw"]
+        ):
+            changed = True
+        savedRaw[devId] = device["camData"]["raw"]
+    if not changed:
+        return
+
+    def snapshot():
+        return {
+            "timezoneOffset": entryData["timezoneOffset"],
+            "devices": {
+                devId: {
+                    "raw": device["camData"]["raw"],
+                    "chInfo": device["chInfo"],
+                    "updated": device["lastUpdate"],
+                }
+                for devId, device in entryData["devicesById"].items()
+                if device["camData"] and "raw" in device["camData"]
+            },
+        }
+
+    entryData["snapshotStorage"].async_delay_save(
+        snapshot, CAM_DATA_SNAPSHOT_SAVE_DELAY
+    )
+
+
+def restoreCamData(controller, deviceSnapshot):
+    if not deviceSnapshot:
+        return None
+    try:
+        chInfo = deviceSnapshot["chInfo"]
+        return chInfo, parseCamData(controller, deviceSnapshot["raw"], chInfo)
+    except Exception as err:
+        LOGGER.debug(f"Failed to restore device data from snapshot: {err}")
+        return None
+
+
+def scheduleRestoredPoll(device: dict, deviceSnapshot: dict) -> None:
+    # Battery devices are not woken up before their next poll is due,
+    # counted from the last successful update before the restart.
+    device["lastUpdate"] = deviceSnapshot.get("updated", 0)
+    if device["isRunningOnBattery"] and device["lastUpdate"]:
+        device["pollInterval"] = getPollInterval(device, device["lastUpdate"])
+        device["nextUpdate"] = device["lastUpdate"] + device["pollInterval"]
+
+
+async def getChannelsInfo(hass, controller):
+    try:
+        chInfo = await hass.async_add_executor_job(controller.getAllChnInfo)
+        return chInfo["system"]["chn_info"]
+    except Exception as err:
+        LOGGER.debug(f"Failed to retrieve channels info: {err}")
+        return None
+
+
+async def getTimezoneOffset(hass, controller):
+    LOGGER.debug("Retrieving camera time.")
+    cameraTime = await hass.async_add_executor_job(controller.getTime)
+    if not controller.isKLAP:
+        cameraTS = cameraTime["system"]["clock_status"]["seconds_from_1970"]
+    else:
+        cameraTS = cameraTime["timestamp"]
+    LOGGER.debug("Retrieved camera time.")
+    timezoneOffset = cameraTS - dt_util.as_timestamp(dt_util.now())
+    LOGGER.debug(f"Timezone offset is {timezoneOffset}.")
+    return timezoneOffset
+
+
+def getRecordingsIndexStorageFile(config_entry):
+    return f"tapo_control_{config_entry.entry_id}_recordings_index"
+
+
+async def setupRecordingsIndex(hass, entry):
+    storage = Store(hass, version=1, key=getRecordingsIndexStorageFile(entry))
+    storedData = await storage.async_load()
+    hass.data[DOMAIN][entry.entry_id]["recordingsIndex"] = {
+        "storage": storage,
+        # childID ("" for the main device) -> date -> count and recordings
+        "devices": storedData["devices"] if storedData else {},
+        "lastUpdate": {},
+    }
+
+
+def getRecordingsIndexForDevice(hass, entryData):
+    childID = ""
+    if entryData["isChild"]:
+        childID = entryData["camData"]["basic_info"]["dev_id"]
+    recordingsIndex = hass.data[DOMAIN][entryData["entry"].entry_id]["recordingsIndex"]
+    return recordingsIndex, childID, recordingsIndex["devices"].setdefault(childID, {})
+
+
+async def refreshIndexedRecordings(hass, entryData, date):
+    recordingsIndex, _, deviceIndex = getRecordingsIndexForDevice(hass, entryData)
+    recordingsForDay = await getRecordings(
+        hass, entryData, entryData["controller"], date
+    )
+    if recordingsForDay is None:
+        recordingsForDay = []
+    deviceIndex[date] = {
+        "count": sum(len(recording) for recording in recordingsForDay),
+        "recordings": recordingsForDay,
+        "updated": datetime.datetime.utcnow().timestamp(),
+    }
+    recordingsIndex["storage"].async_delay_save(
+        lambda: {"devices": recordingsIndex["devices"]}, RECORDINGS_INDEX_SAVE_DELAY
+    )
+    return recordingsForDay
+
+
+async def updateRecordingsIndex(hass, entryData, refreshOldest=False):
+    # The dates list does not carry recording counts, so only days that are new
+    # and the newest day (where recordings are still being added) are queried.
+    # After the date rolls over the previously newest day is queried once more,
+    # it may have gained recordings after its last listing.
+    recordingsIndex, childID, deviceIndex = getRecordingsIndexForDevice(hass, entryData)
+    previousNewestDate = max(deviceIndex) if deviceIndex else None
+    recordingsList = await hass.async_add_executor_job(
+        entryData["controller"].getRecordingsList
+    )
+    recordingsDates = sorted(
+        searchResult[key]["date"]
+        for searchResult in recordingsList
+        for key in searchResult
+    )
+    for date in list(deviceIndex):
+        if date not in recordingsDates:
+            deviceIndex.pop(date)
+    for date in recordingsDates:
+        if (
+            date not in deviceIndex
+            or date == recordingsDates[-1]
+            or date == previousNewestDate
+            or (refreshOldest and date == recordingsDates[0])
+        ):
+            await refreshIndexedRecordings(hass, entryData, date)
+    recordingsIndex["lastUpdate"][childID] = datetime.datetime.utcnow().timestamp()
+    recordingsIndex["storage"].async_delay_save(
+        lambda: {"devices": recordingsIndex["devices"]}, RECORDINGS_INDEX_SAVE_DELAY
+    )
+    return recordingsDates
+
+
+async def getIndexedRecordingsDates(hass, entryData):
+    recordingsIndex, childID, deviceIndex = getRecordingsIndexForDevice(hass, entryData)
+    lastUpdate = recordingsIndex["lastUpdate"].get(childID, 0)
+    if datetime.datetime.utcnow().timestamp() - lastUpdate > RECORDINGS_INDEX_MAX_AGE:
+        return await updateRecordingsIndex(hass, entryData)
+    return sorted(deviceIndex)
+
+
+async def getIndexedRecordings(hass, entryData, date, maxAge=None):
+    # With maxAge set, the newest day is queried again once its listing is
+    # older than that, past days do not change anymore.
+    _, childID, deviceIndex = getRecordingsIndexForDevice(hass, entryData)
+    if date not in deviceIndex or (
+        maxAge is not None
+        and date == max(deviceIndex)
+        and datetime.datetime.utcnow().timestamp() - deviceIndex[date].get("updated", 0)
+        > maxAge
+    ):
+        return await refreshIndexedRecordings(hass, entryData, date)
+    recordingsForDay = deviceIndex[date]["recordings"]
+    for recording in recordingsForDay:
+        for recordingKey in recording:
+            entryData["mediaScanResult"][
+                ((childID + "-") if childID != "" else "")
+                + str(recording[recordingKey]["startTime"])
+                + "-"
+                + str(recording[recordingKey]["endTime"])
+            ] = True
+    return recordingsForDay
+
+
 def getEntryStorageFile(config_entry, child_id):
     return f"tapo_control_{config_entry.entry_id}{child_id}"
 
@@ -286,43 +937,39 @@ async def findMedia(hass, entryData, entry):
     childID = ""
     if entryData["isChild"]:
         childID = entryData["camData"]["basic_info"]["dev_id"]
-    tapoController: Tapo = entryData["controller"]
 
-    recordingsList = await hass.async_add_executor_job(tapoController.getRecordingsList)
+    recordingsDates = await updateRecordingsIndex(hass, entryData, refreshOldest=True)
+    mediaIndex = await getMediaIndex(hass, entry_id)
     mediaScanResult = {}
-    for searchResult in recordingsList:
-        for key in searchResult:
-            LOGGER.debug(f"Getting media for day {searchResult[key]['date']}...")
-            recordingsForDay = await getRecordings(
-                hass, entryData, tapoController, searchResult[key]["date"]
-            )
-            LOGGER.debug(
-                f"Looping through recordings for day {searchResult[key]['date']}..."
-            )
-            for recording in recordingsForDay:
-                for recordingKey in recording:
-                    filePathVideo = getColdFile(
-                        hass,
-                        entry_id,
-                        recording[recordingKey]["startTime"],
-                        recording[recordingKey]["endTime"],
-                        "videos",
-                        childID=childID,
-                    )
-                    mediaScanResult[
-                        ((childID + "-") if childID != "" else "")
-                        + str(recording[recordingKey]["startTime"])
-                        + "-"
-                        + str(recording[recordingKey]["endTime"])
-                    ] = True
-                    if os.path.exists(filePathVideo):
-                        await processDownload(
-                            hass,
-                            entry_id,
-                            entryData,
+    downloadedRecordings = []
+    for date in recordingsDates:
+        LOGGER.debug(f"Getting media for day {date}...")
+        recordingsForDay = await getIndexedRecordings(hass, entryData, date)
+        LOGGER.debug(f"Looping through recordings for day {date}...")
+        for recording in recordingsForDay:
+            for recordingKey in recording:
+                filePathVideo = getColdFile(
+                    hass,
+                    entry_id,
+                    recording[recordingKey]["startTime"],
+                    recording[recordingKey]["endTime"],
+                    "videos",
+                    childID=childID,
+                )
+                mediaScanResult[
+                    ((childID + "-") if childID != "" else "")
+                    + str(recording[recordingKey]["startTime"])
+                    + "-"
+                    + str(recording[recordingKey]["endTime"])
+                ] = True
+                if os.path.basename(filePathVideo) in mediaIndex["cold"]["videos"]:
+                    downloadedRecordings.append(
+                        (
                             recording[recordingKey]["startTime"],
                             recording[recordingKey]["endTime"],
                         )
+                    )
+    await processDownloads(hass, entry_id, entryData, downloadedRecordings)
     LOGGER.debug("Found media for " + entryData["name"] + ".")
     entryData["mediaScanResult"] = mediaScanResult
     entryData["initialMediaScanDone"] = True
@@ -344,6 +991,7 @@ async def processDownload(
 
     if not os.path.exists(coldFilePath):
         raise Unresolvable("Failed to get file from cold storage: " + coldFilePath)
+    indexMediaFile(hass, entry_id, "cold", "videos", coldFilePath)
 
     if filePath not in entryData["downloadedStreams"]:
         entryData["downloadedStreams"][filePath] = {
@@ -359,125 +1007,168 @@ async def processDownload(
     await generateThumb(hass, entry_id, startDate, endDate, childID=childID)
 
 
+async def processDownloads(hass, entry_id: int, entryData: dict, recordings: list):
+    # Thumbnails are generated concurrently, limited by the entry wide
+    # thumbnailSemaphore, progress is reported through thumbnailProgress.
+    processed = 0
+
+    async def process(startDate, endDate):
+        nonlocal processed
+        try:
+            await processDownload(hass, entry_id, entryData, startDate, endDate)
+        except Exception as err:
+            LOGGER.warning(
+                f"Failed to process recording {startDate}-{endDate} for {entryData['name']}: {err}"
+            )
+        processed += 1
+        entryData["thumbnailProgress"] = (
+            f"Generating thumbnails ({processed} / {len(recordings)})"
+        )
+
+    await asyncio.gather(
+        *(process(startDate, endDate) for startDate, endDate in recordings)
+    )
+    entryData["thumbnailProgress"] = False
+
+
 async def generateThumb(hass, entry_id, startDate: int, endDate: int, childID=""):
     filePathThumb = getColdFile(
         hass, entry_id, startDate, endDate, "thumbs", childID=childID
     )
-    if not os.path.exists(filePathThumb):
-        filePathVideo = getColdFile(
-            hass, entry_id, startDate, endDate, "videos", childID=childID
-        )
+    filePathVideo = getColdFile(
+        hass, entry_id, startDate, endDate, "videos", childID=childID
+    )
+    mediaIndex = await getMediaIndex(hass, entry_id)
+    thumb = mediaIndex["cold"]["thumbs"].get(os.path.basename(filePathThumb))
+    video = mediaIndex["cold"]["videos"].get(os.path.basename(filePathVideo))
+    if thumb is not None and (video is None or thumb["mtime"] >= video["mtime"]):
+        return filePathThumb
+
+    async with hass.data[DOMAIN][entry_id]["thumbnailSemaphore"]:
         _ffmpeg = hass.data[DATA_FFMPEG]
         ffmpeg = ImageFrame(_ffmpeg.binary)
+        # The first decoded frame of a recording is its first keyframe.
         image = await asyncio.shield(
             ffmpeg.get_image(
                 filePathVideo,
                 output_format=IMAGE_JPEG,
+                extra_cmd=THUMBNAIL_FFMPEG_ARGS,
             )
         )
-        openHandler = await hass.async_add_executor_job(open, filePathThumb, "wb")
-        with openHandler as binary_file:
-            binary_file.write(image)
+    if not image:
+        raise Unresolvable("Failed to generate thumbnail for " + filePathVideo)
+    await hass.async_add_executor_job(pathlib.Path(filePathThumb).write_bytes, image)
+    mediaIndex["cold"]["thumbs"].pop(os.path.basename(filePathThumb), None)
+    indexMediaFile(hass, entry_id, "cold", "thumbs", filePathThumb, len(image))
     return filePathThumb
 
 
-# todo: findMedia needs to run periodically because of this function!!!
-async def deleteFilesNoLongerPresentInCamera(
-    hass, entry_id, entryData, extension, folder
-):
-    LOGGER.debug("deleteFilesNoLongerPresentInCamera")
-    childID = ""
-    if entryData["isChild"]:
-        childID = entryData["camData"]["basic_info"]["dev_id"]
-    if entryData["initialMediaScanDone"] is True:
-        LOGGER.debug("deleteFilesNoLongerPresentInCamera - Initial scanning done.")
-        coldDirPath = getColdDirPathForEntry(hass, entry_id)
-        if os.path.exists(coldDirPath + "/" + folder + "/"):
-            LOGGER.debug("deleteFilesNoLongerPresentInCamera - path exists")
-            listDirFiles = await hass.async_add_executor_job(
-                os.listdir, coldDirPath + "/" + folder + "/"
-            )
-            for f in listDirFiles:
-                fileName = f.replace(extension, "")
-                filePath = os.path.join(coldDirPath + "/" + folder + "/", f)
-                if (
-                    (entryData["isChild"] is False and fileName.count("-") == 1)
-                    or (
-                        (entryData["isChild"] is True and fileName.count("-") == 2)
-                        and childID in fileName
-                    )
-                ) and fileName not in entryData["mediaScanResult"]:
-                    LOGGER.debug(
-                        "[deleteFilesNoLongerPresentInCamera] Removing "
-                        + filePath
-                        + " ("
-                        + fileName
-                        + ")..."
-                    )
-                    entryData["downloadedStreams"].pop(
-                        fileName,
-                        None,
-                    )
-                    os.remove(filePath)
+def parseMediaFileName(fileName):
+    nameParts = os.path.splitext(fileName)[0].split("-")
+    try:
+        if len(nameParts) == 2:
+            return {
+                "childID": "",
+                "startDate": int(nameParts[0]),
+                "endDate": int(nameParts[1]),
+            }
+        elif len(nameParts) == 3:
+            return {
+                "childID": nameParts[0],
+                "startDate": int(nameParts[1]),
+                "endDate": int(nameParts[2]),
+            }
+    except ValueError:
+        pass
+    return {"childID": None, "startDate": None, "endDate": None}
+
+
+def scanMediaDir(dirPath):
+    mediaFiles = {}
+    if os.path.isdir(dirPath):
+        with os.scandir(dirPath) as dirEntries:
+            for dirEntry in dirEntries:
+                if dirEntry.is_file():
+                    stat = dirEntry.stat()
+                    mediaFiles[dirEntry.name] = {
+                        **parseMediaFileName(dirEntry.name),
+                        "mtime": stat.st_mtime,
+                        "size": stat.st_size,
+                    }
+    return mediaFiles
 
 
-async def deleteColdFilesOlderThanMaxSyncTime(
-    hass, entry, entryData, extension, folder
-):
-    childID = ""
-    if entryData["isChild"]:
-        childID = entryData["camData"]["basic_info"]["dev_id"]
-    entry_id = entry.entry_id
-    mediaSyncHours = entry.data.get(MEDIA_SYNC_HOURS)
+def buildMediaIndex(coldDirPath):
+    return {
+        "cold": {
+            "videos": scanMediaDir(coldDirPath + "/videos/"),
+            "thumbs": scanMediaDir(coldDirPath + "/thumbs/"),
+        },
+    }
 
-    if mediaSyncHours != "":
-        coldDirPath = getColdDirPathForEntry(hass, entry_id)
-        tapoController: Tapo = entryData["controller"]
-        timeCorrection = await hass.async_add_executor_job(
-            tapoController.getTimeCorrection
+
+async def getMediaIndex(hass, entry_id):
+    # Built once per setup in the executor, then kept up to date by
+    # indexMediaFile and mediaCleanup instead of listing the folders again.
+    entryData = hass.data[DOMAIN][entry_id]
+    if entryData["mediaIndex"] is False:
+        entryData["mediaIndex"] = await hass.async_add_executor_job(
+            buildMediaIndex,
+            getColdDirPathForEntry(hass, entry_id),
         )
-        mediaSyncTime = int(mediaSyncHours) * 60 * 60
-        entry_id = entry.entry_id
-        ts = datetime.datetime.utcnow().timestamp()
-        if os.path.exists(coldDirPath + "/" + folder + "/"):
-            listDirFiles = await hass.async_add_executor_job(
-                os.listdir, coldDirPath + "/" + folder + "/"
-            )
-            for f in listDirFiles:
-                fileName = f.replace(extension, "")
-                filePath = os.path.join(coldDirPath + "/" + folder + "/", f)
-                splitFileName = fileName.split("-")
-                if (entryData["isChild"] is False and fileName.count("-") == 1) or (
-                    (entryData["isChild"] is True and fileName.count("-") == 2)
-                    and childID in fileName
-                ):
-                    endTS = int(fileName.split("-")[len(splitFileName) - 1])
-                    last_modified = os.stat(filePath).st_mtime
-                    if (endTS < (int(ts) - (int(mediaSyncTime) + timeCorrection))) and (
-                        ts - last_modified > int(mediaSyncTime)
-                    ):
-                        LOGGER.debug(
-                            "[deleteColdFilesOlderThanMaxSyncTime] Removing "
-                            + filePath
-                            + " ("
-                            + fileName
-                            + ") because it's older than "
-                            + str(mediaSyncTime)
-                            + " seconds..."
-                        )
-                        entryData["downloadedStreams"].pop(
-                            fileName,
-                            None,
-                        )
-                        os.remove(filePath)
-                else:
-                    LOGGER.debug(
-                        "[deleteColdFilesOlderThanMaxSyncTime] Ignoring "
-                        + filePath
-                        + " ("
-                        + fileName
-                        + ") because of incorrect file name format..."
-                    )
+    return entryData["mediaIndex"]
+
+
+def indexMediaFile(hass, entry_id, storage, folder, filePath, size=None):
+    mediaIndex = hass.data[DOMAIN][entry_id]["mediaIndex"]
+    fileName = os.path.basename(filePath)
+    if mediaIndex is False or fileName in mediaIndex[storage][folder]:
+        return
+    mediaIndex[storage][folder][fileName] = {
+        **parseMediaFileName(fileName),
+        "mtime": datetime.datetime.utcnow().timestamp(),
+        "size": size,
+    }
+
+
+def cleanupMediaFiles(
+    mediaIndex,
+    coldDirPath,
+    childID,
+    mediaScanResult,
+    oldestEndDate,
+    mediaSyncTime,
+    ts,
+):
+    # Runs in the executor, the index is only read here, removed files are
+    # returned so that they can be dropped from the index on the event loop.
+    removeFiles = []
+    for folder in ("videos", "thumbs"):
+        for fileName, mediaFile in list(mediaIndex["cold"][folder].items()):
+            if mediaFile["childID"] != childID:
+                continue
+            if (
+                mediaScanResult is not None
+                and os.path.splitext(fileName)[0] not in mediaScanResult
+            ):
+                # no longer present in camera
+                removeFiles.append(("cold", folder, fileName))
+            elif (
+                oldestEndDate is not None
+                and mediaFile["endDate"] < oldestEndDate
+                and ts - mediaFile["mtime"] > mediaSyncTime
+            ):
+                # older than media sync time
+                removeFiles.append(("cold", folder, fileName))
+
+    for storage, folder, fileName in removeFiles:
+        filePath = coldDirPath + "/" + folder + "/" + fileName
+        LOGGER.debug("[cleanupMediaFiles] Removing " + filePath + "...")
+        try:
+            os.remove(filePath)
+        except FileNotFoundError:
+            pass
+    return removeFiles
 
 
 async def mediaCleanup(hass, entry, deviceData):
@@ -497,42 +1188,40 @@ async def mediaCleanup(hass, entry, deviceData):
 
     ts = datetime.datetime.utcnow().timestamp()
     deviceData["lastMediaCleanup"] = ts
-    hotDirPath = getHotDirPathForEntry(hass, entry_id)
-
-    # clean cache files from old HA instance
-    LOGGER.debug(
-        "Removing cache files from old HA instances for entity "
-        + entry_id
-        + ", child ID:'"
-        + childID
-        + "..."
-    )
+    mediaIndex = await getMediaIndex(hass, entry_id)
 
-    await deleteFilesNotIncluding(hass, hotDirPath + "/videos/", UUID)
-    await deleteFilesNotIncluding(hass, hotDirPath + "/thumbs/", UUID)
-
-    await deleteFilesNoLongerPresentInCamera(
-        hass, entry_id, deviceData, ".mp4", "videos"
-    )
-    await deleteFilesNoLongerPresentInCamera(
-        hass, entry_id, deviceData, ".jpg", "thumbs"
+    oldestEndDate = None
+    mediaSyncTime = None
+    mediaSyncHours = entry.data.get(MEDIA_SYNC_HOURS)
+    if mediaSyncHours != "":
+        tapoController: Tapo = deviceData["controller"]
+        timeCorrection = await hass.async_add_executor_job(
+            tapoController.getTimeCorrection
+        )
+        mediaSyncTime = int(mediaSyncHours) * 60 * 60
+        oldestEndDate = int(ts) - (mediaSyncTime + timeCorrection)
+
+    removedFiles = await hass.async_add_executor_job(
+        cleanupMediaFiles,
+        mediaIndex,
+        getColdDirPathForEntry(hass, entry_id),
+        childID,
+        (
+            deviceData["mediaScanResult"]
+            if deviceData["initialMediaScanDone"] is True
+            else None
+        ),
+        oldestEndDate,
+        mediaSyncTime,
+        ts,
     )
-
-    await deleteColdFilesOlderThanMaxSyncTime(hass, entry, deviceData, ".mp4", "videos")
-    await deleteColdFilesOlderThanMaxSyncTime(hass, entry, deviceData, ".jpg", "thumbs")
-
-    # Delete everything other than HOT_DIR_DELETE_TIME seconds from hot storage
+    for storage, folder, fileName in removedFiles:
+        mediaIndex[storage][folder].pop(fileName, None)
+        if storage == "cold":
+            deviceData["downloadedStreams"].pop(os.path.splitext(fileName)[0], None)
     LOGGER.debug(
-        "Deleting hot storage files older than "
-        + str(HOT_DIR_DELETE_TIME)
-        + " seconds for entity "
-        + entry_id
-        + ", child ID:'"
-        + childID
-        + "..."
+        f"Media cleanup removed {len(removedFiles)} files for entity {entry_id}, child ID:'{childID}'."
     )
-    await deleteFilesOlderThan(hass, hotDirPath + "/videos/", HOT_DIR_DELETE_TIME)
-    await deleteFilesOlderThan(hass, hotDirPath + "/thumbs/", HOT_DIR_DELETE_TIME)
 
 
 async def deleteDir(hass, dirPath):
@@ -546,29 +1235,6 @@ async def deleteDir(hass, dirPath):
         await hass.async_add_executor_job(shutil.rmtree, dirPath)
 
 
-async def deleteFilesOlderThan(hass: HomeAssistant, dirPath, deleteOlderThan):
-    now = datetime.datetime.utcnow().timestamp()
-    if os.path.exists(dirPath):
-
-        listDirFiles = await hass.async_add_executor_job(os.listdir, dirPath)
-        for f in listDirFiles:
-            filePath = os.path.join(dirPath, f)
-            last_modified = os.stat(filePath).st_mtime
-            if now - last_modified > deleteOlderThan:
-                LOGGER.debug("[deleteFilesOlderThan] Removing " + filePath + "...")
-                os.remove(filePath)
-
-
-async def deleteFilesNotIncluding(hass: HomeAssistant, dirPath, includingString):
-    if os.path.exists(dirPath):
-        listDirFiles = await hass.async_add_executor_job(os.listdir, dirPath)
-        for f in listDirFiles:
-            filePath = os.path.join(dirPath, f)
-            if includingString not in filePath:
-                LOGGER.debug("[deleteFilesOlderThan] Removing " + filePath + "...")
-                os.remove(filePath)
-
-
 def processDownloadStatus(
     entryData,
     date: str,
@@ -633,27 +1299,8 @@ def getColdFile(
     return coldDirPath + "/" + folder + "/" + fileName + extension
 
 
-async def getHotFile(
-    hass: HomeAssistant,
-    entry_id: str,
-    startDate: int,
-    endDate: int,
-    folder: str,
-    childID="",
-):
-    coldFilePath = getColdFile(
-        hass, entry_id, startDate, endDate, folder, childID=childID
-    )
-    hotDirPath = getHotDirPathForEntry(hass, entry_id)
-    extension = pathlib.Path(coldFilePath).suffix
-    fileNameEncrypted = getFileName(startDate, endDate, True, childID=childID)
-    hotFilePath = f"{hotDirPath}/{folder}/{fileNameEncrypted}{UUID}{extension}"
-
-    if not os.path.exists(hotFilePath):
-        if not os.path.exists(coldFilePath):
-            raise Unresolvable("Failed to get file from cold storage: " + coldFilePath)
-        await hass.async_add_executor_job(shutil.copyfile, coldFilePath, hotFilePath)
-    return hotFilePath
+def getWebFilePath(entry_id: str, fileName: str, folder: str):
+    return f"/api/{DOMAIN}/media/{entry_id}/{folder}/{fileName}"
 
 
 async def getWebFile(
@@ -663,13 +1310,26 @@ async def getWebFile(
     endDate: int,
     folder: str,
     childID="",
+    sign=True,
 ):
-    hotFilePath = await getHotFile(
+    coldFilePath = getColdFile(
         hass, entry_id, startDate, endDate, folder, childID=childID
     )
-    fileWebPath = hotFilePath[hotFilePath.index("/www/") + 5 :]  # remove ./www/
-
-    return f"/local/{fileWebPath}"
+    # Files are looked up in the media index, the disk is only checked for
+    # files the index does not know about yet.
+    fileName = os.path.basename(coldFilePath)
+    indexed = False
+    if entry_id in hass.data[DOMAIN]:
+        mediaIndex = await getMediaIndex(hass, entry_id)
+        indexed = fileName in mediaIndex["cold"][folder]
+    if not indexed and not await hass.async_add_executor_job(
+        os.path.exists, coldFilePath
+    ):
+        raise Unresolvable("Failed to get file from cold storage: " + coldFilePath)
+    webPath = getWebFilePath(entry_id, fileName, folder)
+    if not sign:
+        return webPath
+    return async_sign_path(hass, webPath, datetime.timedelta(seconds=MEDIA_URL_EXPIRY))
 
 
 async def getRecording(
@@ -744,8 +1404,189 @@ async def getRecording(
     return coldFilePath
 
 
-def areCameraPortsOpened(host, controlPort=443):
-    return isOpen(host, int(controlPort)) and isOpen(host, 554) and isOpen(host, 2020)
+def getMediaSyncQueueStorageFile(config_entry):
+    return f"tapo_control_{config_entry.entry_id}_media_sync_queue"
+
+
+async def setupMediaSyncQueue(hass, entry):
+    # One queue per config entry, children of a hub share its workers.
+    storage = Store(hass, version=1, key=getMediaSyncQueueStorageFile(entry))
+    storedData = await storage.async_load()
+    hass.data[DOMAIN][entry.entry_id]["mediaSyncQueue"] = {
+        "storage": storage,
+        "jobs": storedData["jobs"] if storedData else {},
+        # jobs given up after MEDIA_SYNC_MAX_RETRIES, kept so they are not queued
+        # again until they leave the sync window
+        "failedJobs": storedData.get("failedJobs", {}) if storedData else {},
+        "wakeUp": asyncio.Event(),
+        "busyDevices": set(),
+        "downloads": [],  # (finished timestamp, bytes) used for throughput
+    }
+
+
+def saveMediaSyncQueue(queue):
+    queue["storage"].async_delay_save(
+        lambda: {"jobs": queue["jobs"], "failedJobs": queue["failedJobs"]},
+        MEDIA_SYNC_QUEUE_SAVE_DELAY,
+    )
+
+
+def queueMediaSyncDownload(queue, device, date, startDate, endDate):
+    childID = ""
+    if device["isChild"]:
+        childID = device["camData"]["basic_info"]["dev_id"]
+    jobID = getFileName(startDate, endDate, False, childID=childID)
+    if (
+        jobID in queue["jobs"]
+        or jobID in queue["failedJobs"]
+        or jobID in device["downloadedStreams"]
+    ):
+        return False
+    queue["jobs"][jobID] = {
+        "childID": childID,
+        "date": date,
+        "startDate": int(startDate),
+        "endDate": int(endDate),
+    }
+    return True
+
+
+def pruneMediaSyncQueue(queue, device, oldestEndDate):
+    childID = ""
+    if device["isChild"]:
+        childID = device["camData"]["basic_info"]["dev_id"]
+    for jobs in (queue["jobs"], queue["failedJobs"]):
+        for jobID, job in list(jobs.items()):
+            if job["childID"] == childID and job["endDate"] <= oldestEndDate:
+                jobs.pop(jobID)
+
+
+def getMediaSyncDevice(hass, entry_id, childID):
+    return hass.data[DOMAIN][entry_id]["devicesById"].get(childID)
+
+
+def takeMediaSyncJob(hass, entry_id, queue):
+    # Newest recordings first, at most one download per device at a time.
+    ts = datetime.datetime.utcnow().timestamp()
+    for jobID in sorted(
+        queue["jobs"], key=lambda jobID: queue["jobs"][jobID]["endDate"], reverse=True
+    ):
+        job = queue["jobs"][jobID]
+        if job["childID"] in queue["busyDevices"] or job.get("nextAttempt", 0) > ts:
+            continue
+        device = getMediaSyncDevice(hass, entry_id, job["childID"])
+        if device is None or not device[ENABLE_MEDIA_SYNC]:
+            LOGGER.debug(f"Dropping media sync job {jobID}, media sync is disabled.")
+            queue["jobs"].pop(jobID)
+            continue
+        if device["isDownloadingStream"] or not canRunMaintenance(device, ts):
+            continue
+        return jobID, job, device
+    return None
+
+
+def getMediaSyncRetryTimeout(queue):
+    # Seconds until the first postponed job is due, None without postponed jobs.
+    nextAttempts = [
+        job["nextAttempt"] for job in queue["jobs"].values() if "nextAttempt" in job
+    ]
+    if not nextAttempts:
+        return None
+    return max(0, min(nextAttempts) - datetime.datetime.utcnow().timestamp())
+
+
+def postponeMediaSyncJob(queue, jobID, job, countRetry=True):
+    # Failed downloads stay queued with an exponential backoff until
+    # MEDIA_SYNC_MAX_RETRIES is reached.
+    if countRetry:
+        job["retries"] = job.get("retries", 0) + 1
+        if job["retries"] >= MEDIA_SYNC_MAX_RETRIES:
+            LOGGER.warning(
+                f"Dropping media sync job {jobID} after {job['retries']} failed attempts."
+            )
+            queue["failedJobs"][jobID] = queue["jobs"].pop(jobID)
+            return
+    retryDelay = MEDIA_SYNC_RETRY_DELAY * 2 ** job.get("retries", 0)
+    job["nextAttempt"] = datetime.datetime.utcnow().timestamp() + retryDelay
+
+
+async def mediaSyncWorker(hass, entry):
+    queue = hass.data[DOMAIN][entry.entry_id]["mediaSyncQueue"]
+    while True:
+        nextJob = takeMediaSyncJob(hass, entry.entry_id, queue)
+        if nextJob is None:
+            queue["wakeUp"].clear()
+            try:
+                async with asyncio.timeout(getMediaSyncRetryTimeout(queue)):
+                    await queue["wakeUp"].wait()
+            except TimeoutError:
+                pass
+            continue
+        jobID, job, device = nextJob
+        queue["busyDevices"].add(job["childID"])
+        try:
+            coldFilePath = await trackDeviceRequest(
+                device,
+                getRecording(
+                    hass,
+                    device["controller"],
+                    entry.entry_id,
+                    device,
+                    job["date"],
+                    job["startDate"],
+                    job["endDate"],
+                ),
+            )
+            fileSize = await hass.async_add_executor_job(os.path.getsize, coldFilePath)
+            queue["downloads"].append(
+                (datetime.datetime.utcnow().timestamp(), fileSize)
+            )
+            queue["jobs"].pop(jobID, None)
+        except Unresolvable as err:
+            if str(err) == "Recording is currently in progress.":
+                # not a failure, picked up again once the recording is done
+                LOGGER.info(err)
+                postponeMediaSyncJob(queue, jobID, job, countRetry=False)
+            else:
+                LOGGER.warning(err)
+                postponeMediaSyncJob(queue, jobID, job)
+        except Exception as err:
+            LOGGER.error(err)
+            postponeMediaSyncJob(queue, jobID, job)
+        finally:
+            device["isDownloadingStream"] = False
+            queue["busyDevices"].discard(job["childID"])
+            saveMediaSyncQueue(queue)
+            queue["wakeUp"].set()
+
+
+def startMediaSyncWorkers(hass, entry):
+    for workerID in range(int(entry.data[MEDIA_SYNC_WORKERS])):
+        entry.async_create_background_task(
+            hass,
+            mediaSyncWorker(hass, entry),
+            f"tapo_control media sync worker {workerID}",
+        )
+
+
+def getMediaSyncThroughput(queue):
+    # Average bytes per second downloaded within MEDIA_SYNC_THROUGHPUT_WINDOW.
+    oldestTimestamp = (
+        datetime.datetime.utcnow().timestamp() - MEDIA_SYNC_THROUGHPUT_WINDOW
+    )
+    queue["downloads"] = [
+        download for download in queue["downloads"] if download[0] > oldestTimestamp
+    ]
+    return round(
+        sum(download[1] for download in queue["downloads"])
+        / MEDIA_SYNC_THROUGHPUT_WINDOW
+    )
+
+
+async def areCameraPortsOpened(hass, host, controlPort=443):
+    # KLAP_HTTP_PORT is probed alongside so that a following KLAP check is cached.
+    results = await probePorts(hass, host, (controlPort, 554, 2020, KLAP_HTTP_PORT))
+    return results[int(controlPort)] and results[554] and results[2020]
 
 
 async def isRtspStreamWorking(
@@ -844,17 +1685,18 @@ def tryParseInt(value):
         return None
 
 
+def registerDevice(rootEntry, device=None):
+    # Devices are looked up by controller and by child dev_id, the parent
+    # itself is kept under an empty dev_id like in media sync jobs.
+    if device is None:
+        device = rootEntry
+    devId = device["camData"]["basic_info"]["dev_id"] if device["isChild"] else ""
+    rootEntry["devicesById"][devId] = device
+    rootEntry["devicesByController"][device["controller"]] = device
+
+
 def getDataForController(hass, entry, controller):
-    for controller in hass.data[DOMAIN][entry.entry_id]["allControllers"]:
-        if controller == hass.data[DOMAIN][entry.entry_id]["controller"]:
-            return hass.data[DOMAIN][entry.entry_id]
-        elif (
-            "childDevices" in hass.data[DOMAIN][entry.entry_id]
-            and hass.data[DOMAIN][entry.entry_id]["childDevices"] is not False
-        ):
-            for childDevice in hass.data[DOMAIN][entry.entry_id]["childDevices"]:
-                if controller == childDevice["controller"]:
-                    return childDevice
+    return hass.data[DOMAIN][entry.entry_id]["devicesByController"].get(controller)
 
 
 def getNightModeMap():
@@ -994,27 +1836,183 @@ def ldcHasField(rawData, section, field):
     return False
 
 
-async def getCamData(hass, controller, chInfo=None):
-    LOGGER.debug("getCamData")
+# Fields copied straight from the getMost response: camData key, raw section
+# and the path inside the first response of that section.
+CAM_DATA_FIELDS = (
+    ("dst_data", "getDstRule", ("system", "dst")),
+    ("clock_data", "getClockStatus", ("system", "clock_status")),
+    ("timezone_timezone", "getTimezone", ("system", "basic", "timezone")),
+    ("alert_event_types", "getAlertEventType", ("msg_alarm", "msg_alarm_type")),
+    ("timezone_zone_id", "getTimezone", ("system", "basic", "zone_id")),
+    ("timezone_timing_mode", "getTimezone", ("system", "basic", "timing_mode")),
+    ("privacy_mode", "getLensMaskConfig", ("lens_mask", "lens_mask_info", "enabled")),
+    (
+        "notifications",
+        "getMsgPushConfig",
+        ("msg_push", "chn1_msg_push_info", "notification_enabled"),
+    ),
+    (
+        "rich_notifications",
+        "getMsgPushConfig",
+        ("msg_push", "chn1_msg_push_info", "rich_notification_enabled"),
+    ),
+    ("diagnose_mode", "getDiagnoseMode", ("system", "sys")),
+    ("cover_config", "getCoverConfig", ("cover", "cover")),
+    ("smart_track_config", "getSmartTrackConfig", ("smart_track", "smart_track_info")),
+    ("network_ip_info", "getDeviceIpAddress", ()),
+    (
+        "night_vision_capability",
+        "getNightVisionCapability",
+        ("image_capability", "supplement_lamp", "night_vision_mode_range"),
+    ),
+    ("flood_light_config", "getFloodlightConfig", ("floodlight", "config")),
+    ("flood_light_status", "getFloodlightStatus", ("status",)),
+    ("flood_light_capability", "getFloodlightCapability", ("floodlight", "capability")),
+    (
+        "auto_track",
+        "getTargetTrackConfig",
+        ("target_track", "target_track_info", "enabled"),
+    ),
+    ("patrol_status", "getPatrolAction", ("patrol", "patrol", "action")),
+    ("firmwareUpdateStatus", "getFirmwareUpdateStatus", ("cloud_config",)),
+    ("childDevices", "getChildDeviceList", ()),
+    ("whitelampStatus", "getWhitelampStatus", ("status",)),
+    ("recordPlan", "getRecordPlan", ("record_plan", "chn1_channel")),
+    ("microphoneVolume", "getAudioConfig", ("audio_config", "microphone", "volume")),
+    ("microphoneMute", "getAudioConfig", ("audio_config", "microphone", "mute")),
+    (
+        "microphoneNoiseCancelling",
+        "getAudioConfig",
+        ("audio_config", "microphone", "noise_cancelling"),
+    ),
+    ("speakerVolume", "getAudioConfig", ("audio_config", "speaker", "volume")),
+    (
+        "autoUpgradeEnabled",
+        "getFirmwareAutoUpgradeConfig",
+        ("auto_upgrade", "common", "enabled"),
+    ),
+    ("videoCapability", "getVideoCapability", ()),
+    ("allChnInfo", "getAllChnInfo", ()),
+    ("dualCamCapability", "getDualCamCapability", ()),
+    ("videoQualities", "getVideoQualities", ()),
+    ("supportAlarmTypeList", "get_support_alarm_type_list", ()),
+    ("dualLinkageTargetSetting", "readLinkageTargetSetting", ("dual_cam_linkage",)),
+    (
+        "dualLinkageCapability",
+        "getLinkageTargetCapability",
+        ("dual_cam_linkage", "linkage_target_capability"),
+    ),
+)
+
+
+def compileCamDataFields(fields):
+    sections = {}
+    for key, section, path in fields:
+        sections.setdefault(section, []).append((key, path))
+    return sections
+
+
+CAM_DATA_SECTIONS = compileCamDataFields(CAM_DATA_FIELDS)
+CAM_DATA_KEY_SECTIONS = {key: section for key, section, _ in CAM_DATA_FIELDS}
 
+
+def getRefreshSections(functions=None, camDataKeys=None):
+    # Raw getMost sections needed to rebuild the given pytapo getters or camData
+    # keys, None when they are unknown and the whole device has to be refreshed.
+    sections = set()
+    if functions:
+        for function in functions:
+            sections.update(pytapoFunctionMap(function))
+    elif camDataKeys:
+        for key in camDataKeys:
+            if key not in CAM_DATA_KEY_SECTIONS:
+                return None
+            sections.add(CAM_DATA_KEY_SECTIONS[key])
+    else:
+        return None
+    return sections
+
+
+def extractCamDataFields(data, sections=None):
+    fields = {}
+    for section, sectionFields in CAM_DATA_SECTIONS.items():
+        if sections is not None and section not in sections:
+            continue
+        sectionData = data.get(section)
+        for key, path in sectionFields:
+            try:
+                value = sectionData[0]
+                for pathKey in path:
+                    value = value[pathKey]
+            except Exception:
+                value = None
+            fields[key] = value
+    return fields
+
+
+def camDataKeysChanged(previousCamData, camData, keys):
+    if keys is None or not previousCamData or not camData:
+        return True
+    for key in keys:
+        if previousCamData.get(key) != camData.get(key):
+            return True
+    return False
+
+
+def getChannelIds(chInfo):
     chn_id = []
     if chInfo:
         for lens in chInfo:
             chn_id.append(lens["chn_id"])
-    data = await hass.async_add_executor_job(controller.getMost, [], chn_id)
+    return chn_id
+
+
+def hashCamDataSections(data):
+    sectionHashes = {}
+    for section, value in data.items():
+        try:
+            sectionHashes[section] = hash(
+                json.dumps(value, sort_keys=True, default=str)
+            )
+        except Exception:
+            pass
+    return sectionHashes
+
+
+def getMostWithHashes(controller, chn_id, omit_methods=None):
+    # Runs in the executor, section fingerprints are taken there so the event
+    # loop only compares integers.
+    data = controller.getMost(omit_methods or [], chn_id)
+    return data, hashCamDataSections(data)
+
+
+def getChangedSections(previousCamData, sectionHashes):
+    if not previousCamData or not sectionHashes:
+        return None
+    previousHashes = previousCamData.get("sectionHashes")
+    if not previousHashes:
+        return None
+    return {
+        section
+        for section in set(previousHashes) | set(sectionHashes)
+        if previousHashes.get(section) != sectionHashes.get(section)
+    }
+
+
+async def getCamData(hass, controller, chInfo=None, previousCamData=None):
+    LOGGER.debug("getCamData")
+
+    data, sectionHashes = await hass.async_add_executor_job(
+        getMostWithHashes, controller, getChannelIds(chInfo)
+    )
     LOGGER.debug("Raw update data:")
     LOGGER.debug(data)
 
-    camData = {}
+    return parseCamData(controller, data, chInfo, previousCamData, sectionHashes)
 
-    camData["raw"] = data
-
-    camData["user"] = controller.user
-    if controller.isKLAP:
-        camData["basic_info"] = convertBasicInfo(data["get_device_info"][0])
-    else:
-        camData["basic_info"] = data["getDeviceInfo"][0]["device_info"]["basic_info"]
 
+def parseMotionDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         motion_detection_data = data["getDetectionConfig"][0]["motion_detection"][
             "motion_det"
@@ -1044,43 +2042,11 @@ async def getCamData(hass, controller, chInfo=None):
     camData["motion_detection_digital_sensitivity"] = (
         motion_detection_digital_sensitivity
     )
+    return camData
 
-    try:
-        dst_data = data["getDstRule"][0]["system"]["dst"]
-    except Exception:
-        dst_data = None
-    camData["dst_data"] = dst_data
-
-    try:
-        clock_data = data["getClockStatus"][0]["system"]["clock_status"]
-    except Exception:
-        clock_data = None
-    camData["clock_data"] = clock_data
-
-    try:
-        timezone_timezone = data["getTimezone"][0]["system"]["basic"]["timezone"]
-    except Exception:
-        timezone_timezone = None
-    camData["timezone_timezone"] = timezone_timezone
-
-    try:
-        alert_event_types = data["getAlertEventType"][0]["msg_alarm"]["msg_alarm_type"]
-    except Exception:
-        alert_event_types = None
-    camData["alert_event_types"] = alert_event_types
-
-    try:
-        timezone_zone_id = data["getTimezone"][0]["system"]["basic"]["zone_id"]
-    except Exception:
-        timezone_zone_id = None
-    camData["timezone_zone_id"] = timezone_zone_id
-
-    try:
-        timezone_timing_mode = data["getTimezone"][0]["system"]["basic"]["timing_mode"]
-    except Exception:
-        timezone_timing_mode = None
-    camData["timezone_timing_mode"] = timezone_timing_mode
 
+def parsePersonDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         personDetectionData = data["getPersonDetectionConfig"][0]["people_detection"][
             "detection"
@@ -1106,7 +2072,11 @@ async def getCamData(hass, controller, chInfo=None):
         person_detection_sensitivity = None
     camData["person_detection_enabled"] = person_detection_enabled
     camData["person_detection_sensitivity"] = person_detection_sensitivity
+    return camData
+
 
+def parseVehicleDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         vehicleDetectionData = data["getVehicleDetectionConfig"][0][
             "vehicle_detection"
@@ -1132,7 +2102,11 @@ async def getCamData(hass, controller, chInfo=None):
         vehicle_detection_sensitivity = None
     camData["vehicle_detection_enabled"] = vehicle_detection_enabled
     camData["vehicle_detection_sensitivity"] = vehicle_detection_sensitivity
+    return camData
+
 
+def parseBabyCryDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         babyCryDetectionData = data["getBCDConfig"][0]["sound_detection"]["bcd"]
         babyCry_detection_enabled = babyCryDetectionData["enabled"]
@@ -1151,7 +2125,11 @@ async def getCamData(hass, controller, chInfo=None):
         babyCry_detection_sensitivity = None
     camData["babyCry_detection_enabled"] = babyCry_detection_enabled
     camData["babyCry_detection_sensitivity"] = babyCry_detection_sensitivity
+    return camData
+
 
+def parsePetDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         petDetectionData = data["getPetDetectionConfig"][0]["pet_detection"][
             "detection"
@@ -1177,7 +2155,11 @@ async def getCamData(hass, controller, chInfo=None):
         pet_detection_sensitivity = None
     camData["pet_detection_enabled"] = pet_detection_enabled
     camData["pet_detection_sensitivity"] = pet_detection_sensitivity
+    return camData
+
 
+def parseBarkDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         barkDetectionData = data["getBarkDetectionConfig"][0]["bark_detection"][
             "detection"
@@ -1198,7 +2180,11 @@ async def getCamData(hass, controller, chInfo=None):
         bark_detection_sensitivity = None
     camData["bark_detection_enabled"] = bark_detection_enabled
     camData["bark_detection_sensitivity"] = bark_detection_sensitivity
+    return camData
+
 
+def parseMeowDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         meowDetectionData = data["getMeowDetectionConfig"][0]["meow_detection"][
             "detection"
@@ -1219,7 +2205,11 @@ async def getCamData(hass, controller, chInfo=None):
         meow_detection_sensitivity = None
     camData["meow_detection_enabled"] = meow_detection_enabled
     camData["meow_detection_sensitivity"] = meow_detection_sensitivity
+    return camData
 
+
+def parseGlassDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         glassDetectionData = data["getGlassDetectionConfig"][0]["glass_detection"][
             "detection"
@@ -1240,7 +2230,11 @@ async def getCamData(hass, controller, chInfo=None):
         glass_detection_sensitivity = None
     camData["glass_detection_enabled"] = glass_detection_enabled
     camData["glass_detection_sensitivity"] = glass_detection_sensitivity
+    return camData
 
+
+def parseTamperDetection(controller, data, chInfo=None):
+    camData = {}
     try:
         tamperDetectionData = data["getTamperDetectionConfig"][0]["tamper_detection"][
             "tamper_det"
@@ -1270,112 +2264,308 @@ async def getCamData(hass, controller, chInfo=None):
         tamper_detection_sensitivity = None
     camData["tamper_detection_enabled"] = tamper_detection_enabled
     camData["tamper_detection_sensitivity"] = tamper_detection_sensitivity
+    return camData
 
+
+def parseNightVisionMode(controller, data, chInfo=None):
+    camData = {}
     try:
-        presets = {
-            id: data["getPresetConfig"][0]["preset"]["preset"]["name"][key]
-            for key, id in enumerate(
-                data["getPresetConfig"][0]["preset"]["preset"]["id"]
-            )
-        }
+        night_vision_mode = extractFieldByChannel(
+            data["getNightVisionModeConfig"][0]["image"]["switch"],
+            "night_vision_mode",
+        )
     except Exception:
-        presets = False
+        night_vision_mode = None
+    camData["night_vision_mode"] = night_vision_mode
+    return camData
+
 
+def parseNightVisionCapability(controller, data, chInfo=None):
+    camData = {}
     try:
-        privacy_mode = data["getLensMaskConfig"][0]["lens_mask"]["lens_mask_info"][
-            "enabled"
-        ]
+        if (
+            "image_capability" in data["getNightVisionCapability"][0]
+            and "supplement_lamp"
+            in data["getNightVisionCapability"][0]["image_capability"]
+        ):
+            nightVisionCapability = data["getNightVisionCapability"][0][
+                "image_capability"
+            ]["supplement_lamp"]
     except Exception:
-        privacy_mode = None
-    camData["privacy_mode"] = privacy_mode
+        nightVisionCapability = None
+    camData["nightVisionCapability"] = nightVisionCapability
+    return camData
 
+
+def parseLed(controller, data, chInfo=None):
+    camData = {}
     try:
-        notifications = data["getMsgPushConfig"][0]["msg_push"]["chn1_msg_push_info"][
-            "notification_enabled"
-        ]
+        led = data["getLedStatus"][0]["led"]["config"]["enabled"]
     except Exception:
-        notifications = None
-    camData["notifications"] = notifications
+        led = None
 
+    if led is None:
+        led = "on" if data["get_device_info"][0]["led_off"] == 0 else "off"
+    camData["led"] = led
+    return camData
+
+
+def parseWhitelampConfig(controller, data, chInfo=None):
+    camData = {}
     try:
-        rich_notifications = data["getMsgPushConfig"][0]["msg_push"][
-            "chn1_msg_push_info"
-        ]["rich_notification_enabled"]
+        whitelampConfigForceTime = extractFieldByChannel(
+            data["getWhitelampConfig"][0]["image"]["switch"], "wtl_force_time"
+        )
     except Exception:
-        rich_notifications = None
-    camData["rich_notifications"] = rich_notifications
+        whitelampConfigForceTime = None
+    camData["whitelampConfigForceTime"] = whitelampConfigForceTime
+
+    try:
+        whitelampConfigIntensity = extractFieldByChannel(
+            data["getWhitelampConfig"][0]["image"]["switch"], "wtl_intensity_level"
+        )
+    except Exception:
+        whitelampConfigIntensity = None
+    camData["whitelampConfigIntensity"] = whitelampConfigIntensity
+    return camData
 
-    ldc_switch = getLdcImageSection(data.get("getLdc"), "switch")
-    ldc_common = getLdcImageSection(data.get("getLdc"), "common")
 
+def parseSdCardData(controller, data, chInfo=None):
+    camData = {}
     try:
-        lens_distrotion_correction = extractFieldByChannel(ldc_switch, "ldc")
+        sdCardData = []
+        for hdd in data["getSdCardStatus"][0]["harddisk_manage"]["hd_info"]:
+            sdCardData.append(hdd["hd_info_1"])
     except Exception:
-        lens_distrotion_correction = None
-    camData["lens_distrotion_correction"] = lens_distrotion_correction
+        sdCardData = []
+    camData["sdCardData"] = sdCardData
+    return camData
+
 
+def parseRecordAudio(controller, data, chInfo=None):
+    camData = {}
     try:
-        ldcStyle = extractFieldByChannel(ldc_common, "style")
+        record_audio = (
+            data["getAudioConfig"][0]["audio_config"]["record_audio"]["enabled"] == "on"
+        )
     except Exception:
-        ldcStyle = None
-    camData["ldcStyle"] = ldcStyle
+        record_audio = None
+    camData["record_audio"] = record_audio
+    return camData
 
+
+def parseRebootConfig(controller, data, chInfo=None):
+    camData = {}
     try:
-        light_frequency_mode = extractFieldByChannel(ldc_common, "light_freq_mode")
+        rebootConfig = data["getReboot"][0]["timing_reboot"]["reboot"]
     except Exception:
-        light_frequency_mode = None
+        rebootConfig = None
+    camData["rebootConfig"] = rebootConfig
+    if isinstance(rebootConfig, dict):
+        camData["rebootEnabled"] = rebootConfig.get("enabled")
+        camData["rebootTime"] = rebootConfig.get("time")
+        camData["rebootDay"] = rebootConfig.get("day")
+        camData["rebootRandomRange"] = rebootConfig.get("random_range")
+        camData["rebootLastTime"] = rebootConfig.get("last_reboot_time")
+    else:
+        camData["rebootEnabled"] = None
+        camData["rebootTime"] = None
+        camData["rebootDay"] = None
+        camData["rebootRandomRange"] = None
+        camData["rebootLastTime"] = None
+    return camData
 
-    if light_frequency_mode is None:
+
+def parseConnectionInformation(controller, data, chInfo=None):
+    camData = {}
+    try:
+        connectionInformation = data["getConnectionType"][0]
+    except Exception:
+        connectionInformation = None
+
+    if connectionInformation is None:
+        connectionInformation = {}
         try:
-            light_frequency_mode = extractFieldByChannel(
-                data["getLightFrequencyInfo"][0]["image"]["common"], "light_freq_mode"
-            )
+            connectionInformation["ssid"] = base64.b64decode(
+                data["get_device_info"][0]["ssid"]
+            ).decode("utf-8")
         except Exception:
-            light_frequency_mode = None
-    camData["light_frequency_mode"] = light_frequency_mode
+            pass
+        try:
+            connectionInformation["rssiValue"] = data["get_device_info"][0]["rssi"]
+
+        except Exception:
+            pass
+    camData["connectionInformation"] = connectionInformation
+    return camData
 
+
+def parseQuickResponse(controller, data, chInfo=None):
+    camData = {}
     try:
-        night_vision_mode = extractFieldByChannel(
-            data["getNightVisionModeConfig"][0]["image"]["switch"],
-            "night_vision_mode",
-        )
+        if isinstance(data["getQuickRespList"], list):
+            camData["quick_response"] = data["getQuickRespList"][0]["quick_response"][
+                "quick_resp_audio"
+            ]
+        elif isinstance(data["getQuickRespList"], dict):
+            camData["quick_response"] = data["getQuickRespList"]["quick_resp_audio"]
+        else:
+            LOGGER.warning("Quick response data is not in expected format")
     except Exception:
-        night_vision_mode = None
-    camData["night_vision_mode"] = night_vision_mode
+        camData["quick_response"] = None
+    return camData
+
 
+def parseDualCamLinkage(controller, data, chInfo=None):
+    camData = {}
     try:
-        diagnose_mode = data["getDiagnoseMode"][0]["system"]["sys"]
+        dualCamLinkageEnabled = data["getDualCamLinkage"][0]["dual_cam_linkage"][
+            "linkage_state"
+        ]["enabled"]
+        dualCamLinkageType = data["getDualCamLinkage"][0]["dual_cam_linkage"][
+            "linkage_state"
+        ]["linkage_type"]
     except Exception:
-        diagnose_mode = None
-    camData["diagnose_mode"] = diagnose_mode
+        dualCamLinkageEnabled = None
+        dualCamLinkageType = None
+    camData["dualCamLinkageEnabled"] = dualCamLinkageEnabled
+    camData["dualCamLinkageType"] = dualCamLinkageType
+    return camData
 
+
+def parsePresets(controller, data, chInfo=None):
+    camData = {}
     try:
-        cover_config = data["getCoverConfig"][0]["cover"]["cover"]
+        presets = {
+            id: data["getPresetConfig"][0]["preset"]["preset"]["name"][key]
+            for key, id in enumerate(
+                data["getPresetConfig"][0]["preset"]["preset"]["id"]
+            )
+        }
     except Exception:
-        cover_config = None
-    camData["cover_config"] = cover_config
+        presets = False
+
+    if presets:
+        camData["presets"] = presets
+    else:
+        camData["presets"] = {}
+    return camData
+
+
+def parseSirenStatus(controller, data, chInfo=None):
+    alarmStatus = False
+    if controller.isKLAP is False:
+        try:
+            if (
+                data["getSirenStatus"][0] is not False
+                and "status" in data["getSirenStatus"][0]
+            ):
+                alarmStatus = data["getSirenStatus"][0]["status"]
+        except Exception as err:
+            LOGGER.error(f"getSirenStatus unexpected error {err=}, {type(err)=}")
+    return {"alarm_status": alarmStatus}
+
+
+# Hand parsed camData fields depending on a single getMost section, parsed
+# again on their own when only that section changed. Every other section is
+# only handled by the full parse below.
+CAM_DATA_SECTION_PARSERS = {
+    "getDetectionConfig": parseMotionDetection,
+    "getPersonDetectionConfig": parsePersonDetection,
+    "getVehicleDetectionConfig": parseVehicleDetection,
+    "getBCDConfig": parseBabyCryDetection,
+    "getPetDetectionConfig": parsePetDetection,
+    "getBarkDetectionConfig": parseBarkDetection,
+    "getMeowDetectionConfig": parseMeowDetection,
+    "getGlassDetectionConfig": parseGlassDetection,
+    "getTamperDetectionConfig": parseTamperDetection,
+    "getNightVisionModeConfig": parseNightVisionMode,
+    "getNightVisionCapability": parseNightVisionCapability,
+    "getLedStatus": parseLed,
+    "getWhitelampConfig": parseWhitelampConfig,
+    "getSdCardStatus": parseSdCardData,
+    "getAudioConfig": parseRecordAudio,
+    "getReboot": parseRebootConfig,
+    "getConnectionType": parseConnectionInformation,
+    "getQuickRespList": parseQuickResponse,
+    "getDualCamLinkage": parseDualCamLinkage,
+    "getPresetConfig": parsePresets,
+    "getSirenStatus": parseSirenStatus,
+}
+
+
+CAM_DATA_INCREMENTAL_SECTIONS = set(CAM_DATA_SECTIONS) | set(CAM_DATA_SECTION_PARSERS)
+
+
+def updateCamData(controller, data, chInfo, previousCamData, changedSections):
+    camData = dict(previousCamData)
+    camData["raw"] = data
+    camData["user"] = controller.user
+    camData.update(extractCamDataFields(data, changedSections))
+    for section in changedSections:
+        if section in CAM_DATA_SECTION_PARSERS:
+            camData.update(CAM_DATA_SECTION_PARSERS[section](controller, data, chInfo))
+    camData["updated"] = datetime.datetime.utcnow().timestamp()
+    LOGGER.debug(f"getCamData - reparsed {sorted(changedSections)}")
+    return camData
+
+
+def parseCamData(
+    controller, data, chInfo=None, previousCamData=None, sectionHashes=None
+):
+    # Sections with the same fingerprint as in previousCamData are not parsed
+    # again as long as all changed ones can be handled on their own.
+    changedSections = getChangedSections(previousCamData, sectionHashes)
+    if changedSections is not None and changedSections <= CAM_DATA_INCREMENTAL_SECTIONS:
+        camData = updateCamData(
+            controller, data, chInfo, previousCamData, changedSections
+        )
+        camData["sectionHashes"] = sectionHashes
+        return camData
+
+    camData = {}
+
+    camData["raw"] = data
+    camData["sectionHashes"] = sectionHashes
+
+    camData["user"] = controller.user
+    if controller.isKLAP:
+        camData["basic_info"] = convertBasicInfo(data["get_device_info"][0])
+    else:
+        camData["basic_info"] = data["getDeviceInfo"][0]["device_info"]["basic_info"]
+
+    camData.update(extractCamDataFields(data))
+    for parseSection in CAM_DATA_SECTION_PARSERS.values():
+        camData.update(parseSection(controller, data, chInfo))
+
+    ldc_switch = getLdcImageSection(data.get("getLdc"), "switch")
+    ldc_common = getLdcImageSection(data.get("getLdc"), "common")
 
     try:
-        smart_track_config = data["getSmartTrackConfig"][0]["smart_track"][
-            "smart_track_info"
-        ]
+        lens_distrotion_correction = extractFieldByChannel(ldc_switch, "ldc")
     except Exception:
-        smart_track_config = None
-    camData["smart_track_config"] = smart_track_config
+        lens_distrotion_correction = None
+    camData["lens_distrotion_correction"] = lens_distrotion_correction
 
     try:
-        network_ip_info = data["getDeviceIpAddress"][0]
+        ldcStyle = extractFieldByChannel(ldc_common, "style")
     except Exception:
-        network_ip_info = None
-    camData["network_ip_info"] = network_ip_info
+        ldcStyle = None
+    camData["ldcStyle"] = ldcStyle
 
     try:
-        night_vision_capability = data["getNightVisionCapability"][0][
-            "image_capability"
-        ]["supplement_lamp"]["night_vision_mode_range"]
+        light_frequency_mode = extractFieldByChannel(ldc_common, "light_freq_mode")
     except Exception:
-        night_vision_capability = None
-    camData["night_vision_capability"] = night_vision_capability
+        light_frequency_mode = None
+
+    if light_frequency_mode is None:
+        try:
+            light_frequency_mode = extractFieldByChannel(
+                data["getLightFrequencyInfo"][0]["image"]["common"], "light_freq_mode"
+            )
+        except Exception:
+            light_frequency_mode = None
+    camData["light_frequency_mode"] = light_frequency_mode
 
     try:
         night_vision_mode_switching = extractFieldByChannel(ldc_common, "inf_type")
@@ -1404,27 +2594,7 @@ async def getCamData(hass, controller, chInfo=None):
         )
     except Exception:
         smartwtl_digital_level = None
-    camData["smartwtl_digital_level"] = smartwtl_digital_level
-
-    try:
-        flood_light_config = data["getFloodlightConfig"][0]["floodlight"]["config"]
-    except Exception:
-        flood_light_config = None
-    camData["flood_light_config"] = flood_light_config
-
-    try:
-        flood_light_status = data["getFloodlightStatus"][0]["status"]
-    except Exception:
-        flood_light_status = None
-    camData["flood_light_status"] = flood_light_status
-
-    try:
-        flood_light_capability = data["getFloodlightCapability"][0]["floodlight"][
-            "capability"
-        ]
-    except Exception:
-        flood_light_capability = None
-    camData["flood_light_capability"] = flood_light_capability
+    camData["smartwtl_digital_level"] = smartwtl_digital_level
 
     try:
         flip_type = extractFieldByChannel(ldc_switch, "flip_type")
@@ -1462,7 +2632,6 @@ async def getCamData(hass, controller, chInfo=None):
 
     hubSiren = False
     alarmConfig = None
-    alarmStatus = False
     alarmSirenTypeList = []
     if controller.isKLAP is False:
         try:
@@ -1577,16 +2746,6 @@ async def getCamData(hass, controller, chInfo=None):
         except Exception as err:
             LOGGER.error(f"getAlertConfig unexpected error {err=}, {type(err)=}")
 
-    if controller.isKLAP is False:
-        try:
-            if (
-                data["getSirenStatus"][0] is not False
-                and "status" in data["getSirenStatus"][0]
-            ):
-                alarmStatus = data["getSirenStatus"][0]["status"]
-        except Exception as err:
-            LOGGER.error(f"getSirenStatus unexpected error {err=}, {type(err)=}")
-
     if controller.isKLAP is False:
         if alarmConfig is not None:
             try:
@@ -1654,206 +2813,9 @@ async def getCamData(hass, controller, chInfo=None):
     camData["alarm_user_start_id"] = alarm_user_start_id
     camData["alarm_user_sounds"] = alarm_user_sounds
     camData["alarm_config"] = alarmConfig
-    camData["alarm_status"] = alarmStatus
     camData["alarm_is_hubSiren"] = hubSiren
     camData["alarm_siren_type_list"] = alarmSirenTypeList
 
-    try:
-        if (
-            "image_capability" in data["getNightVisionCapability"][0]
-            and "supplement_lamp"
-            in data["getNightVisionCapability"][0]["image_capability"]
-        ):
-            nightVisionCapability = data["getNightVisionCapability"][0][
-                "image_capability"
-            ]["supplement_lamp"]
-    except Exception:
-        nightVisionCapability = None
-    camData["nightVisionCapability"] = nightVisionCapability
-
-    try:
-        led = data["getLedStatus"][0]["led"]["config"]["enabled"]
-    except Exception:
-        led = None
-
-    if led is None:
-        led = "on" if data["get_device_info"][0]["led_off"] == 0 else "off"
-    camData["led"] = led
-
-    # todo rest
-    try:
-        auto_track = data["getTargetTrackConfig"][0]["target_track"][
-            "target_track_info"
-        ]["enabled"]
-    except Exception:
-        auto_track = None
-    camData["auto_track"] = auto_track
-
-    if presets:
-        camData["presets"] = presets
-    else:
-        camData["presets"] = {}
-
-    try:
-        patrolStatus = data["getPatrolAction"][0]["patrol"]["patrol"]["action"]
-    except Exception:
-        patrolStatus = None
-    camData["patrol_status"] = patrolStatus
-
-    try:
-        firmwareUpdateStatus = data["getFirmwareUpdateStatus"][0]["cloud_config"]
-    except Exception:
-        firmwareUpdateStatus = None
-    camData["firmwareUpdateStatus"] = firmwareUpdateStatus
-
-    try:
-        childDevices = data["getChildDeviceList"][0]
-    except Exception:
-        childDevices = None
-    camData["childDevices"] = childDevices
-
-    try:
-        whitelampConfigForceTime = extractFieldByChannel(
-            data["getWhitelampConfig"][0]["image"]["switch"], "wtl_force_time"
-        )
-    except Exception:
-        whitelampConfigForceTime = None
-    camData["whitelampConfigForceTime"] = whitelampConfigForceTime
-
-    try:
-        whitelampConfigIntensity = extractFieldByChannel(
-            data["getWhitelampConfig"][0]["image"]["switch"], "wtl_intensity_level"
-        )
-    except Exception:
-        whitelampConfigIntensity = None
-    camData["whitelampConfigIntensity"] = whitelampConfigIntensity
-
-    try:
-        whitelampStatus = data["getWhitelampStatus"][0]["status"]
-    except Exception:
-        whitelampStatus = None
-    camData["whitelampStatus"] = whitelampStatus
-
-    try:
-        sdCardData = []
-        for hdd in data["getSdCardStatus"][0]["harddisk_manage"]["hd_info"]:
-            sdCardData.append(hdd["hd_info_1"])
-    except Exception:
-        sdCardData = []
-    camData["sdCardData"] = sdCardData
-
-    try:
-        recordPlan = data["getRecordPlan"][0]["record_plan"]["chn1_channel"]
-    except Exception:
-        recordPlan = None
-    camData["recordPlan"] = recordPlan
-
-    try:
-        microphoneVolume = data["getAudioConfig"][0]["audio_config"]["microphone"][
-            "volume"
-        ]
-    except Exception:
-        microphoneVolume = None
-    camData["microphoneVolume"] = microphoneVolume
-
-    try:
-        microphoneMute = data["getAudioConfig"][0]["audio_config"]["microphone"]["mute"]
-    except Exception:
-        microphoneMute = None
-    camData["microphoneMute"] = microphoneMute
-
-    try:
-        microphoneNoiseCancelling = data["getAudioConfig"][0]["audio_config"][
-            "microphone"
-        ]["noise_cancelling"]
-    except Exception:
-        microphoneNoiseCancelling = None
-    camData["microphoneNoiseCancelling"] = microphoneNoiseCancelling
-
-    try:
-        speakerVolume = data["getAudioConfig"][0]["audio_config"]["speaker"]["volume"]
-    except Exception:
-        speakerVolume = None
-    camData["speakerVolume"] = speakerVolume
-
-    try:
-        record_audio = (
-            data["getAudioConfig"][0]["audio_config"]["record_audio"]["enabled"] == "on"
-        )
-    except Exception:
-        record_audio = None
-    camData["record_audio"] = record_audio
-
-    try:
-        autoUpgradeEnabled = data["getFirmwareAutoUpgradeConfig"][0]["auto_upgrade"][
-            "common"
-        ]["enabled"]
-    except Exception:
-        autoUpgradeEnabled = None
-    camData["autoUpgradeEnabled"] = autoUpgradeEnabled
-
-    try:
-        rebootConfig = data["getReboot"][0]["timing_reboot"]["reboot"]
-    except Exception:
-        rebootConfig = None
-    camData["rebootConfig"] = rebootConfig
-    if isinstance(rebootConfig, dict):
-        camData["rebootEnabled"] = rebootConfig.get("enabled")
-        camData["rebootTime"] = rebootConfig.get("time")
-        camData["rebootDay"] = rebootConfig.get("day")
-        camData["rebootRandomRange"] = rebootConfig.get("random_range")
-        camData["rebootLastTime"] = rebootConfig.get("last_reboot_time")
-    else:
-        camData["rebootEnabled"] = None
-        camData["rebootTime"] = None
-        camData["rebootDay"] = None
-        camData["rebootRandomRange"] = None
-        camData["rebootLastTime"] = None
-
-    try:
-        connectionInformation = data["getConnectionType"][0]
-    except Exception:
-        connectionInformation = None
-
-    if connectionInformation is None:
-        connectionInformation = {}
-        try:
-            connectionInformation["ssid"] = base64.b64decode(
-                data["get_device_info"][0]["ssid"]
-            ).decode("utf-8")
-        except Exception:
-            pass
-        try:
-            connectionInformation["rssiValue"] = data["get_device_info"][0]["rssi"]
-
-        except Exception:
-            pass
-    camData["connectionInformation"] = connectionInformation
-
-    try:
-        videoCapability = data["getVideoCapability"][0]
-    except Exception:
-        videoCapability = None
-    camData["videoCapability"] = videoCapability
-
-    try:
-        allChnInfo = data["getAllChnInfo"][0]
-    except Exception:
-        allChnInfo = None
-    camData["allChnInfo"] = allChnInfo
-
-    try:
-        dualCamCapability = data["getDualCamCapability"][0]
-    except Exception:
-        dualCamCapability = None
-    camData["dualCamCapability"] = dualCamCapability
-
-    try:
-        videoQualities = data["getVideoQualities"][0]
-    except Exception:
-        videoQualities = None
-    camData["videoQualities"] = videoQualities
-
     camData["updated"] = datetime.datetime.utcnow().timestamp()
 
     try:
@@ -1868,53 +2830,6 @@ async def getCamData(hass, controller, chInfo=None):
         chimeAlarmConfigurations = None
     camData["chimeAlarmConfigurations"] = chimeAlarmConfigurations
 
-    try:
-        supportAlarmTypeList = data["get_support_alarm_type_list"][0]
-    except Exception:
-        supportAlarmTypeList = None
-    camData["supportAlarmTypeList"] = supportAlarmTypeList
-
-    try:
-        if isinstance(data["getQuickRespList"], list):
-            camData["quick_response"] = data["getQuickRespList"][0]["quick_response"][
-                "quick_resp_audio"
-            ]
-        elif isinstance(data["getQuickRespList"], dict):
-            camData["quick_response"] = data["getQuickRespList"]["quick_resp_audio"]
-        else:
-            LOGGER.warning("Quick response data is not in expected format")
-    except Exception:
-        camData["quick_response"] = None
-
-    try:
-        dualLinkageTargetSetting = data["readLinkageTargetSetting"][0][
-            "dual_cam_linkage"
-        ]
-    except Exception:
-        dualLinkageTargetSetting = None
-    camData["dualLinkageTargetSetting"] = dualLinkageTargetSetting
-
-    try:
-        dualLinkageCapability = data["getLinkageTargetCapability"][0][
-            "dual_cam_linkage"
-        ]["linkage_target_capability"]
-    except Exception:
-        dualLinkageCapability = None
-    camData["dualLinkageCapability"] = dualLinkageCapability
-
-    try:
-        dualCamLinkageEnabled = data["getDualCamLinkage"][0]["dual_cam_linkage"][
-            "linkage_state"
-        ]["enabled"]
-        dualCamLinkageType = data["getDualCamLinkage"][0]["dual_cam_linkage"][
-            "linkage_state"
-        ]["linkage_type"]
-    except Exception:
-        dualCamLinkageEnabled = None
-        dualCamLinkageType = None
-    camData["dualCamLinkageEnabled"] = dualCamLinkageEnabled
-    camData["dualCamLinkageType"] = dualCamLinkageType
-
     LOGGER.debug("getCamData - done")
     LOGGER.debug("Processed update data:")
     LOGGER.debug(camData)
@@ -1933,6 +2848,20 @@ def convert_to_timestamp(date_string):
         )
 
 
+async def replaceDeviceController(hass, entry, device, controller):
+    rootEntry = hass.data[DOMAIN][entry.entry_id]
+    previousController = device["controller"]
+    if previousController in rootEntry["allControllers"]:
+        rootEntry["allControllers"].remove(previousController)
+    rootEntry["devicesByController"].pop(previousController, None)
+    await releaseController(hass, previousController)
+    device["controller"] = controller
+    rootEntry["allControllers"].append(controller)
+    registerDevice(rootEntry, device)
+    for entity in device["entities"]:
+        entity["entity"]._controller = controller
+
+
 async def update_listener(hass, entry):
     """Handle options update."""
     host = entry.data.get(CONF_IP_ADDRESS)
@@ -1949,44 +2878,45 @@ async def update_listener(hass, entry):
         # only update controller if auth data changed
         if newUUID != hass.data[DOMAIN][entry.entry_id]["uuid"]:
             hass.data[DOMAIN][entry.entry_id]["uuid"] = newUUID
-            if (
-                hass.data[DOMAIN][entry.entry_id]["controller"]
-                in hass.data[DOMAIN][entry.entry_id]["allControllers"]
-            ):
-                hass.data[DOMAIN][entry.entry_id]["allControllers"].remove(
-                    hass.data[DOMAIN][entry.entry_id]["controller"]
-                )
             if cloud_password != "":
-                tapoController = await hass.async_add_executor_job(
-                    registerController,
+                tapoController = await acquireController(
+                    hass,
                     host,
                     controlPort,
                     "admin",
                     cloud_password,
-                    "",
-                    "",
-                    None,
-                    None,
-                    hass,
+                    cloud_password,
+                    isKlap=entry.data.get(IS_KLAP_DEVICE),
                 )
             else:
-                tapoController = await hass.async_add_executor_job(
-                    registerController,
+                tapoController = await acquireController(
+                    hass,
                     host,
                     controlPort,
                     username,
                     password,
-                    "",
-                    "",
-                    None,
-                    None,
-                    hass,
+                    isKlap=entry.data.get(IS_KLAP_DEVICE),
                 )
             hass.data[DOMAIN][entry.entry_id]["usingCloudPassword"] = (
                 cloud_password != ""
             )
-            hass.data[DOMAIN][entry.entry_id]["controller"] = tapoController
-            hass.data[DOMAIN][entry.entry_id]["allControllers"].append(tapoController)
+            await replaceDeviceController(
+                hass, entry, hass.data[DOMAIN][entry.entry_id], tapoController
+            )
+            for childDevice in hass.data[DOMAIN][entry.entry_id]["childDevices"]:
+                tapoChildController = await acquireController(
+                    hass,
+                    host,
+                    controlPort,
+                    "admin",
+                    cloud_password,
+                    cloud_password,
+                    deviceId=childDevice["camData"]["basic_info"]["dev_id"],
+                )
+                childDevice["usingCloudPassword"] = cloud_password != ""
+                await replaceDeviceController(
+                    hass, entry, childDevice, tapoChildController
+                )
     except Exception:
         LOGGER.error(
             "Authentication to Tapo camera failed."
@@ -2001,6 +2931,7 @@ async def update_listener(hass, entry):
         if "_password" in entity:
             entity._password = password
     if hass.data[DOMAIN][entry.entry_id]["events"]:
+        removeEventsBoostListener(hass.data[DOMAIN][entry.entry_id])
         await hass.data[DOMAIN][entry.entry_id]["events"].async_stop()
     if hass.data[DOMAIN][entry.entry_id]["motionSensorCreated"]:
         await hass.config_entries.async_forward_entry_unload(entry, "binary_sensor")
@@ -2136,6 +3067,7 @@ async def setupEvents(hass, config_entry):
             LOGGER.debug("Events started.")
             if not hass.data[DOMAIN][config_entry.entry_id]["motionSensorCreated"]:
                 hass.data[DOMAIN][config_entry.entry_id]["motionSensorCreated"] = True
+                addEventsBoostListener(hass.data[DOMAIN][config_entry.entry_id])
                 if hass.data[DOMAIN][config_entry.entry_id]["eventsListener"]:
                     hass.data[DOMAIN][config_entry.entry_id][
                         "eventsListener"
@@ -2284,12 +3216,15 @@ async def scheduleAll(hass, device, entry, mediaSync):
                     datetime.timedelta(seconds=60),
                 )
             )
-        elif device["initialMediaScanRunning"] is False:
+        elif device["initialMediaScanRunning"] is False and canRunMaintenance(
+            device, datetime.datetime.utcnow().timestamp()
+        ):
             LOGGER.debug("Media scan running")
             device["initialMediaScanRunning"] = True
             try:
-                await hass.async_add_executor_job(
-                    device["controller"].getRecordingsList
+                await trackDeviceRequest(
+                    device,
+                    hass.async_add_executor_job(device["controller"].getRecordingsList),
                 )
                 hass.async_create_background_task(
                     findMedia(hass, device, entry),
@@ -2308,7 +3243,60 @@ async def scheduleAll(hass, device, entry, mediaSync):
                     LOGGER.info(device["name"] + ": " + str(err))
 
 
-async def check_functionality(entry, hass, cls, check_function):
+async def setupCapabilityCache(hass):
+    storage = Store(hass, version=1, key=DOMAIN_CAPABILITIES)
+    storedData = await storage.async_load()
+    hass.data[DOMAIN_CAPABILITIES] = {
+        "storage": storage,
+        # mac_swversion -> pytapo getter -> supported
+        "devices": storedData["devices"] if storedData else {},
+    }
+
+
+def getCapabilityCacheKey(entry):
+    deviceInfo = build_device_info(entry["camData"]["basic_info"])
+    return f"{dict(deviceInfo['connections'])['mac']}_{deviceInfo['sw_version']}"
+
+
+def saveCapabilityCache(hass):
+    capabilityCache = hass.data[DOMAIN_CAPABILITIES]
+    capabilityCache["storage"].async_delay_save(
+        lambda: {"devices": capabilityCache["devices"]}, CAPABILITY_CACHE_SAVE_DELAY
+    )
+
+
+def dropCachedCapabilities(hass, entry, keepCurrent=True):
+    capabilityCache = hass.data[DOMAIN_CAPABILITIES]
+    cacheKey = getCapabilityCacheKey(entry)
+    mac = cacheKey.split("_", 1)[0]
+    for key in list(capabilityCache["devices"]):
+        if key.split("_", 1)[0] == mac and not (keepCurrent and key == cacheKey):
+            capabilityCache["devices"].pop(key)
+            saveCapabilityCache(hass)
+
+
+def loadCachedCapabilities(hass, entry):
+    # Capabilities only change with firmware, entries stored for other firmware
+    # versions of the same device are dropped.
+    dropCachedCapabilities(hass, entry)
+    entry["capabilities"].update(
+        hass.data[DOMAIN_CAPABILITIES]["devices"].get(getCapabilityCacheKey(entry), {})
+    )
+
+
+def storeCapability(hass, entry, check_function, supported):
+    capabilityCache = hass.data[DOMAIN_CAPABILITIES]
+    cacheKey = getCapabilityCacheKey(entry)
+    capabilityCache["devices"].setdefault(cacheKey, {})[check_function] = supported
+    saveCapabilityCache(hass)
+
+
+def invalidateCapabilities(hass, entry):
+    dropCachedCapabilities(hass, entry, keepCurrent=False)
+    entry["capabilities"].clear()
+
+
+async def probeCapability(hass, entry, check_function):
     try:
         if check_function == "getAlarm":
             alarm_config = entry.get("camData", {}).get("alarm_config")
@@ -2316,32 +3304,65 @@ async def check_functionality(entry, hass, cls, check_function):
                 isinstance(alarm_config, dict)
                 and alarm_config.get("typeOfAlarm") in ALARM_CONFIG_TYPES
             ):
-                LOGGER.debug(
-                    f"Found parsed alarm config, creating {cls.__name__}"
-                )
-                return True
+                LOGGER.debug(f"Found parsed alarm config for {check_function}")
+                supported = True
+                storeCapability(hass, entry, check_function, supported)
+                return supported
 
         if isCacheSupported(check_function, entry["camData"]["raw"]):
-            LOGGER.debug(
-                f"Found cached capability {check_function}, creating {cls.__name__}"
-            )
-            return True
-        else:
-            if (
-                entry["controller"].isKLAP is False
-            ):  # no uncached entries for klap devices, so no need to check them
-                LOGGER.debug(
-                    f"Capability {check_function} not found, querying again..."
-                )
+            LOGGER.debug(f"Found cached capability {check_function}")
+            supported = True
+        elif (
+            entry["controller"].isKLAP is False
+        ):  # no uncached entries for klap devices, so no need to check them
+            LOGGER.debug(f"Capability {check_function} not found, querying again...")
+            async with get_root_entry_data(hass, entry)["capabilitySemaphore"]:
                 result = await hass.async_add_executor_job(
                     getattr(entry["controller"], check_function)
                 )
-                LOGGER.debug(result)
-                LOGGER.debug(f"Creating {cls.__name__}")
-                return True
+            LOGGER.debug(result)
+            supported = True
+        else:
+            return False
     except Exception as err:
-        LOGGER.info(f"Camera does not support {cls.__name__}: {err}")
-        return False
+        # Only an explicit answer from the device is kept, connection and
+        # authentication problems say nothing about the capability.
+        if not any(marker in str(err) for marker in CAPABILITY_UNSUPPORTED_ERRORS):
+            LOGGER.info(f"Unable to check {check_function}: {err}")
+            entry["capabilities"].pop(check_function, None)
+            return False
+        LOGGER.info(f"Camera does not support {check_function}: {err}")
+        supported = False
+    storeCapability(hass, entry, check_function, supported)
+    return supported
+
+
+async def resolveCapability(hass, entry, check_function):
+    # Every capability is probed once per device, platforms set up at the same
+    # time wait for the same probe. Stored results are plain booleans.
+    capabilities = entry["capabilities"]
+    if check_function not in capabilities:
+        capabilities[check_function] = hass.async_create_task(
+            probeCapability(hass, entry, check_function)
+        )
+    if isinstance(capabilities[check_function], bool):
+        return capabilities[check_function]
+    return await capabilities[check_function]
+
+
+async def resolveCapabilities(hass, entry, check_functions):
+    await asyncio.gather(
+        *[
+            resolveCapability(hass, entry, check_function)
+            for check_function in check_functions
+        ]
+    )
+
+
+async def check_functionality(entry, hass, cls, check_function):
+    if await resolveCapability(hass, entry, check_function):
+        LOGGER.debug(f"Creating {cls.__name__}")
+        return True
     return False
 
 
@@ -0,0 +1,49 @@
+import os
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, LOGGER, MEDIA_THUMB_CACHE_TIME
+from .utils import getColdDirPathForEntry, parseMediaFileName
+
+MEDIA_FOLDERS = {"videos": ".mp4", "thumbs": ".jpg"}
+
+
+class TapoMediaView(HomeAssistantView):
+    """Serves synchronized recordings straight from cold storage."""
+
+    url = f"/api/{DOMAIN}/media/{{entry_id}}/{{folder}}/{{fileName}}"
+    name = f"api:{DOMAIN}:media"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+
+    async def get(
+        self, request: web.Request, entry_id: str, folder: str, fileName: str
+    ) -> web.StreamResponse:
+        if (
+            entry_id not in self.hass.data.get(DOMAIN, {})
+            or folder not in MEDIA_FOLDERS
+            or os.path.basename(fileName) != fileName
+            or not fileName.endswith(MEDIA_FOLDERS[folder])
+            or parseMediaFileName(fileName)["endDate"] is None
+        ):
+            raise web.HTTPNotFound
+
+        filePath = os.path.join(
+            getColdDirPathForEntry(self.hass, entry_id), folder, fileName
+        )
+        if not await self.hass.async_add_executor_job(os.path.isfile, filePath):
+            LOGGER.debug("[TapoMediaView] File not found: " + filePath)
+            raise web.HTTPNotFound
+
+        # FileResponse handles Range requests and uses sendfile where available.
+        # Thumbnails are named after the recording and never change.
+        if folder == "thumbs":
+            return web.FileResponse(
+                filePath,
+                headers={"Cache-Control": f"private, max-age={MEDIA_THUMB_CACHE_TIME}"},
+            )
+        return web.FileResponse(filePath)